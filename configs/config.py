@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 from dotenv import load_dotenv
 import os
@@ -7,8 +9,84 @@ load_dotenv()
 class Settings(BaseModel):
     DATABASE_URL: str
     TZ: str = "Asia/Seoul"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # 이 시간(초)보다 오래된 연결은 다음 체크아웃 때 다시 연결, -1 이면 끔
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # 체크아웃마다 SELECT 1 로 끊긴 연결을 걸러낸다 (끄면 recycle 에만 의존)
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    AVAILABILITY_CACHE_TTL_SECONDS: int = 30
+    AVAILABILITY_CACHE_MAX_ENTRIES: int = 10000
+    ADMISSION_QUEUE_DEPTH: int = 32
+    ADMISSION_TIMEOUT_SECONDS: float = 3.0
+    # 이 프로세스에서 잡힌 시간대를 DB 확인 없이 409 로 거절하는 시간 (다른 워커의 취소는 이 시간이 지나야 반영)
+    SLOT_ADMISSION_CLAIM_TTL_SECONDS: float = 30.0
+    READ_CACHE_MAX_AGE_SECONDS: int = 60
+    ADMIN_API_KEY: str | None = None
+    BULK_IMPORT_BATCH_SIZE: int = 1000
+    IMAGE_DIR: str = "media/rooms"
+    IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+    IMAGE_WORKERS: int = 2
+    PASSWORD_HASH_CONCURRENCY: int = 4
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_TARGET_MS: float = 250.0
+    PROVISION_HASH_WORKERS: int = 4
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_STATELESS: bool = False
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+    # false 면 로그인 제한/백오프/동시 bcrypt 상한을 모두 끈다 (부하 테스트에서 bcrypt 자체를 잴 때)
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_BURST: int = 5
+    LOGIN_REFILL_PER_MINUTE: float = 10
+    LOGIN_IP_BURST: int = 50
+    LOGIN_IP_REFILL_PER_MINUTE: float = 120
+    LOGIN_BACKOFF_AFTER: int = 3
+    LOGIN_BACKOFF_BASE_SECONDS: float = 1.0
+    LOGIN_BACKOFF_MAX_SECONDS: float = 300.0
+    LOGIN_MAX_CONCURRENT_VERIFY: int = 8
+    LOGIN_THROTTLE_MAX_KEYS: int = 100000
 
 settings = Settings(
     DATABASE_URL=os.environ["DATABASE_URL"],
     TZ=os.environ.get("TZ", "Asia/Seoul"),
+    DB_POOL_SIZE=int(os.environ.get("DB_POOL_SIZE", "5")),
+    DB_MAX_OVERFLOW=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+    DB_POOL_TIMEOUT_SECONDS=float(os.environ.get("DB_POOL_TIMEOUT_SECONDS", "30")),
+    DB_POOL_RECYCLE_SECONDS=int(os.environ.get("DB_POOL_RECYCLE_SECONDS", "1800")),
+    DB_POOL_PRE_PING=os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+    DB_ECHO=os.environ.get("DB_ECHO", "false").lower() in ("1", "true", "yes"),
+    AVAILABILITY_CACHE_TTL_SECONDS=int(os.environ.get("AVAILABILITY_CACHE_TTL_SECONDS", "30")),
+    AVAILABILITY_CACHE_MAX_ENTRIES=int(os.environ.get("AVAILABILITY_CACHE_MAX_ENTRIES", "10000")),
+    ADMISSION_QUEUE_DEPTH=int(os.environ.get("ADMISSION_QUEUE_DEPTH", "32")),
+    ADMISSION_TIMEOUT_SECONDS=float(os.environ.get("ADMISSION_TIMEOUT_SECONDS", "3.0")),
+    SLOT_ADMISSION_CLAIM_TTL_SECONDS=float(os.environ.get("SLOT_ADMISSION_CLAIM_TTL_SECONDS", "30")),
+    READ_CACHE_MAX_AGE_SECONDS=int(os.environ.get("READ_CACHE_MAX_AGE_SECONDS", "60")),
+    ADMIN_API_KEY=os.environ.get("ADMIN_API_KEY") or None,
+    BULK_IMPORT_BATCH_SIZE=int(os.environ.get("BULK_IMPORT_BATCH_SIZE", "1000")),
+    IMAGE_DIR=os.environ.get("IMAGE_DIR", "media/rooms"),
+    IMAGE_MAX_BYTES=int(os.environ.get("IMAGE_MAX_BYTES", str(10 * 1024 * 1024))),
+    IMAGE_WORKERS=int(os.environ.get("IMAGE_WORKERS", "2")),
+    PASSWORD_HASH_CONCURRENCY=int(os.environ.get("PASSWORD_HASH_CONCURRENCY", str(min(4, os.cpu_count() or 1)))),
+    PASSWORD_HASH_EXECUTOR=os.environ.get("PASSWORD_HASH_EXECUTOR", "thread"),
+    BCRYPT_ROUNDS=int(os.environ.get("BCRYPT_ROUNDS", "12")),
+    BCRYPT_TARGET_MS=float(os.environ.get("BCRYPT_TARGET_MS", "250")),
+    PROVISION_HASH_WORKERS=int(os.environ.get("PROVISION_HASH_WORKERS", str(os.cpu_count() or 1))),
+    PRINCIPAL_CACHE_TTL_SECONDS=int(os.environ.get("PRINCIPAL_CACHE_TTL_SECONDS", "60")),
+    PRINCIPAL_CACHE_MAX_ENTRIES=int(os.environ.get("PRINCIPAL_CACHE_MAX_ENTRIES", "10000")),
+    AUTH_STATELESS=os.environ.get("AUTH_STATELESS", "false").lower() in ("1", "true", "yes"),
+    JWT_CACHE_MAX_ENTRIES=int(os.environ.get("JWT_CACHE_MAX_ENTRIES", "10000")),
+    LOGIN_THROTTLE_ENABLED=os.environ.get("LOGIN_THROTTLE_ENABLED", "true").lower() in ("1", "true", "yes"),
+    LOGIN_BURST=int(os.environ.get("LOGIN_BURST", "5")),
+    LOGIN_REFILL_PER_MINUTE=float(os.environ.get("LOGIN_REFILL_PER_MINUTE", "10")),
+    LOGIN_IP_BURST=int(os.environ.get("LOGIN_IP_BURST", "50")),
+    LOGIN_IP_REFILL_PER_MINUTE=float(os.environ.get("LOGIN_IP_REFILL_PER_MINUTE", "120")),
+    LOGIN_BACKOFF_AFTER=int(os.environ.get("LOGIN_BACKOFF_AFTER", "3")),
+    LOGIN_BACKOFF_BASE_SECONDS=float(os.environ.get("LOGIN_BACKOFF_BASE_SECONDS", "1.0")),
+    LOGIN_BACKOFF_MAX_SECONDS=float(os.environ.get("LOGIN_BACKOFF_MAX_SECONDS", "300.0")),
+    LOGIN_MAX_CONCURRENT_VERIFY=int(os.environ.get("LOGIN_MAX_CONCURRENT_VERIFY", "8")),
+    LOGIN_THROTTLE_MAX_KEYS=int(os.environ.get("LOGIN_THROTTLE_MAX_KEYS", "100000")),
 )
@@ -0,0 +1,101 @@
+# /configs/db_pool.py
+import bisect
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 커넥션 대기 시간 히스토그램 버킷 상한 (ms), 마지막은 그 이상 전부
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 계측값.
+    체크아웃/체크인/연결/무효화는 SQLAlchemy 풀 이벤트로, 대기 시간과 타임아웃은 InstrumentedQueuePool 에서 센다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, ms)] += 1
+        self.wait_total_ms += ms
+        self.wait_max_ms = max(self.wait_max_ms, ms)
+
+    def snapshot(self, engine: AsyncEngine) -> dict:
+        pool = engine.sync_engine.pool
+        waits = sum(self.wait_buckets)
+        labels = [f"le_{b}ms" for b in WAIT_BUCKETS_MS] + [f"gt_{WAIT_BUCKETS_MS[-1]}ms"]
+        return {
+            "pool": pool.__class__.__name__,
+            "size": pool.size(),
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "timeout_seconds": pool.timeout(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # 음수면 아직 pool_size 만큼 연결을 만들지 않은 상태
+            "overflow": pool.overflow(),
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "checkout_timeouts": self.timeouts,
+            "wait_ms": {
+                "count": waits,
+                "avg": round(self.wait_total_ms / waits, 3) if waits else 0.0,
+                "max": round(self.wait_max_ms, 3),
+                "histogram": dict(zip(labels, self.wait_buckets)),
+            },
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 걸린 시간(풀 대기 + 새 연결)과 체크아웃 타임아웃을 기록한다."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            pool_metrics.observe_wait(time.perf_counter() - started)
+
+
+def instrument(engine: AsyncEngine) -> None:
+    # 엔진 단위로 걸어 두면 dispose() 로 풀이 다시 만들어져도 유지된다
+    target = engine.sync_engine
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_metrics.connects += 1
+
+    @event.listens_for(target, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_metrics.checkouts += 1
+
+    @event.listens_for(target, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_metrics.checkins += 1
+
+    @event.listens_for(target, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.invalidations += 1
@@ -0,0 +1,42 @@
+# /configs/schema.py
+"""
+create_all 은 없는 테이블만 만들고, 이미 있는 테이블에는 제약/인덱스를 추가하지 않는다.
+앱이 정합성을 DB 제약에 맡기는 부분은 제약이 없으면 조용히 깨지므로, 시작할 때 있는지 확인한다.
+기존 DB 는 python -m scripts.migrate_schema 로 맞춘다.
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from models.reservation import ROOM_OVERLAP_CONSTRAINT, STUDENT_OVERLAP_CONSTRAINT
+from models.review import REVIEW_UNIQUE_CONSTRAINT
+
+# (테이블, 제약 이름)
+REQUIRED_CONSTRAINTS = (
+    # 예약 생성은 중복 SELECT 없이 이 EXCLUDE 제약 위반으로 중복 예약을 막는다
+    ("reservation", ROOM_OVERLAP_CONSTRAINT),
+    ("reservation", STUDENT_OVERLAP_CONSTRAINT),
+    # 리뷰 작성의 INSERT ... ON CONFLICT 대상. 없으면 모든 리뷰 INSERT 가 실패한다
+    ("review", REVIEW_UNIQUE_CONSTRAINT),
+)
+
+
+async def find_missing_constraints(conn: AsyncConnection) -> list[str]:
+    res = await conn.execute(
+        text(
+            "SELECT c.relname, k.conname FROM pg_constraint k "
+            "JOIN pg_class c ON c.oid = k.conrelid "
+            "WHERE k.conname = ANY(:names)"
+        ),
+        {"names": [name for _, name in REQUIRED_CONSTRAINTS]},
+    )
+    present = {(table, name) for table, name in res.all()}
+    return [f"{table}.{name}" for table, name in REQUIRED_CONSTRAINTS if (table, name) not in present]
+
+
+async def verify_schema(conn: AsyncConnection) -> None:
+    missing = await find_missing_constraints(conn)
+    if missing:
+        raise RuntimeError(
+            f"DB 스키마에 필요한 제약이 없습니다: {', '.join(missing)}. "
+            "python -m scripts.migrate_schema 를 먼저 실행하세요."
+        )
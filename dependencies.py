@@ -1,15 +1,31 @@
-from fastapi import Depends
-from fastapi.security import OAuth2PasswordBearer
+import hmac
+
+from fastapi import Depends, HTTPException
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from configs.config import settings
 from configs.db import get_db
 from services.auth_service import auth_service
-from models.student import Student
+from services.principal_cache import Principal
 
 # Authorization 헤더에서 Bearer 토큰을 자동으로 추출한다.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+# 관리자 API 는 X-Admin-Key 헤더로 ADMIN_API_KEY 를 확인한다.
+admin_key_header = APIKeyHeader(name="X-Admin-Key", auto_error=False)
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession  = Depends(get_db),
-) -> Student:
-    return await auth_service.get_current_user(db, token)
\ No newline at end of file
+) -> Principal:
+    # DB 세션은 캐시 미스일 때만 실제 커넥션을 잡는다
+    return await auth_service.get_current_user(db, token)
+
+
+async def require_admin(admin_key: str | None = Depends(admin_key_header)) -> None:
+    # 키가 설정되지 않았으면 관리자 API 는 항상 막힌다.
+    if (
+        not settings.ADMIN_API_KEY
+        or not admin_key
+        or not hmac.compare_digest(admin_key.encode("utf-8"), settings.ADMIN_API_KEY.encode("utf-8"))
+    ):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
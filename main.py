@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 # DB 연결 설정 부분
 from configs.db import ping_db, Base, engine
+from configs.db_pool import pool_metrics
+from configs.schema import verify_schema
 from contextlib import asynccontextmanager
 
 from routers.student_router import router as student_router
@@ -9,6 +11,15 @@ from routers.facility_router import router as facility_router
 from routers.study_room_router import router as study_room_router
 from routers.reservation_router import router as reservation_router
 from routers.review_router import router as review_router
+from routers.search_router import router as search_router
+from routers.admin_router import router as admin_router
+from routers.media_router import router as media_router
+from services.image_service import image_service
+from services.password_hasher import password_hasher
+from services.principal_cache import principal_cache
+from services.token_cache import verified_token_cache
+from services.login_throttle import login_throttle
+from services.student_provisioning_service import student_provisioning_service
 
 import models
 
@@ -18,7 +29,14 @@ async def lifespan(app: FastAPI):
     # 비동기 엔진에서 동기 메서드(create_all)를 실행하는 방법
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # 기존 테이블에는 create_all 이 제약을 추가하지 않으므로, 없으면 시작하지 않는다
+        await verify_schema(conn)
+    # 썸네일 생성 워커 (프로세스 풀)
+    await image_service.start()
     yield
+    await image_service.stop()
+    password_hasher.shutdown()
+    student_provisioning_service.shutdown()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -28,9 +46,36 @@ app.include_router(facility_router)
 app.include_router(study_room_router)
 app.include_router(reservation_router)
 app.include_router(review_router)
+app.include_router(search_router)
+app.include_router(admin_router)
+app.include_router(media_router)
 
 @app.get("/health/db")
 async def health_db():
     ok = await ping_db()
     return {"ok": ok}
 
+@app.get("/health/db-pool")
+async def health_db_pool():
+    # 커넥션 풀 사용량/대기 시간 히스토그램/체크아웃 타임아웃
+    return pool_metrics.snapshot(engine)
+
+@app.get("/health/password-hasher")
+async def health_password_hasher():
+    # bcrypt executor 큐 길이/지연
+    return password_hasher.snapshot()
+
+@app.get("/health/principal-cache")
+async def health_principal_cache():
+    # get_current_user 인증 캐시 적중/미스
+    return principal_cache.snapshot()
+
+@app.get("/health/jwt-cache")
+async def health_jwt_cache():
+    # 검증된 JWT 클레임 캐시 적중/만료/축출
+    return verified_token_cache.snapshot()
+
+@app.get("/health/login-throttle")
+async def health_login_throttle():
+    # 로그인 제한/백오프/동시 검증 초과 거절 수와 아낀 bcrypt CPU 추정치
+    return login_throttle.snapshot()
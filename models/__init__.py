@@ -4,8 +4,9 @@ from .study_room import StudyRoom
 from .reservation import Reservation
 from .reservation_disable import ReservationDisable
 from .review import Review
+from .study_room_rating import StudyRoomRating
 
 from configs.db import Base
 
-__all__ = ["Base", "Student", "Facility", "StudyRoom", "Reservation", "ReservationDisable", "Review"]
+__all__ = ["Base", "Student", "Facility", "StudyRoom", "Reservation", "ReservationDisable", "Review", "StudyRoomRating"]
 
@@ -1,15 +1,20 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import BigInteger, Boolean, String, func
+from sqlalchemy import BigInteger, Boolean, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 
 from configs.db import Base
+from models.search import trgm_index, ts_vector
 
 if TYPE_CHECKING:
     from models.study_room import StudyRoom 
 
 class Facility(Base):
     __tablename__ = "facility"
+    __table_args__ = (
+        trgm_index("ix_facility_name_trgm", "facility_name"),
+        trgm_index("ix_facility_address_trgm", "facility_address"),
+    )
 
     facility_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -44,4 +49,12 @@ class Facility(Base):
         "StudyRoom", 
         back_populates="facility_item", 
         lazy="selectin"
-    )
\ No newline at end of file
+    )
+
+
+# /api/search 전문 검색용
+Index(
+    "ix_facility_search_tsv",
+    ts_vector(Facility.facility_name, Facility.facility_address),
+    postgresql_using="gin",
+)
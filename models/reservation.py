@@ -5,10 +5,15 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
+    DDL,
+    event,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from configs.db import Base
@@ -18,8 +23,45 @@ if TYPE_CHECKING:
     from models.study_room import StudyRoom
     from models.facility import Facility
 
+# 예약완료 상태끼리 시간이 겹치지 않도록 DB에서 보장하는 제약 이름
+ROOM_OVERLAP_CONSTRAINT = "ex_reservation_room_overlap"
+STUDENT_OVERLAP_CONSTRAINT = "ex_reservation_student_overlap"
+
 class Reservation(Base):
     __tablename__ = "reservation"
+    __table_args__ = (
+        ExcludeConstraint(
+            ("room_id", "="),
+            (text("tsrange(reservation_start_date, reservation_end_date)"), "&&"),
+            name=ROOM_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("reservation_status = '예약완료'"),
+        ),
+        ExcludeConstraint(
+            ("student_id", "="),
+            (text("tsrange(reservation_start_date, reservation_end_date)"), "&&"),
+            name=STUDENT_OVERLAP_CONSTRAINT,
+            using="gist",
+            where=text("reservation_status = '예약완료'"),
+        ),
+        # 방 중복/가용시간 조회: room_id + 날짜, 예약완료만, 시작/종료는 인덱스에서 바로 읽음
+        Index(
+            "ix_reservation_room_date_active",
+            "room_id",
+            "reservation_date",
+            postgresql_include=["reservation_start_date", "reservation_end_date"],
+            postgresql_where=text("reservation_status = '예약완료'"),
+        ),
+        # 내 예약 목록: (날짜, 시작시간, id) 역순 keyset 페이지
+        # 사용자 시간 중복은 ex_reservation_student_overlap(gist)이, 하루 한도 합산은 이 인덱스의 (student_id, 날짜) 앞부분이 받는다
+        Index(
+            "ix_reservation_student_list",
+            "student_id",
+            "reservation_date",
+            "reservation_start_date",
+            "reservation_id",
+        ),
+    )
 
     reservation_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -66,3 +108,11 @@ class Reservation(Base):
     student: Mapped["Student"] = relationship("Student", lazy="selectin")
     room: Mapped["StudyRoom"] = relationship("StudyRoom", lazy="selectin")
     facility: Mapped["Facility"] = relationship("Facility", lazy="selectin")
+
+
+# bigint 컬럼에 "=" 연산자를 gist 인덱스로 쓰려면 btree_gist 확장이 필요하다.
+event.listen(
+    Reservation.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
@@ -1,10 +1,19 @@
-from sqlalchemy import BigInteger, ForeignKey, Text, Date, DateTime
+from sqlalchemy import BigInteger, ForeignKey, Index, Text, Date, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from configs.db import Base
 
 class ReservationDisable(Base):
     __tablename__ = "reservation_disable"
+    __table_args__ = (
+        # 관리자 차단 시간 조회: room_id + 날짜
+        Index(
+            "ix_reservation_disable_room_date",
+            "room_id",
+            "disable_date",
+            postgresql_include=["disable_start_at", "disable_end_at"],
+        ),
+    )
 
     disable_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -1,14 +1,26 @@
-from sqlalchemy import BigInteger, ForeignKey, Integer, String, Date, func
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String, Date, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 from configs.db import Base
+from models.search import trgm_index, ts_vector
 
 if TYPE_CHECKING:
     from models.study_room import StudyRoom
     from models.student import Student
 
+# 학생당 방별 리뷰 1건을 DB에서 보장하는 제약 이름
+REVIEW_UNIQUE_CONSTRAINT = "uq_review_room_student"
+
 class Review(Base):
     __tablename__ = "review"
+    __table_args__ = (
+        # 학생당 방별 리뷰 1건 (INSERT ... ON CONFLICT DO NOTHING 의 충돌 대상)
+        UniqueConstraint("room_id", "student_id", name=REVIEW_UNIQUE_CONSTRAINT),
+        # 방별 리뷰 목록: 최신순 / 별점순 keyset 페이지
+        Index("ix_review_room_id", "room_id", "review_id"),
+        Index("ix_review_room_rating", "room_id", "rating", "review_id"),
+        trgm_index("ix_review_comment_trgm", "comment"),
+    )
 
     review_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -41,4 +53,8 @@ class Review(Base):
     student: Mapped["Student"] = relationship(
         "Student",
         back_populates="review_items",
-    )
\ No newline at end of file
+    )
+
+
+# /api/search 전문 검색용
+Index("ix_review_search_tsv", ts_vector(Review.comment), postgresql_using="gin")
@@ -0,0 +1,31 @@
+from sqlalchemy import DDL, Index, event, func, text
+
+from configs.db import Base
+
+# 한국어 형태소 사전이 없으므로 공백 단위 'simple' 설정을 쓰고,
+# 조사가 붙은 부분 문자열 검색은 pg_trgm 트라이그램 인덱스로 보완한다.
+TS_CONFIG = text("'simple'")
+
+
+def ts_vector(*columns):
+    """
+    컬럼별 tsvector 를 || 로 이어 붙인 식.
+    인덱스 정의와 검색 쿼리가 같은 식을 써야 GIN 인덱스를 탄다.
+    """
+    vectors = [func.to_tsvector(TS_CONFIG, func.coalesce(c, text("''"))) for c in columns]
+    expr = vectors[0]
+    for v in vectors[1:]:
+        expr = expr.op("||")(v)
+    return expr
+
+
+def trgm_index(name: str, column: str) -> Index:
+    # ILIKE '%검색어%' / word_similarity 를 받쳐 주는 트라이그램 GIN 인덱스
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -1,15 +1,21 @@
-from sqlalchemy import BigInteger, Boolean, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from configs.db import Base
+from models.search import trgm_index, ts_vector
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from models.facility import Facility
     from models.review import Review
+    from models.study_room_rating import StudyRoomRating
 
 class StudyRoom(Base):
     __tablename__ = "study_room"
+    __table_args__ = (
+        trgm_index("ix_study_room_name_trgm", "room_name"),
+        trgm_index("ix_study_room_equipment_trgm", "room_equipment"),
+    )
 
     room_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -60,3 +66,37 @@ class StudyRoom(Base):
         back_populates="room",
         cascade="all, delete-orphan",
     )
+
+    # 리뷰 집계 (1:1, 방과 함께 JOIN 으로 로딩)
+    rating_item: Mapped["StudyRoomRating | None"] = relationship(
+        "StudyRoomRating",
+        uselist=False,
+        lazy="joined",
+        passive_deletes=True,
+    )
+
+    @property
+    def review_count(self) -> int:
+        return self.rating_item.review_count if self.rating_item else 0
+
+    @property
+    def average_rating(self) -> float:
+        if not self.rating_item or not self.rating_item.review_count:
+            return 0.0
+        return round(self.rating_item.rating_sum / self.rating_item.review_count, 1)
+
+    @property
+    def rating_histogram(self) -> list[int]:
+        # [1점, 2점, 3점, 4점, 5점] 리뷰 수
+        r = self.rating_item
+        if not r:
+            return [0, 0, 0, 0, 0]
+        return [r.star_1, r.star_2, r.star_3, r.star_4, r.star_5]
+
+
+# /api/search 전문 검색용
+Index(
+    "ix_study_room_search_tsv",
+    ts_vector(StudyRoom.room_name, StudyRoom.room_equipment),
+    postgresql_using="gin",
+)
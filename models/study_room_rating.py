@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+
+from configs.db import Base
+
+class StudyRoomRating(Base):
+    """스터디룸별 리뷰 집계 (리뷰 등록/수정/삭제 시 함께 갱신)"""
+    __tablename__ = "study_room_rating"
+
+    room_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("study_room.room_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    # 별점별 리뷰 수
+    star_1: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    star_2: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    star_3: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    star_4: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    star_5: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
+    # 마지막 집계 변경 시각 (스터디룸 조회 캐시 검증값에 사용)
+    up_date: Mapped[object] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
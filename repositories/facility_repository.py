@@ -1,10 +1,15 @@
 # /repositories/facility_repository.py
 
-from sqlalchemy import select, func
+from datetime import date
+
+from sqlalchemy import extract, insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from models.facility import Facility
+from models.reservation import Reservation
+from models.study_room import StudyRoom
+from models.study_room_rating import StudyRoomRating
 
 
 class FacilityRepository:
@@ -12,6 +17,10 @@ class FacilityRepository:
         db.add(facility)
         return facility
 
+    async def insert_many(self, db: AsyncSession, rows: list[dict]) -> None:
+        # 대량 등록용 다건 INSERT (multi-row VALUES 로 묶여 실행됨)
+        await db.execute(insert(Facility), rows)
+
     async def find_by_id(self, db: AsyncSession, facility_id: int) -> Facility | None:
         # 단순 조회 (관계 로딩 필요 없을 때)
         return await db.get(Facility, facility_id)
@@ -23,7 +32,7 @@ class FacilityRepository:
         stmt = (
             select(Facility)
             .where(Facility.facility_id == facility_id)
-            .options(selectinload(Facility.study_room))
+            .options(selectinload(Facility.study_room_items))
         )
         res = await db.execute(stmt)
         return res.scalar_one_or_none()
@@ -33,6 +42,69 @@ class FacilityRepository:
         res = await db.execute(stmt)
         return res.scalars().all()
 
+    async def find_overview(self, db: AsyncSession, facility_id: int, target_date: date):
+        """
+        시설 + 방 + 방별 리뷰 집계 + target_date 예약 시간(시간 단위)을 한 번에 조회.
+        방마다 한 행 (방이 없으면 room_id 가 NULL 인 한 행), 시설이 없으면 빈 결과.
+        """
+        booked = (
+            select(
+                Reservation.room_id,
+                (
+                    func.sum(extract("epoch", Reservation.reservation_end_date - Reservation.reservation_start_date))
+                    / 3600
+                ).label("booked_hours"),
+            )
+            .where(Reservation.facility_id == facility_id)
+            .where(Reservation.reservation_date == target_date)
+            .where(Reservation.reservation_status == "예약완료")
+            .group_by(Reservation.room_id)
+            .subquery("booked")
+        )
+
+        stmt = (
+            select(
+                Facility.facility_id,
+                Facility.facility_name,
+                Facility.facility_address,
+                Facility.facility_desc,
+                Facility.use_tf.label("facility_use_tf"),
+                StudyRoom.room_id,
+                StudyRoom.room_name,
+                StudyRoom.room_floor,
+                StudyRoom.room_image,
+                StudyRoom.room_capacity,
+                StudyRoom.room_equipment,
+                StudyRoom.use_tf,
+                StudyRoomRating.rating_sum,
+                StudyRoomRating.review_count,
+                StudyRoomRating.star_1,
+                StudyRoomRating.star_2,
+                StudyRoomRating.star_3,
+                StudyRoomRating.star_4,
+                StudyRoomRating.star_5,
+                booked.c.booked_hours,
+            )
+            .select_from(Facility)
+            .outerjoin(StudyRoom, StudyRoom.facility_id == Facility.facility_id)
+            .outerjoin(StudyRoomRating, StudyRoomRating.room_id == StudyRoom.room_id)
+            .outerjoin(booked, booked.c.room_id == StudyRoom.room_id)
+            .where(Facility.facility_id == facility_id)
+            .order_by(StudyRoom.room_id)
+        )
+        res = await db.execute(stmt)
+        return res.all()
+
+    async def find_list_version(self, db: AsyncSession):
+        # 목록 캐시 검증값: (건수, 마지막 수정 시각)
+        stmt = select(func.count(Facility.facility_id), func.max(Facility.up_date))
+        res = await db.execute(stmt)
+        return res.one()
+
+    async def find_up_date(self, db: AsyncSession, facility_id: int):
+        stmt = select(Facility.up_date).where(Facility.facility_id == facility_id)
+        return await db.scalar(stmt)
+
     async def count_all(self, db: AsyncSession) -> int:
         stmt = select(func.count()).select_from(Facility)
         total = await db.scalar(stmt)
@@ -42,5 +42,19 @@ class ReservationDisableRepository:
         res = await db.execute(stmt)
         return res.scalars().all()
 
+    async def find_ranges_by_room_and_date(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        disable_date: date,
+    ) -> list[tuple[datetime, datetime]]:
+        stmt = (
+            select(ReservationDisable.disable_start_at, ReservationDisable.disable_end_at)
+            .where(ReservationDisable.room_id == room_id)
+            .where(ReservationDisable.disable_date == disable_date)
+        )
+        res = await db.execute(stmt)
+        return [tuple(row) for row in res.all()]
+
 
 reservation_disable_repository = ReservationDisableRepository()
\ No newline at end of file
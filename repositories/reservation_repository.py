@@ -1,10 +1,48 @@
 from datetime import date, datetime
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    String,
+    Row,
+    case,
+    cast,
+    column,
+    exists,
+    extract,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator
 from sqlalchemy.orm import selectinload
 
+from models.facility import Facility
+from models.student import Student
+from models.study_room import StudyRoom
 from models.reservation import Reservation
+from models.reservation_disable import ReservationDisable
+
+
+def _hour_mask(day_col, start_col, end_col):
+    """[start, end) 구간이 걸치는 시간대를 24비트 정수로 (bit i = i시~i+1시)"""
+    day_start = cast(day_col, DateTime)
+    first = cast(func.greatest(func.floor(extract("epoch", start_col - day_start) / 3600), 0), Integer)
+    last = cast(func.least(func.ceil(extract("epoch", end_col - day_start) / 3600), 24), Integer)
+    one = literal(1, Integer)
+    # 2^last - 2^first == first ~ last-1 번째 비트가 모두 켜진 값
+    return case(
+        (last > first, one.op("<<")(last) - one.op("<<")(first)),
+        else_=0,
+    )
 
 
 class ReservationRepository:
@@ -56,6 +94,110 @@ class ReservationRepository:
         res = await db.execute(stmt)
         return res.scalars().all()
 
+    def _compact_select(self):
+        # 목록/상세 compact 보기: ID와 표시용 이름 컬럼만 조회
+        return (
+            select(
+                Reservation.reservation_id,
+                Reservation.student_id,
+                Student.student_name,
+                Reservation.room_id,
+                StudyRoom.room_name,
+                Reservation.facility_id,
+                Facility.facility_name,
+                Reservation.reservation_status,
+                Reservation.reservation_date,
+                Reservation.reservation_start_date,
+                Reservation.reservation_end_date,
+                Reservation.reservation_count,
+            )
+            .select_from(Reservation)
+            .join(Student, Student.student_id == Reservation.student_id)
+            .join(StudyRoom, StudyRoom.room_id == Reservation.room_id)
+            .join(Facility, Facility.facility_id == Reservation.facility_id)
+        )
+
+    def _student_list_stmt(self, student_id: int, status_filter: str, now: datetime, compact: bool = False):
+        # status_filter: all / upcoming / past / cancelled
+        if compact:
+            stmt = self._compact_select()
+        else:
+            stmt = select(Reservation).options(
+                selectinload(Reservation.student),
+                selectinload(Reservation.room),
+                selectinload(Reservation.facility),
+            )
+        stmt = stmt.where(Reservation.student_id == student_id)
+        if status_filter == "upcoming":
+            stmt = stmt.where(Reservation.reservation_status == "예약완료").where(Reservation.reservation_end_date > now)
+        elif status_filter == "past":
+            stmt = stmt.where(Reservation.reservation_status == "예약완료").where(Reservation.reservation_end_date <= now)
+        elif status_filter == "cancelled":
+            stmt = stmt.where(Reservation.reservation_status == "취소")
+        return stmt.order_by(
+            Reservation.reservation_date.desc(),
+            Reservation.reservation_start_date.desc(),
+            Reservation.reservation_id.desc(),
+        )
+
+    async def find_page_by_student_id(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        status_filter: str,
+        now: datetime,
+        cursor: tuple[date, datetime, int] | None,
+        limit: int,
+        compact: bool = False,
+    ) -> list:
+        """
+        (reservation_date, reservation_start_date, reservation_id) 역순 keyset 페이지.
+        다음 페이지 존재 여부 판단을 위해 limit + 1 건까지 조회한다.
+        compact=True 면 엔티티 대신 _compact_select 컬럼 Row를 돌려준다.
+        """
+        stmt = self._student_list_stmt(student_id, status_filter, now, compact)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(
+                    Reservation.reservation_date,
+                    Reservation.reservation_start_date,
+                    Reservation.reservation_id,
+                )
+                < tuple_(*cursor)
+            )
+        res = await db.execute(stmt.limit(limit + 1))
+        return res.all() if compact else res.scalars().all()
+
+    async def stream_by_student_id(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        status_filter: str,
+        now: datetime,
+        compact: bool = False,
+        batch_size: int = 200,
+    ) -> AsyncIterator:
+        # 내보내기용: 전체를 메모리에 올리지 않고 batch_size 단위로 읽는다.
+        stmt = self._student_list_stmt(student_id, status_filter, now, compact).execution_options(yield_per=batch_size)
+        res = await (db.stream(stmt) if compact else db.stream_scalars(stmt))
+        async for row in res:
+            yield row
+
+    async def find_compact_by_id(self, db: AsyncSession, reservation_id: int) -> Row | None:
+        stmt = self._compact_select().where(Reservation.reservation_id == reservation_id)
+        res = await db.execute(stmt)
+        return res.one_or_none()
+
+    async def count_by_student_id(self, db: AsyncSession, student_id: int, status_filter: str, now: datetime) -> int:
+        stmt = select(func.count()).select_from(
+            self._student_list_stmt(student_id, status_filter, now)
+            .with_only_columns(Reservation.reservation_id)
+            .order_by(None)
+            .subquery()
+        )
+        total = await db.scalar(stmt)
+        return int(total or 0)
+
     async def count_by_user_and_date(self, db: AsyncSession, user_id: int, reservation_date: date) -> int:
         stmt = (
             select(func.count())
@@ -121,6 +263,248 @@ class ReservationRepository:
         res = await db.execute(stmt)
         return res.scalar_one_or_none()
 
+    async def find_booked_ranges_by_room_and_date(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        reservation_date: date,
+    ) -> list[tuple[datetime, datetime]]:
+        # 가용 시간 비트맵 계산용: 엔티티 대신 시작/종료 컬럼만 조회
+        stmt = (
+            select(Reservation.reservation_start_date, Reservation.reservation_end_date)
+            .where(Reservation.room_id == room_id)
+            .where(Reservation.reservation_date == reservation_date)
+            .where(Reservation.reservation_status == "예약완료")
+        )
+        res = await db.execute(stmt)
+        return [tuple(row) for row in res.all()]
+
+    async def create_if_admitted(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        room_id: int,
+        facility_id: int,
+        reservation_date: date,
+        start_dt: datetime,
+        end_dt: datetime,
+        reservation_count: int,
+        use_tf: bool,
+    ) -> Row:
+        """
+        예약 가능 여부 검증(방/시설, 하루 한도, 관리자 차단)과 저장을
+        하나의 statement(WITH ... INSERT ... SELECT ... RETURNING)로 처리한다.
+        모든 검증을 통과했을 때만 INSERT 되며, 검증 결과 컬럼은 항상 함께 반환된다.
+        사용자/방 시간 중복은 Reservation의 EXCLUDE 제약이 막으며 IntegrityError로 올라온다.
+        """
+        checks = select(
+            select(StudyRoom.facility_id)
+            .where(StudyRoom.room_id == room_id)
+            .scalar_subquery()
+            .label("room_facility_id"),
+            exists()
+            .where(Facility.facility_id == facility_id)
+            .label("facility_exists"),
+            select(func.coalesce(func.sum(Reservation.reservation_count), 0))
+            .where(Reservation.student_id == student_id)
+            .where(Reservation.reservation_date == reservation_date)
+            .where(Reservation.reservation_status == "예약완료")
+            .scalar_subquery()
+            .label("used_count"),
+            exists()
+            .where(ReservationDisable.room_id == room_id)
+            .where(ReservationDisable.disable_date == reservation_date)
+            .where(
+                ReservationDisable.disable_start_at < end_dt,
+                ReservationDisable.disable_end_at > start_dt,
+            )
+            .label("blocked"),
+        ).cte("admission")
+
+        admitted = (
+            insert(Reservation)
+            .from_select(
+                [
+                    "student_id",
+                    "room_id",
+                    "facility_id",
+                    "reservation_status",
+                    "reservation_date",
+                    "reservation_start_date",
+                    "reservation_end_date",
+                    "reservation_count",
+                    "use_tf",
+                ],
+                select(
+                    literal(student_id, BigInteger),
+                    literal(room_id, BigInteger),
+                    literal(facility_id, BigInteger),
+                    literal("예약완료", String),
+                    literal(reservation_date, Date),
+                    literal(start_dt, DateTime),
+                    literal(end_dt, DateTime),
+                    literal(reservation_count, Integer),
+                    literal(use_tf, Boolean),
+                )
+                .select_from(checks)
+                .where(checks.c.room_facility_id == facility_id)
+                .where(checks.c.facility_exists)
+                .where(checks.c.used_count + reservation_count <= 2)
+                .where(~checks.c.blocked),
+            )
+            .returning(Reservation.reservation_id)
+            .cte("admitted")
+        )
+
+        stmt = select(
+            checks,
+            select(admitted.c.reservation_id).scalar_subquery().label("reservation_id"),
+        )
+        res = await db.execute(stmt)
+        return res.one()
+
+    async def find_facility_masks(
+        self,
+        db: AsyncSession,
+        facility_id: int,
+        from_date: date,
+        to_date: date,
+    ) -> list[Row]:
+        """
+        시설의 모든 방 x 날짜별 예약/차단 시간 비트맵을 한 번의 집계 쿼리로 조회한다.
+        반환 행: (room_id, room_name, day, reserved_mask, blocked_mask)
+        예약/차단이 하나도 없는 방은 day가 NULL인 한 행으로 나온다.
+        """
+        booked = (
+            select(
+                Reservation.room_id.label("room_id"),
+                Reservation.reservation_date.label("day"),
+                _hour_mask(
+                    Reservation.reservation_date,
+                    Reservation.reservation_start_date,
+                    Reservation.reservation_end_date,
+                ).label("reserved"),
+                literal(0, Integer).label("blocked"),
+            )
+            .where(Reservation.facility_id == facility_id)
+            .where(Reservation.reservation_date.between(from_date, to_date))
+            .where(Reservation.reservation_status == "예약완료")
+        )
+        blocked = (
+            select(
+                ReservationDisable.room_id.label("room_id"),
+                ReservationDisable.disable_date.label("day"),
+                literal(0, Integer).label("reserved"),
+                _hour_mask(
+                    ReservationDisable.disable_date,
+                    ReservationDisable.disable_start_at,
+                    ReservationDisable.disable_end_at,
+                ).label("blocked"),
+            )
+            .where(ReservationDisable.facility_id == facility_id)
+            .where(ReservationDisable.disable_date.between(from_date, to_date))
+        )
+        slots = union_all(booked, blocked).subquery("slots")
+        masks = (
+            select(
+                slots.c.room_id,
+                slots.c.day,
+                func.bit_or(slots.c.reserved).label("reserved_mask"),
+                func.bit_or(slots.c.blocked).label("blocked_mask"),
+            )
+            .group_by(slots.c.room_id, slots.c.day)
+            .subquery("masks")
+        )
+        stmt = (
+            select(
+                StudyRoom.room_id,
+                StudyRoom.room_name,
+                masks.c.day,
+                masks.c.reserved_mask,
+                masks.c.blocked_mask,
+            )
+            .outerjoin(masks, masks.c.room_id == StudyRoom.room_id)
+            .where(StudyRoom.facility_id == facility_id)
+            .order_by(StudyRoom.room_id, masks.c.day)
+        )
+        res = await db.execute(stmt)
+        return res.all()
+
+    async def find_batch_admission(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        items: list[tuple[int, int, int, date, datetime, datetime]],
+    ) -> list[Row]:
+        """
+        일괄 예약 후보 (idx, room_id, facility_id, reservation_date, start, end)를 VALUES로 넘기고
+        후보별 방/시설/한도/중복/차단 검증 결과를 한 번의 조회로 가져온다.
+        """
+        req = values(
+            column("idx", Integer),
+            column("room_id", BigInteger),
+            column("facility_id", BigInteger),
+            column("reservation_date", Date),
+            column("start_at", DateTime),
+            column("end_at", DateTime),
+            name="req",
+        ).data(items)
+
+        stmt = (
+            select(
+                req.c.idx,
+                select(StudyRoom.facility_id)
+                .where(StudyRoom.room_id == req.c.room_id)
+                .scalar_subquery()
+                .label("room_facility_id"),
+                exists()
+                .where(Facility.facility_id == req.c.facility_id)
+                .label("facility_exists"),
+                select(func.coalesce(func.sum(Reservation.reservation_count), 0))
+                .where(Reservation.student_id == student_id)
+                .where(Reservation.reservation_date == req.c.reservation_date)
+                .where(Reservation.reservation_status == "예약완료")
+                .scalar_subquery()
+                .label("used_count"),
+                exists()
+                .where(Reservation.student_id == student_id)
+                .where(Reservation.reservation_date == req.c.reservation_date)
+                .where(Reservation.reservation_status == "예약완료")
+                .where(
+                    Reservation.reservation_start_date < req.c.end_at,
+                    Reservation.reservation_end_date > req.c.start_at,
+                )
+                .label("user_overlap"),
+                exists()
+                .where(Reservation.room_id == req.c.room_id)
+                .where(Reservation.reservation_date == req.c.reservation_date)
+                .where(Reservation.reservation_status == "예약완료")
+                .where(
+                    Reservation.reservation_start_date < req.c.end_at,
+                    Reservation.reservation_end_date > req.c.start_at,
+                )
+                .label("room_overlap"),
+                exists()
+                .where(ReservationDisable.room_id == req.c.room_id)
+                .where(ReservationDisable.disable_date == req.c.reservation_date)
+                .where(
+                    ReservationDisable.disable_start_at < req.c.end_at,
+                    ReservationDisable.disable_end_at > req.c.start_at,
+                )
+                .label("blocked"),
+            )
+            .select_from(req)
+            .order_by(req.c.idx)
+        )
+        res = await db.execute(stmt)
+        return res.all()
+
+    async def insert_many(self, db: AsyncSession, rows: list[dict]) -> list[int]:
+        # 다건 INSERT ... RETURNING, 반환 순서는 rows 순서와 동일
+        stmt = insert(Reservation).returning(Reservation.reservation_id, sort_by_parameter_order=True)
+        res = await db.execute(stmt, rows)
+        return list(res.scalars().all())
+
     async def find_disable(
         self,
         db: AsyncSession,
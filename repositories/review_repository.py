@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from sqlalchemy import select, func
+from sqlalchemy import BigInteger, Integer, String, exists, literal, select, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from models.review import Review
+from models.review import REVIEW_UNIQUE_CONSTRAINT, Review
+from models.study_room import StudyRoom
 
 class ReviewRepository:
 
@@ -12,6 +14,41 @@ class ReviewRepository:
         db.add(entity)
         return entity
 
+    async def create_if_absent(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        student_id: int,
+        rating: int,
+        comment: str,
+    ):
+        """
+        방이 있고 (room_id, student_id) 리뷰가 없을 때만 INSERT 하는 한 문장.
+        (room_exists, review_id) 를 돌려준다. 방이 없거나 이미 작성했으면 review_id 는 None.
+        """
+        room_exists = exists().where(StudyRoom.room_id == room_id)
+        inserted = (
+            insert(Review)
+            .from_select(
+                ["room_id", "student_id", "rating", "comment"],
+                select(
+                    literal(room_id, BigInteger),
+                    literal(student_id, BigInteger),
+                    literal(rating, Integer),
+                    literal(comment, String),
+                ).where(room_exists),
+            )
+            .on_conflict_do_nothing(constraint=REVIEW_UNIQUE_CONSTRAINT)
+            .returning(Review.review_id)
+            .cte("inserted")
+        )
+        stmt = select(
+            room_exists.label("room_exists"),
+            select(inserted.c.review_id).scalar_subquery().label("review_id"),
+        )
+        res = await db.execute(stmt)
+        return res.one()
+
     async def find_by_id(self, db: AsyncSession, review_id: int):
         stmt = (
             select(Review)
@@ -53,6 +90,32 @@ class ReviewRepository:
         res = await db.execute(stmt)
         return res.scalars().all()
 
+    async def find_page_by_room_id(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        sort: str,
+        cursor: tuple[int, int] | None,
+        limit: int,
+    ):
+        """
+        방별 리뷰 keyset 페이지. 다음 페이지 판단을 위해 limit + 1 건까지 조회한다.
+        sort=newest: review_id 역순, cursor=(review_id, review_id)
+        sort=rating: (rating, review_id) 역순, cursor=(rating, review_id)
+        """
+        stmt = select(Review).where(Review.room_id == room_id)
+        if sort == "rating":
+            if cursor is not None:
+                stmt = stmt.where(tuple_(Review.rating, Review.review_id) < tuple_(*cursor))
+            stmt = stmt.order_by(Review.rating.desc(), Review.review_id.desc())
+        else:
+            if cursor is not None:
+                stmt = stmt.where(Review.review_id < cursor[1])
+            stmt = stmt.order_by(Review.review_id.desc())
+
+        res = await db.execute(stmt.limit(limit + 1))
+        return res.scalars().all()
+
     async def get_room_rating_summary(self, db: AsyncSession, room_id: int):
         """스터디룸 목록/상세에서 평균별점/리뷰수 붙일 때 사용"""
         stmt = (
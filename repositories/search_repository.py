@@ -0,0 +1,115 @@
+# /repositories/search_repository.py
+
+from sqlalchemy import and_, func, literal_column, null, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.facility import Facility
+from models.review import Review
+from models.search import TS_CONFIG, ts_vector
+from models.study_room import StudyRoom
+
+
+def _like_pattern(q: str) -> str:
+    # LIKE 기본 이스케이프 문자(\)로 검색어 안의 % _ 를 문자 그대로 취급
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class SearchRepository:
+
+    def _hits(self, kind: str, q: str, columns: list, key_cols: tuple, title, snippet):
+        """
+        한 종류(시설/방/리뷰)의 검색 결과 select.
+        매칭: tsvector @@ 검색어  또는  컬럼 ILIKE '%검색어%' (트라이그램 GIN)
+        점수: ts_rank + 컬럼별 word_similarity 최댓값
+        """
+        vector = ts_vector(*columns)
+        query = func.plainto_tsquery(TS_CONFIG, q)
+        pattern = _like_pattern(q)
+
+        matched = or_(
+            vector.op("@@")(query),
+            *[c.ilike(pattern) for c in columns],
+        )
+        score = func.ts_rank(vector, query) + func.greatest(*[func.word_similarity(q, c) for c in columns])
+
+        id_col, facility_id_col, room_id_col = key_cols
+        stmt = select(
+            literal_column(f"'{kind}'").label("kind"),
+            id_col.label("id"),
+            facility_id_col.label("facility_id"),
+            room_id_col.label("room_id"),
+            title.label("title"),
+            snippet.label("snippet"),
+            score.label("score"),
+        ).where(matched)
+        return stmt
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        kinds: list[str],
+        cursor: tuple[float, str, int] | None,
+        limit: int,
+    ):
+        """
+        시설/스터디룸/리뷰 통합 검색. 점수 역순 keyset 페이지,
+        다음 페이지 판단을 위해 limit + 1 건까지 조회한다.
+        cursor=(score, kind, id)
+        """
+        parts = []
+        if "facility" in kinds:
+            parts.append(
+                self._hits(
+                    "facility",
+                    q,
+                    [Facility.facility_name, Facility.facility_address],
+                    (Facility.facility_id, Facility.facility_id, null()),
+                    Facility.facility_name,
+                    Facility.facility_address,
+                ).where(Facility.use_tf.is_(True))
+            )
+        if "room" in kinds:
+            parts.append(
+                self._hits(
+                    "room",
+                    q,
+                    [StudyRoom.room_name, StudyRoom.room_equipment],
+                    (StudyRoom.room_id, StudyRoom.facility_id, StudyRoom.room_id),
+                    StudyRoom.room_name,
+                    StudyRoom.room_equipment,
+                ).where(StudyRoom.use_tf.is_(True))
+            )
+        if "review" in kinds:
+            parts.append(
+                self._hits(
+                    "review",
+                    q,
+                    [Review.comment],
+                    (Review.review_id, StudyRoom.facility_id, Review.room_id),
+                    StudyRoom.room_name,
+                    Review.comment,
+                )
+                .join(StudyRoom, StudyRoom.room_id == Review.room_id)
+                .where(StudyRoom.use_tf.is_(True))
+            )
+
+        hit = union_all(*parts).subquery("hit") if len(parts) > 1 else parts[0].subquery("hit")
+
+        stmt = select(hit)
+        if cursor is not None:
+            score, kind, id_ = cursor
+            stmt = stmt.where(
+                or_(
+                    hit.c.score < score,
+                    and_(hit.c.score == score, tuple_(hit.c.kind, hit.c.id) > tuple_(kind, id_)),
+                )
+            )
+        stmt = stmt.order_by(hit.c.score.desc(), hit.c.kind, hit.c.id).limit(limit + 1)
+
+        res = await db.execute(stmt)
+        return res.all()
+
+
+search_repository = SearchRepository()
@@ -1,4 +1,5 @@
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models.student import Student
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,6 +8,21 @@ class Studentrepository:
         db.add(student)
         return student
     
+    async def insert_many_skip_existing(self, db: AsyncSession, rows: list[dict]) -> int:
+        # 학번(unique) 이 이미 있으면 건너뛰고, 실제로 들어간 행 수를 돌려준다
+        stmt = (
+            pg_insert(Student)
+            .on_conflict_do_nothing(index_elements=[Student.student_no])
+            .returning(Student.student_id)
+        )
+        result = await db.execute(stmt, rows)
+        return len(result.all())
+
+    async def find_existing_student_nos(self, db: AsyncSession, student_nos: list[str]) -> set[str]:
+        stmt = select(Student.student_no).where(Student.student_no.in_(student_nos))
+        result = await db.scalars(stmt)
+        return set(result.all())
+
     async def find_by_student_no(self, db: AsyncSession, student_no: str):
         stmt = select(Student).where(Student.student_no == student_no)
         result = await db.scalars(stmt) 
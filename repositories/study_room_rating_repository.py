@@ -0,0 +1,87 @@
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.review import Review
+from models.study_room import StudyRoom
+from models.study_room_rating import StudyRoomRating
+
+STAR_COLUMNS = ("star_1", "star_2", "star_3", "star_4", "star_5")
+
+
+class StudyRoomRatingRepository:
+    async def find_by_room_id(self, db: AsyncSession, room_id: int) -> StudyRoomRating | None:
+        return await db.get(StudyRoomRating, room_id)
+
+    async def apply(
+        self,
+        db: AsyncSession,
+        room_id: int,
+        added: int | None = None,
+        removed: int | None = None,
+    ) -> None:
+        """
+        리뷰 하나가 추가/삭제/별점 변경됐을 때 집계를 증분 반영한다 (UPSERT 한 번).
+        별점 변경은 added=새 별점, removed=이전 별점.
+        """
+        deltas = {"rating_sum": 0, "review_count": 0, **{c: 0 for c in STAR_COLUMNS}}
+        if added is not None:
+            deltas["rating_sum"] += added
+            deltas["review_count"] += 1
+            deltas[f"star_{added}"] += 1
+        if removed is not None:
+            deltas["rating_sum"] -= removed
+            deltas["review_count"] -= 1
+            deltas[f"star_{removed}"] -= 1
+
+        changed = {k: v for k, v in deltas.items() if v}
+        if not changed:
+            return
+
+        table = StudyRoomRating.__table__
+        stmt = (
+            insert(StudyRoomRating)
+            .values(room_id=room_id, **{k: max(v, 0) for k, v in changed.items()})
+            .on_conflict_do_update(
+                index_elements=[StudyRoomRating.room_id],
+                set_={**{k: table.c[k] + v for k, v in changed.items()}, "up_date": func.now()},
+            )
+        )
+        await db.execute(stmt)
+
+    async def recompute(self, db: AsyncSession, room_id: int | None = None) -> int:
+        """
+        review 테이블 기준으로 집계를 다시 계산해 덮어쓴다 (드리프트 복구용).
+        리뷰가 없는 방은 0으로 맞춘다. 새로 만들거나 고친 방 수를 돌려준다.
+        """
+        source = (
+            select(
+                StudyRoom.room_id,
+                func.coalesce(func.sum(Review.rating), 0).label("rating_sum"),
+                func.count(Review.review_id).label("review_count"),
+                *[
+                    func.count(Review.review_id).filter(Review.rating == star).label(f"star_{star}")
+                    for star in range(1, 6)
+                ],
+            )
+            .select_from(StudyRoom)
+            .outerjoin(Review, Review.room_id == StudyRoom.room_id)
+            .group_by(StudyRoom.room_id)
+        )
+        if room_id is not None:
+            source = source.where(StudyRoom.room_id == room_id)
+
+        columns = ["room_id", "rating_sum", "review_count", *STAR_COLUMNS]
+        stmt = insert(StudyRoomRating).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StudyRoomRating.room_id],
+            set_={**{c: stmt.excluded[c] for c in columns[1:]}, "up_date": func.now()},
+            # 실제로 어긋난 방만 갱신 (up_date가 바뀌면 조회 캐시가 무효화되므로)
+            where=tuple_(*[StudyRoomRating.__table__.c[c] for c in columns[1:]])
+            != tuple_(*[stmt.excluded[c] for c in columns[1:]]),
+        )
+        res = await db.execute(stmt)
+        return res.rowcount
+
+
+study_room_rating_repository = StudyRoomRatingRepository()
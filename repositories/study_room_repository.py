@@ -1,39 +1,39 @@
 # app/repositories/study_room_repository.py
 from __future__ import annotations
 
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import joinedload
 
+from models.facility import Facility
 from models.study_room import StudyRoom
-from models.review import Review
+from models.study_room_rating import StudyRoomRating
 
 class StudyRoomRepository:
     async def save(self, db: AsyncSession, study_room: StudyRoom) -> StudyRoom:
         db.add(study_room)
         return study_room
 
+    async def insert_many(self, db: AsyncSession, rows: list[dict]) -> None:
+        # 대량 등록용 다건 INSERT (multi-row VALUES 로 묶여 실행됨)
+        await db.execute(insert(StudyRoom), rows)
+
     async def find_by_id(self, db: AsyncSession, room_id: int) -> StudyRoom | None:
         return await db.get(StudyRoom, room_id)
 
-    async def find_all_by_facility_id(
-        self,
-        db: AsyncSession,
-        facility_id: int,
-        room_floor: str | None = None,   
-        room_capacity: int | None = None
-    ) -> list[StudyRoom]:
-        # 1. 기본 쿼리: 특정 시설(facility_id)의 데이터는 무조건 가져옴
+    async def find_by_id_with_items(self, db: AsyncSession, room_id: int) -> StudyRoom | None:
+        # detail에서 쓰는 버전 (facility_item 함께 로딩)
         stmt = (
             select(StudyRoom)
-            .options(
-                joinedload(StudyRoom.facility_item),
-                selectinload(StudyRoom.review_items) 
-                ) 
-            .where(StudyRoom.facility_id == facility_id)
+            .options(joinedload(StudyRoom.facility_item))
+            .where(StudyRoom.room_id == room_id)
         )
-        
+        res = await db.execute(stmt)
+        return res.unique().scalar_one_or_none()
+
+    def _apply_filters(self, stmt, facility_id: int, room_floor: str | None, room_capacity: int | None):
+        stmt = stmt.where(StudyRoom.facility_id == facility_id)
+
         # 2. 층수 필터: "전체"가 아닐 때만 조건 추가
         # 만약 프론트에서 "전체 층" 선택 시 빈 문자열("")을 보낸다면 아래와 같이 체크
         if room_floor and room_floor != "전체":
@@ -44,22 +44,68 @@ class StudyRoomRepository:
         if room_capacity and room_capacity > 0:
             # 이미지처럼 '최대 4명'인 방에 4명이 들어가려면 capacity가 4 이상이어야 함
             stmt = stmt.where(StudyRoom.room_capacity >= room_capacity)
-            
-        # 4. 정렬
-        stmt = stmt.order_by(StudyRoom.room_id.desc())
 
+        return stmt
+
+    async def find_list_version(
+        self,
+        db: AsyncSession,
+        facility_id: int,
+        room_floor: str | None = None,
+        room_capacity: int | None = None,
+    ):
+        """
+        목록 캐시 검증값: (건수, 방/시설/리뷰집계 각각의 마지막 수정 시각).
+        목록 본문 쿼리와 같은 필터를 쓰되 집계 한 줄만 읽는다.
+        """
+        stmt = (
+            select(
+                func.count(StudyRoom.room_id).label("room_count"),
+                func.max(StudyRoom.up_date).label("room_up_date"),
+                func.max(Facility.up_date).label("facility_up_date"),
+                func.max(StudyRoomRating.up_date).label("rating_up_date"),
+            )
+            .select_from(StudyRoom)
+            .join(Facility, Facility.facility_id == StudyRoom.facility_id)
+            .outerjoin(StudyRoomRating, StudyRoomRating.room_id == StudyRoom.room_id)
+        )
+        stmt = self._apply_filters(stmt, facility_id, room_floor, room_capacity)
+        res = await db.execute(stmt)
+        return res.one()
+
+    async def find_version(self, db: AsyncSession, room_id: int):
+        # 상세 캐시 검증값: (방, 시설, 리뷰집계 수정 시각), 방이 없으면 None
+        stmt = (
+            select(
+                StudyRoom.up_date.label("room_up_date"),
+                Facility.up_date.label("facility_up_date"),
+                StudyRoomRating.up_date.label("rating_up_date"),
+            )
+            .select_from(StudyRoom)
+            .join(Facility, Facility.facility_id == StudyRoom.facility_id)
+            .outerjoin(StudyRoomRating, StudyRoomRating.room_id == StudyRoom.room_id)
+            .where(StudyRoom.room_id == room_id)
+        )
         res = await db.execute(stmt)
-        rooms = res.scalars().all()
-        for room in rooms:
-            if room.review_items:
-                room.average_rating = round(sum(r.rating for r in room.review_items) / len(room.review_items), 1)
-                room.review_count = len(room.review_items)
+        return res.one_or_none()
+
+    async def find_all_by_facility_id(
+        self,
+        db: AsyncSession,
+        facility_id: int,
+        room_floor: str | None = None,   
+        room_capacity: int | None = None
+    ) -> list[StudyRoom]:
+        # 1. 기본 쿼리: 특정 시설(facility_id)의 데이터는 무조건 가져옴
+        #    평균 별점/리뷰 수는 rating_item(집계 테이블)이 JOIN 으로 함께 로딩됨
+        stmt = select(StudyRoom).options(joinedload(StudyRoom.facility_item))
+        stmt = self._apply_filters(stmt, facility_id, room_floor, room_capacity)
 
-            else:
-                room.average_rating = 0.0
-                room.review_count = 0
+        # 4. 정렬
+        stmt = stmt.order_by(StudyRoom.room_id.desc())
 
-        return rooms
+        res = await db.execute(stmt)
+        return res.unique().scalars().all()
 
     async def count_all(self, db: AsyncSession) -> int:
         stmt = select(func.count()).select_from(StudyRoom)
@@ -0,0 +1,59 @@
+# routers/admin_router.py
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.config import settings
+from configs.db import get_db
+from dependencies import require_admin
+from schemas.bulk_import import BulkImportResponse, ImportEntity, ImportFormat, StudentProvisionResponse
+from services.bulk_import_service import bulk_import_service
+from services.student_provisioning_service import student_provisioning_service
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.post(
+    "/import/{entity}",
+    response_model=BulkImportResponse,
+    summary="시설/스터디룸 대량 등록 (CSV/NDJSON 스트리밍, 학생은 /students/provision)",
+)
+async def bulk_import(
+    entity: ImportEntity,
+    request: Request,
+    format: ImportFormat = Query("csv", description="요청 본문 형식"),
+    batch_size: int = Query(settings.BULK_IMPORT_BATCH_SIZE, ge=1, le=10000, description="배치(커밋) 단위 행 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    # curl -H "X-Admin-Key: ..." --data-binary @rooms.csv "/api/admin/import/study_room?format=csv"
+    return await bulk_import_service.import_stream(
+        db=db,
+        entity=entity,
+        chunks=request.stream(),
+        fmt=format,
+        batch_size=batch_size,
+    )
+
+
+@router.post(
+    "/students/provision",
+    response_model=StudentProvisionResponse,
+    summary="학기 학생 명단 일괄 등록 (이미 있는 학번은 건너뜀)",
+)
+async def provision_students(
+    request: Request,
+    format: ImportFormat = Query("csv", description="요청 본문 형식"),
+    batch_size: int = Query(settings.BULK_IMPORT_BATCH_SIZE, ge=1, le=10000, description="배치(커밋) 단위 행 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    # curl -H "X-Admin-Key: ..." --data-binary @students.csv "/api/admin/students/provision?format=csv"
+    return await student_provisioning_service.provision_stream(
+        db=db,
+        chunks=request.stream(),
+        fmt=format,
+        batch_size=batch_size,
+    )
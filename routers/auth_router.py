@@ -1,6 +1,6 @@
 # routers/auth_router.py
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession # AsyncSession으로 변경
 from configs.db import get_db
 from services.auth_service import auth_service
@@ -18,6 +18,7 @@ async def signup(data: StudentCreate, db: AsyncSession = Depends(get_db)): # asy
     return await auth_service.signup(db, data)
 
 @router.post("/login", response_model=TokenResponse)
-async def login(data: StudentLogin, db: AsyncSession = Depends(get_db)): # async 및 AsyncSession 적용
-    access_token = await auth_service.login(db, data)
+async def login(data: StudentLogin, request: Request, db: AsyncSession = Depends(get_db)): # async 및 AsyncSession 적용
+    client_ip = request.client.host if request.client else None
+    access_token = await auth_service.login(db, data, client_ip)
     return {"access_token": access_token, "token_type": "bearer"}
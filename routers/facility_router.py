@@ -1,6 +1,8 @@
 # routers/facility_router.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from configs.db import get_db
@@ -9,8 +11,12 @@ from schemas.facility import (
     FacilityCreateResponse,
     FacilityDetailResponse,
     FacilityListResponse,
+    FacilityAvailabilityResponse,
+    FacilityOverviewResponse,
 )
 from services.facility_service import facility_service
+from services.availability_service import availability_service
+from http_cache import cache_headers, is_not_modified, not_modified_response
 
 router = APIRouter(prefix="/api/facilities", tags=["facilities"])
 
@@ -26,16 +32,68 @@ async def create_facility(
 @router.get("/{facility_id}", response_model=FacilityDetailResponse)
 async def read_facility(
     facility_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
+    validator = await facility_service.detail_validator(db, facility_id)
+    if validator is not None:
+        headers = cache_headers(*validator)
+        if is_not_modified(request, *validator):
+            return not_modified_response(headers)
+        response.headers.update(headers)
+
     try:
         return await facility_service.detail(db, facility_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/{facility_id}/overview", response_model=FacilityOverviewResponse)
+async def read_facility_overview(
+    facility_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    # 시설 + 방 목록 + 방별 평점 + 오늘 예약 점유율을 한 번에
+    try:
+        return await facility_service.overview(db, facility_id, date.today())
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{facility_id}/availability", response_model=FacilityAvailabilityResponse)
+async def read_facility_availability(
+    facility_id: int,
+    request: Request,
+    response: Response,
+    from_date: date = Query(None, alias="from", description="시작 날짜 (기본: 오늘)"),
+    days: int = Query(7, ge=1, le=8, description="조회 일수"),
+    db: AsyncSession = Depends(get_db),
+):
+    # /api/facilities/1/availability?from=2026-02-20&days=7
+    try:
+        grid, etag = await availability_service.facility_grid(db, facility_id, from_date or date.today(), days)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    headers = cache_headers(etag, None, max_age=0)
+    if is_not_modified(request, etag, None):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
+    return grid
+
+
 @router.get("", response_model=FacilityListResponse)
 async def list_facilities(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
+    validator = await facility_service.list_validator(db)
+    headers = cache_headers(*validator)
+    if is_not_modified(request, *validator):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     return await facility_service.list(db)
\ No newline at end of file
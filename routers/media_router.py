@@ -0,0 +1,36 @@
+# routers/media_router.py
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from http_cache import is_not_modified, not_modified_response
+from services.image_service import image_service
+
+router = APIRouter(prefix="/media/rooms", tags=["media"])
+
+# 해시 파일명은 내용이 바뀌면 이름도 바뀌므로 영구 캐시
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+
+@router.get("/{variant}/{filename}", summary="스터디룸 원본/썸네일 이미지")
+async def read_room_image(
+    variant: str,
+    filename: str,
+    request: Request,
+):
+    # /media/rooms/original/{hash}.jpg, /media/rooms/sm/{hash}.webp
+    try:
+        path, media_type, immutable = image_service.resolve(variant, filename)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    headers = {
+        # 썸네일 대신 원본을 줄 때는 ETag 도 원본 기준
+        "ETag": f'"{variant}-{path.name}"',
+        "Cache-Control": IMMUTABLE_CACHE if immutable else "no-cache",
+    }
+    if is_not_modified(request, headers["ETag"], None):
+        return not_modified_response(headers)
+
+    # FileResponse: Range(206) 처리, 서버가 지원하면 http.response.pathsend 로 zero-copy 전송
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from configs.db import get_db
 from dependencies import get_current_user 
 
-from models.student import Student 
+from services.principal_cache import Principal
 from services.reservation_service import reservation_service
 
 from schemas.reservation import (
+    ReservationBatchCreate,
+    ReservationBatchResponse,
+    ReservationCompactItem,
+    ReservationCompactListResponse,
     ReservationCreate,
     ReservationCreateResponse,
     ReservationDetail,
@@ -27,39 +34,74 @@ router = APIRouter(
 async def create_reservation(
     payload: ReservationCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user), 
+    current_user: Principal = Depends(get_current_user), 
 ):
     return await reservation_service.create(
         db,
         payload,
         current_user.student_id, 
     )
-    
+
+
+@router.post(
+    "/batch",
+    response_model=ReservationBatchResponse,
+    summary="일괄 예약 신청 (전부 성공 또는 전부 실패)",
+)
+async def create_reservation_batch(
+    payload: ReservationBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    return await reservation_service.create_batch(
+        db,
+        payload,
+        current_user.student_id,
+    )
+
 @router.get(
     "/me",
-    response_model=ReservationListResponse,
+    response_model=ReservationListResponse | ReservationCompactListResponse,
     summary="내 예약 목록 조회",
 )
 async def get_my_reservations(
+    status: Literal["all", "upcoming", "past", "cancelled"] = Query("all", description="예약 상태 필터"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    with_total: bool = Query(False, description="전체 건수 포함 여부"),
+    format: Literal["json", "ndjson"] = Query("json", description="ndjson: 전체 목록 스트리밍 내보내기"),
+    view: Literal["full", "compact"] = Query("full", description="compact: ID와 이름만 응답"),
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
+    if format == "ndjson":
+        return StreamingResponse(
+            reservation_service.stream_by_student(current_user.student_id, status, view),
+            media_type="application/x-ndjson",
+        )
+
     return await reservation_service.list_by_student(
         db,
         current_user.student_id, 
+        status_filter=status,
+        cursor=cursor,
+        limit=limit,
+        with_total=with_total,
+        view=view,
     )
 
 @router.get(
     "/{reservation_id}",
-    response_model=ReservationDetail,
+    response_model=ReservationDetail | ReservationCompactItem,
     summary="예약 상세 조회",
 )
 async def get_reservation_detail(
     reservation_id: int,
+    view: Literal["full", "compact"] = Query("full", description="compact: ID와 이름만 응답"),
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
-    return await reservation_service.detail(db, reservation_id)
+    return await reservation_service.detail(db, reservation_id, view)
 
 
 
@@ -71,7 +113,7 @@ async def get_reservation_detail(
 async def cancel_reservation(
     reservation_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     return await reservation_service.cancel(
         db,
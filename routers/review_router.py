@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from configs.db import get_db
 from dependencies import get_current_user
 
-from models.student import Student
+from services.principal_cache import Principal
 from services.review_service import review_service
 
 from schemas.review import (
@@ -12,6 +14,7 @@ from schemas.review import (
     ReviewCreateResponse,
     ReviewDetail,
     ReviewListResponse,
+    ReviewUpdate,
 )
 
 router = APIRouter(
@@ -27,7 +30,7 @@ router = APIRouter(
 async def create_review(
     payload: ReviewCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     return await review_service.create(
         db=db,
@@ -58,11 +61,17 @@ async def get_review_detail(
 )
 async def list_reviews_by_room(
     room_id: int,
+    sort: Literal["newest", "rating"] = Query("newest", description="newest: 최신순, rating: 별점 높은순"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
     return await review_service.list_by_room(
         db=db,
         room_id=room_id,
+        sort=sort,
+        cursor=cursor,
+        limit=limit,
     )
 
 
@@ -72,18 +81,15 @@ async def list_reviews_by_room(
 )
 async def update_review(
     review_id: int,
-    payload: dict, 
+    payload: ReviewUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
-    rating = payload.get("rating")
-    comment = payload.get("comment")
-
     return await review_service.update(
         db=db,
         review_id=review_id,
-        rating=rating,
-        comment=comment,
+        rating=payload.rating,
+        comment=payload.comment,
         student_id=current_user.student_id,
     )
 
@@ -95,7 +101,7 @@ async def update_review(
 async def delete_review(
     review_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: Student = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     return await review_service.delete(
         db=db,
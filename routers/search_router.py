@@ -0,0 +1,29 @@
+# routers/search_router.py
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.db import get_db
+from schemas.search import SearchResponse
+from services.search_service import search_service
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+
+@router.get("", response_model=SearchResponse, summary="시설/스터디룸/리뷰 통합 검색")
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    type: Literal["all", "facility", "room", "review"] = Query("all", description="검색 대상"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    return await search_service.search(
+        db=db,
+        q=q,
+        kind=type,
+        cursor=cursor,
+        limit=limit,
+    )
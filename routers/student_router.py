@@ -1,18 +1,22 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from configs.db import get_db
 from schemas.student import StudentDetail
 # from schemas.post2 import Post2ListResponse - TO-BE 예약 reservation
-from models.student import Student
+from services.principal_cache import Principal
 from dependencies import get_current_user
+from services.auth_service import auth_service
 # from services.auth_service import student_service
 
 router = APIRouter(prefix="/student" ,tags=["ME"])
 
 @router.get("/me", response_model=StudentDetail)
 async def get_me(
-    current_user: Student = Depends(get_current_user)):
-    return current_user
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    # 인증 캐시/토큰 클레임 스냅샷이 아니라 DB 최신 정보
+    return await auth_service.get_student(db, current_user.student_id)
 
 # @router.get("/me/posts", response_model=list[Post2ListResponse])
 # def read_my_posts(
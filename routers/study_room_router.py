@@ -1,15 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from configs.db import get_db
+from dependencies import require_admin
 from schemas.study_room import (
     StudyRoomCreate,
     StudyRoomCreateResponse,
     StudyRoomDetail,
     StudyRoomListResponse,
+    StudyRoomAvailabilityResponse,
+    StudyRoomImageResponse,
 )
 
 from services.study_room_service import study_room_service
+from services.availability_service import availability_service
+from http_cache import cache_headers, is_not_modified, not_modified_response
 
 router = APIRouter(prefix="/api/study-rooms", tags=["study-rooms"])
 
@@ -20,25 +27,71 @@ async def create_facility(
 ):
     return await study_room_service.create(db, req)
 
+@router.post(
+    "/{room_id}/image",
+    response_model=StudyRoomImageResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def upload_study_room_image(
+    room_id: int,
+    file: UploadFile = File(..., description="jpg / png / webp"),
+    db: AsyncSession = Depends(get_db),
+):
+    # 원본은 바로 저장하고 썸네일은 백그라운드에서 생성
+    try:
+        return await study_room_service.update_image(db, room_id, file)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
 @router.get("/{room_id}", response_model=StudyRoomDetail)
 async def read_study_room(
     room_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
+    validator = await study_room_service.detail_validator(db, room_id)
+    if validator is not None:
+        headers = cache_headers(*validator)
+        if is_not_modified(request, *validator):
+            return not_modified_response(headers)
+        response.headers.update(headers)
+
     try:
         return await study_room_service.detail(db, room_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/{room_id}/availability", response_model=StudyRoomAvailabilityResponse)
+async def read_study_room_availability(
+    room_id: int,
+    date: date = Query(..., description="조회 날짜 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_db),
+):
+    # /api/study-rooms/3/availability?date=2026-02-20
+    try:
+        return await availability_service.availability(db, room_id, date)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("", response_model=StudyRoomListResponse)
 async def list_study_rooms(
+    request: Request,
+    response: Response,
     facilityId: int = Query(None, description="시설 ID (facility_id)"),
     room_floor: str = Query(None, description="층 (room_floor)"),
     room_capacity: int = Query(None, description="총 수용인원" ),
     db: AsyncSession = Depends(get_db),
 ):
     # /api/study-rooms?facilityId=1
+    validator = await study_room_service.list_validator(db, facilityId, room_floor, room_capacity)
+    headers = cache_headers(*validator)
+    if is_not_modified(request, *validator):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
     return await study_room_service.list_by_facility(db, facilityId, room_floor, room_capacity)
 
 
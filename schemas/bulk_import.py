@@ -0,0 +1,39 @@
+# /schemas/bulk_import.py
+
+from typing import List, Literal
+
+from pydantic import BaseModel
+
+ImportEntity = Literal["facility", "study_room"]
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class BulkImportError(BaseModel):
+    """실패한 행 (line 은 입력 파일의 1부터 시작하는 줄 번호)"""
+    line: int
+    error: str
+
+
+class BulkImportResponse(BaseModel):
+    """POST /api/admin/import/{entity} 응답"""
+    entity: ImportEntity
+    total: int
+    inserted: int
+    failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    # 앞에서부터 최대 MAX_REPORTED_ERRORS 건
+    errors: List[BulkImportError]
+
+
+class StudentProvisionResponse(BaseModel):
+    """POST /api/admin/students/provision 응답"""
+    total: int
+    created: int
+    # 이미 있는 학번 (DB 또는 같은 파일 안의 중복)
+    skipped: int
+    failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    # 앞에서부터 최대 MAX_REPORTED_ERRORS 건
+    errors: List[BulkImportError]
@@ -1,7 +1,7 @@
 # /schemas/facility.py
 
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -52,4 +52,50 @@ class FacilityListItemResponse(BaseModel):
 class FacilityListResponse(BaseModel):
     """GET /facilities 응답(페이징 없음)"""
     items: List[FacilityListItemResponse]
-    total_count: int
\ No newline at end of file
+    total_count: int
+
+
+class FacilityAvailabilityRoom(BaseModel):
+    """방 하나의 날짜별 시간 비트맵 (dates 순서, bit i = i시~i+1시)"""
+    room_id: int
+    room_name: str
+    available_masks: List[int]
+    blocked_masks: List[int]
+
+
+class FacilityAvailabilityResponse(BaseModel):
+    """GET /facilities/{id}/availability 응답 (방 x 날짜 x 시간 비트맵)"""
+    facility_id: int
+    dates: List[date]
+    rooms: List[FacilityAvailabilityRoom]
+
+
+class FacilityOverviewRoom(BaseModel):
+    """개요 화면의 방 한 개 (리뷰 집계 + 당일 예약 현황)"""
+    room_id: int
+    room_name: str
+    room_floor: str
+    room_image: Optional[str] = None
+    room_capacity: int
+    room_equipment: Optional[str] = None
+    use_tf: bool
+
+    average_rating: float = 0.0
+    review_count: int = 0
+    rating_histogram: List[int] = [0, 0, 0, 0, 0]
+
+    # 당일 예약된 시간(시간 단위)과 하루(24시간) 대비 비율
+    booked_hours: float = 0.0
+    booked_ratio: float = 0.0
+
+
+class FacilityOverviewResponse(BaseModel):
+    """GET /facilities/{id}/overview 응답 (시설 + 방 + 평점 + 당일 점유율)"""
+    facility_id: int
+    facility_name: str
+    facility_address: str
+    facility_desc: str
+    use_tf: bool
+
+    date: date
+    rooms: List[FacilityOverviewRoom]
@@ -26,6 +26,11 @@ class ReservationCreate(ReservationBase):
     pass
 
 
+class ReservationBatchCreate(BaseModel):
+    """POST /reservations/batch 요청 바디 (전부 성공하거나 전부 실패)"""
+    items: List[ReservationCreate] = Field(..., min_length=1, max_length=20)
+
+
 class ReservationCreateResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -33,6 +38,18 @@ class ReservationCreateResponse(BaseModel):
     message: str = "created"
 
 
+class ReservationBatchItemResult(BaseModel):
+    index: int
+    status_code: int
+    reservation_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class ReservationBatchResponse(BaseModel):
+    ok: bool
+    items: List[ReservationBatchItemResult]
+
+
 class ReservationDetail(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -82,6 +99,36 @@ class ReservationListItemResponse(BaseModel):
     use_tf: bool
 
 
+class ReservationCompactItem(BaseModel):
+    """view=compact: ID와 표시용 이름만 담은 예약 정보"""
+    model_config = ConfigDict(from_attributes=True)
+
+    reservation_id: int
+
+    student_id: int
+    student_name: str
+    room_id: int
+    room_name: str
+    facility_id: int
+    facility_name: str
+
+    reservation_status: str
+    reservation_date: date
+    reservation_start_date: datetime
+    reservation_end_date: datetime
+
+    reservation_count: Optional[int]
+
+
 class ReservationListResponse(BaseModel):
     items: List[ReservationListItemResponse]
-    total_count: int
\ No newline at end of file
+    # with_total=true 일 때만 계산 (기본은 생략)
+    total_count: Optional[int] = None
+    # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+
+
+class ReservationCompactListResponse(BaseModel):
+    items: List[ReservationCompactItem]
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
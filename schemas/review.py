@@ -17,6 +17,12 @@ class ReviewCreate(ReviewBase):
     pass
 
 
+class ReviewUpdate(BaseModel):
+    # 보낸 필드만 수정 (별점은 1~5 정수, 4.5 같은 값은 422)
+    rating: Optional[int] = Field(None, ge=1, le=5)
+    comment: Optional[str] = Field(None, max_length=255)
+
+
 class ReviewCreateResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -52,4 +58,7 @@ class ReviewListItemResponse(BaseModel):
 
 class ReviewListResponse(BaseModel):
     items: List[ReviewListItemResponse]
+    # 방 전체 리뷰 수 (집계 테이블 기준)
     total_count: int
+    # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
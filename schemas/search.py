@@ -0,0 +1,30 @@
+# /schemas/search.py
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchHit(BaseModel):
+    """통합 검색 결과 한 건 (시설/스터디룸/리뷰)"""
+    model_config = ConfigDict(from_attributes=True)
+
+    kind: Literal["facility", "room", "review"]
+    # kind 별 PK (facility_id / room_id / review_id)
+    id: int
+    facility_id: int
+    room_id: Optional[int] = None
+
+    # facility: 시설명, room: 방 이름, review: 리뷰가 달린 방 이름
+    title: str
+    # facility: 주소, room: 비품, review: 리뷰 내용
+    snippet: Optional[str] = None
+
+    score: float
+
+
+class SearchResponse(BaseModel):
+    """GET /api/search 응답"""
+    items: List[SearchHit]
+    # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
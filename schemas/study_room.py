@@ -1,9 +1,8 @@
-from datetime import datetime
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Dict, Optional, List
 
 from pydantic import BaseModel, Field, ConfigDict
 from schemas.facility import FacilityDetailResponse
-from schemas.review import ReviewListItemResponse
 
 class StudyRoomBase(BaseModel):
     facility_id: int
@@ -27,7 +26,6 @@ class StudyRoomDetail(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     facility_item: FacilityDetailResponse
-    review_items: List[ReviewListItemResponse] = []    
     
     room_id: int
     facility_id: int
@@ -37,9 +35,14 @@ class StudyRoomDetail(BaseModel):
     room_capacity: int
     room_equipment: Optional[str]
     use_tf: bool
+
+    # 원본/썸네일 URL ({"original": ..., "sm": ..., "md": ..., "lg": ...}), 이미지가 없으면 빈 dict
+    image_urls: Dict[str, str] = {}
     
+    # 리뷰 집계(study_room_rating) 기준, 리뷰 목록은 /api/reviews/room/{room_id}
     average_rating: float = 0.0
     review_count: int = 0
+    rating_histogram: List[int] = [0, 0, 0, 0, 0]
 
     reg_date: datetime
     up_date: datetime
@@ -52,16 +55,26 @@ class StudyRoomListItemResponse(BaseModel):
     facility_id: int
     
     facility_item: FacilityDetailResponse
-    review_items: List[ReviewListItemResponse] = []    
 
     room_name: str
     room_floor: str
     room_capacity: int
     room_equipment: str
     use_tf: bool
+
+    # 목록용 썸네일 URL ({"sm": ..., "md": ..., "lg": ...}), 이미지가 없으면 빈 dict
+    thumbnail_urls: Dict[str, str] = {}
     
+    # 리뷰 집계(study_room_rating) 기준, 리뷰 목록은 /api/reviews/room/{room_id}
     average_rating: float = 0.0
     review_count: int = 0
+    rating_histogram: List[int] = [0, 0, 0, 0, 0]
+
+class StudyRoomImageResponse(BaseModel):
+    """POST /study-rooms/{id}/image 응답"""
+    room_id: int
+    room_image: str
+    image_urls: Dict[str, str]
 
 class StudyRoomListResponse(BaseModel):
     items: List[StudyRoomListItemResponse]
@@ -82,3 +95,20 @@ class StudyRoomListResponse(BaseModel):
     
 
 
+
+class StudyRoomAvailabilitySlot(BaseModel):
+    hour: int
+    start_at: datetime
+    end_at: datetime
+    status: str  # available / reserved / blocked
+
+class StudyRoomAvailabilityResponse(BaseModel):
+    """GET /study-rooms/{id}/availability 응답 (bit i = i시~i+1시)"""
+    room_id: int
+    date: date
+
+    reserved_mask: int
+    blocked_mask: int
+    available_mask: int
+
+    slots: List[StudyRoomAvailabilitySlot]
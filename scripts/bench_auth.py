@@ -0,0 +1,93 @@
+# /scripts/bench_auth.py
+"""
+요청당 인증 CPU 마이크로벤치마크 (DB 불필요).
+
+loadtest 의 booking_rush 와 같은 분포(학생 N 명의 토큰을 돌아가며 사용)로
+AuthService.get_current_user 를 반복 호출하고 모드별 요청당 CPU 시간(µs)을 비교한다.
+
+- no_cache:        캐시 없이 매번 jwt.decode + 학생 조회
+- jwt_cache:       검증된 JWT 클레임 캐시만 사용
+- principal_cache: 인증 principal 캐시 + JWT 캐시 (기본 설정)
+
+학생 조회는 메모리의 Student 를 돌려주는 세션으로 대체하므로 DB 왕복 시간은 포함되지 않는다.
+
+    python -m scripts.bench_auth --students 200 --requests 50000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from models.student import Student
+from services.auth_service import auth_service
+from services.principal_cache import principal_cache
+from services.token_cache import verified_token_cache
+
+
+class MemorySession:
+    """student_repository.find_by_id 가 쓰는 db.get 만 흉내 낸다."""
+
+    def __init__(self, students: dict[int, Student]):
+        self.students = students
+
+    async def get(self, model, ident):
+        return self.students.get(ident)
+
+
+async def run_mode(name: str, db: MemorySession, tokens: list[str], requests: int) -> dict:
+    for cache in (principal_cache, verified_token_cache):
+        cache.clear()
+        cache.hits = cache.misses = cache.evictions = 0
+    principal_max, token_max = principal_cache.max_entries, verified_token_cache.max_entries
+    if name == "no_cache":
+        principal_cache.max_entries = verified_token_cache.max_entries = 0
+    elif name == "jwt_cache":
+        principal_cache.max_entries = 0
+
+    try:
+        started_cpu = time.process_time()
+        started = time.perf_counter()
+        for i in range(requests):
+            await auth_service.get_current_user(db, tokens[i % len(tokens)])
+        cpu = time.process_time() - started_cpu
+        wall = time.perf_counter() - started
+    finally:
+        principal_cache.max_entries, verified_token_cache.max_entries = principal_max, token_max
+
+    return {
+        "mode": name,
+        "requests": requests,
+        "cpu_us_per_request": round(cpu / requests * 1e6, 2),
+        "wall_us_per_request": round(wall / requests * 1e6, 2),
+        "jwt_cache": verified_token_cache.snapshot(),
+        "principal_cache": principal_cache.snapshot(),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    students = {
+        i: Student(
+            student_id=i,
+            student_no=f"bench-{i}",
+            student_name=f"b{i}"[:10],
+            student_department="bench",
+            student_phone="010-0000-0000",
+        )
+        for i in range(1, args.students + 1)
+    }
+    tokens = [auth_service.create_access_token(sid, s) for sid, s in students.items()]
+    db = MemorySession(students)
+
+    results = [await run_mode(mode, db, tokens, args.requests) for mode in ("no_cache", "jwt_cache", "principal_cache")]
+    return {"students": args.students, "results": results}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="요청당 인증 CPU 마이크로벤치마크")
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50_000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    print(json.dumps(asyncio.run(main(parse_args())), ensure_ascii=False, indent=2))
@@ -0,0 +1,233 @@
+# /scripts/bench_availability.py
+"""
+가용 시간 계산 비교 벤치마크: 비트맵(AvailabilityService) vs 기존 겹침 SQL.
+
+예약 가능 기간(오늘 ~ 오늘+7일)에 방마다 예약/관리자 차단을 시딩한 뒤, (방, 날짜) 마다 24시간 빈 시간 마스크를 세 방식으로 구한다.
+- overlap_sql: 시간대마다 reservation_repository.find_room_disable + reservation_disable_repository.find_disable (조회 48회)
+- bitmap_cold: availability_service.invalidate 후 get_masks (예약/차단 구간 조회 2회 + 비트 연산)
+- bitmap_warm: 미리 채운 캐시에서 get_masks (DB 조회 없음)
+
+(방, 날짜) 하나를 요청 하나로 보고 세션을 따로 열며, 지연(p50/p95/p99), 처리량, (방, 날짜)당 SQL 문 수를 JSON 으로 출력한다.
+세 방식의 마스크가 하나라도 다르면 결과의 "ok" 가 false 이고 종료 코드 1.
+시딩 데이터는 지우지 않으므로 전용(버려도 되는) DB 에서 실행한다.
+
+    python -m scripts.bench_availability --rooms 20 --concurrency 20 --out availability.json
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date, datetime, time as dtime, timedelta
+
+from sqlalchemy import event, insert
+
+from configs.db import AsyncSessionLocal, engine
+from main import app, lifespan
+from models.facility import Facility
+from models.reservation import Reservation
+from models.reservation_disable import ReservationDisable
+from models.student import Student
+from models.study_room import StudyRoom
+from repositories.reservation_disable_repository import reservation_disable_repository
+from repositories.reservation_repository import reservation_repository
+from scripts.loadtest import QueryCounter, latency_summary
+from services.auth_service import auth_service
+from services.availability_service import FULL_DAY_MASK, HOURS_PER_DAY, availability_service, booking_window
+
+
+async def seed(run_id: str, n_rooms: int) -> list[tuple[int, date]]:
+    hashed = auth_service.hash_password("bench-password")
+    first_day, last_day = booking_window()
+    days = [first_day + timedelta(days=d) for d in range((last_day - first_day).days + 1)]
+
+    async with AsyncSessionLocal() as db:
+        facility = Facility(facility_name=f"bench-{run_id}", facility_address="bench", facility_desc="bench")
+        db.add(facility)
+        await db.flush()
+
+        rooms = [
+            StudyRoom(
+                facility_id=facility.facility_id,
+                room_name=f"ba-{run_id}-{i}",
+                room_floor="1층",
+                room_capacity=4,
+                room_equipment="whiteboard",
+            )
+            for i in range(n_rooms)
+        ]
+        db.add_all(rooms)
+        await db.flush()
+
+        # 방마다 학생 한 명 (같은 시각 다른 방 예약이 학생 EXCLUDE 제약에 걸리지 않게)
+        res = await db.execute(
+            insert(Student).returning(Student.student_id),
+            [
+                {
+                    "student_no": f"ba-{run_id}-{i}",
+                    "student_password": hashed,
+                    "student_name": f"ba{i}"[:10],
+                    "student_department": "bench",
+                    "student_phone": "010-0000-0000",
+                }
+                for i in range(n_rooms)
+            ],
+        )
+        student_ids = res.scalars().all()
+
+        # 방/날짜마다 다른 패턴: 1~2시간 예약 몇 건(일부 취소), 저녁 차단 하나
+        reservations = []
+        disables = []
+        for d, day in enumerate(days):
+            for r, room in enumerate(rooms):
+                for k, hour in enumerate(range(8 + (d + r) % 3, 20, 3)):
+                    start_at = datetime.combine(day, dtime(hour))
+                    reservations.append(
+                        {
+                            "student_id": student_ids[r],
+                            "room_id": room.room_id,
+                            "facility_id": facility.facility_id,
+                            "reservation_status": "취소" if (d + r + k) % 5 == 0 else "예약완료",
+                            "reservation_date": day,
+                            "reservation_start_date": start_at,
+                            "reservation_end_date": start_at + timedelta(hours=1 + k % 2),
+                            "reservation_count": 1,
+                        }
+                    )
+                if (d + r) % 2 == 0:
+                    disables.append(
+                        {
+                            "room_id": room.room_id,
+                            "facility_id": facility.facility_id,
+                            "reason": "bench",
+                            "disable_date": day,
+                            "disable_start_at": datetime.combine(day, dtime(21)),
+                            "disable_end_at": datetime.combine(day, dtime(23, 30)),
+                        }
+                    )
+
+        await db.execute(insert(Reservation), reservations)
+        if disables:
+            await db.execute(insert(ReservationDisable), disables)
+        await db.commit()
+
+    return [(room.room_id, day) for day in days for room in rooms]
+
+
+async def free_mask_overlap_sql(db, room_id: int, day: date) -> int:
+    day_start = datetime.combine(day, dtime.min)
+    free = 0
+    for hour in range(HOURS_PER_DAY):
+        start_at = day_start + timedelta(hours=hour)
+        end_at = start_at + timedelta(hours=1)
+        if await reservation_repository.find_room_disable(db, room_id, day, start_at, end_at):
+            continue
+        if await reservation_disable_repository.find_disable(db, room_id, day, start_at, end_at):
+            continue
+        free |= 1 << hour
+    return free
+
+
+async def free_mask_bitmap(db, room_id: int, day: date) -> int:
+    reserved, blocked = await availability_service.get_masks(db, room_id, day)
+    return FULL_DAY_MASK & ~(reserved | blocked)
+
+
+async def run_mode(name: str, compute, counter: QueryCounter, keys: list[tuple[int, date]], concurrency: int, cold: bool) -> tuple[dict, dict]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    masks: dict[tuple[int, date], int] = {}
+
+    async def one(key: tuple[int, date]):
+        async with semaphore:
+            if cold:
+                availability_service.invalidate(*key)
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                masks[key] = await compute(db, *key)
+            latencies.append(time.perf_counter() - started)
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(one(key) for key in keys))
+    elapsed = time.perf_counter() - started
+    queries = counter.count - queries_before
+
+    result = {
+        "mode": name,
+        "room_days": len(keys),
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(len(keys) / elapsed, 2) if elapsed else None,
+        "latency_ms": latency_summary(latencies),
+        "db_queries": queries,
+        "db_queries_per_room_day": round(queries / len(keys), 2) if keys else None,
+    }
+    return result, masks
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine.echo = False
+
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    run_id = uuid.uuid4().hex[:8]
+    async with lifespan(app):
+        keys = await seed(run_id, args.rooms)
+        # 캐시 상한이 작으면 warm 측정 중 LRU 로 밀려나 cold 가 섞이므로 키 수만큼은 보장
+        availability_service.max_entries = max(availability_service.max_entries, len(keys))
+
+        overlap, overlap_masks = await run_mode("overlap_sql", free_mask_overlap_sql, counter, keys, args.concurrency, cold=False)
+        cold, cold_masks = await run_mode("bitmap_cold", free_mask_bitmap, counter, keys, args.concurrency, cold=True)
+        warm, warm_masks = await run_mode("bitmap_warm", free_mask_bitmap, counter, keys, args.concurrency, cold=False)
+
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    await engine.dispose()
+
+    mismatches = [
+        {
+            "room_id": room_id,
+            "date": day.isoformat(),
+            "overlap_sql": overlap_masks[(room_id, day)],
+            "bitmap_cold": cold_masks[(room_id, day)],
+            "bitmap_warm": warm_masks[(room_id, day)],
+        }
+        for room_id, day in keys
+        if not overlap_masks[(room_id, day)] == cold_masks[(room_id, day)] == warm_masks[(room_id, day)]
+    ]
+
+    def speedup(baseline: dict, other: dict) -> float | None:
+        return round(baseline["latency_ms"]["p50"] / other["latency_ms"]["p50"], 2) if other["latency_ms"]["p50"] else None
+
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {"rooms": args.rooms, "room_days": len(keys), "concurrency": args.concurrency},
+        "results": [overlap, cold, warm],
+        "speedup_p50_cold": speedup(overlap, cold),
+        "speedup_p50_warm": speedup(overlap, warm),
+        "mismatches": mismatches[:20],
+        "ok": not mismatches,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="가용 시간 비트맵 vs 겹침 SQL 벤치마크")
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--out", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if not report["ok"]:
+        raise SystemExit(1)
@@ -0,0 +1,179 @@
+# /scripts/bench_booking.py
+"""
+예약 생성 DB 왕복 비교 벤치마크.
+
+같은 조건의 예약을 두 방식으로 만들어 예약당 SQL 문 수, 지연(p50/p95/p99), 처리량을 JSON 으로 출력한다.
+- multi_query: 이전 ReservationService.create 순서 (방/시설 조회, 하루 한도 합산, 사용자/방 중복, 관리자 차단, INSERT, refresh)
+- single_cte: reservation_repository.create_if_admitted 한 문장 + commit
+
+예약마다 세션을 따로 열고(요청 하나와 같음), 두 방식은 서로 다른 날짜에 같은 방/시간/학생 배치로 넣는다.
+차이는 DB 왕복 지연에 비례하므로 원격 DB(운영과 같은 네트워크 거리)에서 재는 것이 의미 있다.
+시딩 데이터는 지우지 않으므로 전용(버려도 되는) DB 에서 실행한다.
+
+    python -m scripts.bench_booking --rooms 10 --students 200 --concurrency 20 --out booking.json
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date, datetime, time as dtime, timedelta
+
+from sqlalchemy import event
+
+from configs.db import AsyncSessionLocal, engine
+from main import app, lifespan
+from models.facility import Facility
+from models.reservation import Reservation
+from models.study_room import StudyRoom
+from repositories.reservation_disable_repository import reservation_disable_repository
+from repositories.reservation_repository import reservation_repository
+from scripts.loadtest import QueryCounter, latency_summary, seed
+
+OPEN_HOURS = range(8, 20)
+
+
+async def book_multi_query(db, student_id: int, room_id: int, facility_id: int, day: date, start_at: datetime, end_at: datetime) -> bool:
+    room = await db.get(StudyRoom, room_id)
+    facility = await db.get(Facility, facility_id)
+    if not room or not facility or room.facility_id != facility_id:
+        return False
+    if await reservation_repository.sum_count_by_student_and_date(db, student_id, day) + 1 > 2:
+        return False
+    if await reservation_repository.find_user_disable(db, student_id, day, start_at, end_at):
+        return False
+    if await reservation_repository.find_room_disable(db, room_id, day, start_at, end_at):
+        return False
+    if await reservation_disable_repository.find_disable(db, room_id, day, start_at, end_at):
+        return False
+
+    entity = Reservation(
+        student_id=student_id,
+        room_id=room_id,
+        facility_id=facility_id,
+        reservation_status="예약완료",
+        reservation_date=day,
+        reservation_start_date=start_at,
+        reservation_end_date=end_at,
+        reservation_count=1,
+        use_tf=True,
+    )
+    await reservation_repository.save(db, entity)
+    await db.flush()
+    await db.commit()
+    await db.refresh(entity)
+    return True
+
+
+async def book_single_cte(db, student_id: int, room_id: int, facility_id: int, day: date, start_at: datetime, end_at: datetime) -> bool:
+    admission = await reservation_repository.create_if_admitted(
+        db,
+        student_id=student_id,
+        room_id=room_id,
+        facility_id=facility_id,
+        reservation_date=day,
+        start_dt=start_at,
+        end_dt=end_at,
+        reservation_count=1,
+        use_tf=True,
+    )
+    if admission.reservation_id is None:
+        return False
+    await db.commit()
+    return True
+
+
+async def run_mode(name: str, book, counter: QueryCounter, seeded: dict, day: date, total: int, concurrency: int) -> dict:
+    room_ids = seeded["room_ids"]
+    students = seeded["students"]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    created = 0
+
+    async def one(k: int):
+        nonlocal created
+        # 같은 날 학생당 1건, 방/시간은 겹치지 않게
+        room_id = room_ids[k % len(room_ids)]
+        start_at = datetime.combine(day, dtime(OPEN_HOURS[(k // len(room_ids)) % len(OPEN_HOURS)]))
+        student_id, _ = students[k]
+        async with semaphore:
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                ok = await book(db, student_id, room_id, seeded["facility_id"], day, start_at, start_at + timedelta(hours=1))
+            latencies.append(time.perf_counter() - started)
+            created += ok
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(one(k) for k in range(total)))
+    elapsed = time.perf_counter() - started
+    queries = counter.count - queries_before
+
+    return {
+        "mode": name,
+        "bookings": total,
+        "created": created,
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "latency_ms": latency_summary(latencies),
+        "db_queries": queries,
+        "db_queries_per_booking": round(queries / total, 2) if total else None,
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine.echo = False
+
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    run_id = uuid.uuid4().hex[:8]
+    async with lifespan(app):
+        seeded = await seed(run_id, args.students, args.rooms)
+        total = min(args.requests, args.rooms * len(OPEN_HOURS), args.students)
+
+        first = date.today() + timedelta(days=1)
+        results = [
+            await run_mode("multi_query", book_multi_query, counter, seeded, first, total, args.concurrency),
+            await run_mode("single_cte", book_single_cte, counter, seeded, first + timedelta(days=1), total, args.concurrency),
+        ]
+
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    await engine.dispose()
+
+    multi, single = results
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "students": args.students,
+            "rooms": args.rooms,
+            "bookings": total,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+        "speedup_p50": round(multi["latency_ms"]["p50"] / single["latency_ms"]["p50"], 2) if single["latency_ms"]["p50"] else None,
+        "throughput_ratio": round(single["throughput_rps"] / multi["throughput_rps"], 2) if multi["throughput_rps"] else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="예약 생성 multi-query vs single CTE 벤치마크")
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=120, help="방식별 예약 수 (상한: 방 수 x 12, 학생 수)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--out", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
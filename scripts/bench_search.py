@@ -0,0 +1,167 @@
+# /scripts/bench_search.py
+"""
+통합 검색(GET /api/search) 지연 벤치마크.
+
+DATABASE_URL 의 Postgres 에 시설 1개, 스터디룸, 학생, 리뷰(기본 10만 건)를 시딩한 뒤
+검색어별로 요청을 반복해 p50/p95/p99 지연과 결과 수를 JSON 으로 출력한다.
+시딩 데이터는 지우지 않으므로 전용(버려도 되는) DB 에서 실행한다.
+
+    python -m scripts.bench_search --reviews 100000 --repeat 50 --out search.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime
+
+import httpx
+from sqlalchemy import insert
+
+from configs.db import AsyncSessionLocal, engine
+from main import app, lifespan
+from models.facility import Facility
+from models.review import Review
+from models.student import Student
+from models.study_room import StudyRoom
+from repositories.study_room_rating_repository import study_room_rating_repository
+from scripts.loadtest import percentile
+from services.auth_service import auth_service
+
+WORDS = [
+    "조용한", "넓은", "깨끗한", "밝은", "콘센트", "화이트보드", "모니터", "에어컨",
+    "의자", "책상", "소음", "환기", "창가", "스터디", "팀플", "집중", "추천", "최고",
+]
+QUERIES = ["조용한", "화이트보드", "콘센트가", "팀플 추천", "모니터", "창가 자리", "없는검색어"]
+BATCH = 5000
+
+
+def make_comment(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))[:255]
+
+
+async def seed(run_id: str, n_reviews: int, n_rooms: int) -> dict:
+    rng = random.Random(run_id)
+    # 리뷰는 (방, 학생) 당 1건이므로 방 수 x 학생 수 >= 리뷰 수
+    n_students = -(-n_reviews // n_rooms)
+    hashed = auth_service.hash_password("bench-password")
+
+    async with AsyncSessionLocal() as db:
+        facility = Facility(
+            facility_name=f"bench-{run_id} 중앙도서관",
+            facility_address="서울시 bench",
+            facility_desc="search bench",
+        )
+        db.add(facility)
+        await db.flush()
+
+        rooms = [
+            StudyRoom(
+                facility_id=facility.facility_id,
+                room_name=f"bs-{run_id}-{i}",
+                room_floor=f"{i % 5 + 1}층",
+                room_capacity=4 + i % 6,
+                room_equipment=" ".join(rng.sample(WORDS[4:8], 2)),
+            )
+            for i in range(n_rooms)
+        ]
+        db.add_all(rooms)
+        await db.flush()
+
+        student_ids = []
+        for start in range(0, n_students, BATCH):
+            res = await db.execute(
+                insert(Student).returning(Student.student_id),
+                [
+                    {
+                        "student_no": f"bs-{run_id}-{i}",
+                        "student_password": hashed,
+                        "student_name": f"bs{i}"[:10],
+                        "student_department": "bench",
+                        "student_phone": "010-0000-0000",
+                    }
+                    for i in range(start, min(start + BATCH, n_students))
+                ],
+            )
+            student_ids.extend(res.scalars().all())
+
+        pairs = ((r.room_id, s) for s in student_ids for r in rooms)
+        rows = [
+            {"room_id": room_id, "student_id": student_id, "rating": rng.randint(1, 5), "comment": make_comment(rng)}
+            for room_id, student_id in (next(pairs) for _ in range(n_reviews))
+        ]
+        for start in range(0, len(rows), BATCH):
+            await db.execute(insert(Review), rows[start:start + BATCH])
+
+        await study_room_rating_repository.recompute(db)
+        await db.commit()
+
+    return {"facility_id": facility.facility_id, "rooms": n_rooms, "students": n_students, "reviews": n_reviews}
+
+
+async def bench_query(client: httpx.AsyncClient, q: str, repeat: int, limit: int) -> dict:
+    latencies = []
+    hits = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        resp = await client.get("/api/search", params={"q": q, "limit": limit})
+        latencies.append(time.perf_counter() - started)
+        resp.raise_for_status()
+        hits = len(resp.json()["items"])
+
+    return {
+        "q": q,
+        "repeat": repeat,
+        "hits": hits,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0) * 1000, 2),
+        },
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine.echo = False
+
+    run_id = uuid.uuid4().hex[:8]
+    async with lifespan(app):
+        seeded = await seed(run_id, args.reviews, args.rooms)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 첫 요청의 커넥션/플랜 준비 비용은 제외
+            await client.get("/api/search", params={"q": QUERIES[0]})
+            results = [await bench_query(client, q, args.repeat, args.limit) for q in QUERIES]
+
+    await engine.dispose()
+
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "seeded": seeded,
+        "results": results,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="통합 검색 지연 벤치마크")
+    parser.add_argument("--reviews", type=int, default=100_000)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50, help="검색어별 반복 횟수")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--out", help="결과 JSON 파일 경로 (기본: stdout)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
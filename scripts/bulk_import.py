@@ -0,0 +1,63 @@
+# /scripts/bulk_import.py
+"""
+시설/스터디룸 대량 등록 CLI. (학생 명단은 scripts.provision_students)
+
+POST /api/admin/import/{entity} 와 같은 BulkImportService 로 파일을 스트리밍해
+DATABASE_URL 의 Postgres 에 넣고, 결과(성공/실패 건수, 실패 행)를 JSON 으로 출력한다.
+형식은 확장자(.csv / .ndjson, .jsonl)로 정하고 --format 으로 덮어쓸 수 있다.
+
+    python -m scripts.bulk_import facility facilities.csv
+    python -m scripts.bulk_import study_room rooms.ndjson --batch-size 5000
+"""
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncIterator
+
+from configs.config import settings
+from configs.db import AsyncSessionLocal, engine
+from services.bulk_import_service import IMPORT_TARGETS, bulk_import_service
+
+CHUNK_SIZE = 1 << 20
+
+
+async def read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+            yield chunk
+
+
+async def main(args: argparse.Namespace) -> dict:
+    # SQL 로그가 처리량을 떨어뜨리지 않도록 끈다.
+    engine.echo = False
+
+    async with AsyncSessionLocal() as db:
+        report = await bulk_import_service.import_stream(
+            db,
+            args.entity,
+            read_chunks(args.path),
+            fmt=args.format,
+            batch_size=args.batch_size,
+        )
+    await engine.dispose()
+    return report.model_dump()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="시설/스터디룸 대량 등록")
+    parser.add_argument("entity", choices=list(IMPORT_TARGETS))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="기본: 확장자로 판단")
+    parser.add_argument("--batch-size", type=int, default=settings.BULK_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.format is None:
+        args.format = "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
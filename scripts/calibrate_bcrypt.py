@@ -0,0 +1,31 @@
+# /scripts/calibrate_bcrypt.py
+"""
+이 호스트에서 bcrypt cost 별 해시 시간을 재고, 목표 지연(BCRYPT_TARGET_MS) 이하인 가장 큰 cost 를 고른다.
+결과의 BCRYPT_ROUNDS 를 환경변수로 배포하면, 기존 해시는 다음 로그인 성공 때 새 cost 로 다시 저장된다.
+운영과 같은 사양(같은 CPU 할당)의 호스트에서 실행할 것.
+
+    python -m scripts.calibrate_bcrypt                 # BCRYPT_TARGET_MS 기준
+    python -m scripts.calibrate_bcrypt --target-ms 100 --samples 5
+"""
+import argparse
+import json
+
+from configs.config import settings
+from services.password_hasher import MIN_ROUNDS, calibrate
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="bcrypt cost 보정")
+    parser.add_argument("--target-ms", type=float, default=settings.BCRYPT_TARGET_MS, help="해시 1회 목표 지연 (ms)")
+    parser.add_argument("--samples", type=int, default=3, help="cost 별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--min-rounds", type=int, default=10, help="이보다 낮은 cost 는 고르지 않는다")
+    parser.add_argument("--max-rounds", type=int, default=16)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = calibrate(args.target_ms, args.samples, max(MIN_ROUNDS, args.min_rounds), args.max_rounds)
+    result["current_rounds"] = settings.BCRYPT_ROUNDS
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"BCRYPT_ROUNDS={result['rounds']}")
@@ -0,0 +1,248 @@
+# /scripts/explain_indexes.py
+"""
+예약 조회 인덱스 회귀 검사.
+
+DATABASE_URL 의 Postgres 에 예약/차단 데이터를 시딩하고 ANALYZE 한 뒤,
+리포지토리 메서드를 실제로 실행하면서 나간 SQL 을 같은 파라미터로 EXPLAIN (FORMAT JSON) 해
+플랜에 기대한 인덱스가 쓰이는지 확인한다. 하나라도 빠지면 종료 코드 1.
+시딩 데이터는 지우지 않으므로 전용(버려도 되는) DB 에서 실행한다.
+
+    python -m scripts.explain_indexes --rooms 20 --days 60 --out explain.json
+"""
+import argparse
+import asyncio
+import json
+import uuid
+from datetime import date, datetime, time as dtime, timedelta
+
+from sqlalchemy import event, insert, text
+
+from configs.db import AsyncSessionLocal, engine
+from main import app, lifespan
+from models.facility import Facility
+from models.reservation import Reservation
+from models.reservation_disable import ReservationDisable
+from models.student import Student
+from models.study_room import StudyRoom
+from repositories.reservation_disable_repository import reservation_disable_repository
+from repositories.reservation_repository import reservation_repository
+from services.auth_service import auth_service
+
+BATCH = 5000
+OPEN_HOURS = range(8, 20)
+
+
+async def seed(run_id: str, n_rooms: int, n_days: int, n_students: int) -> dict:
+    hashed = auth_service.hash_password("explain-password")
+    today = date.today()
+
+    async with AsyncSessionLocal() as db:
+        facility = Facility(facility_name=f"explain-{run_id}", facility_address="explain", facility_desc="explain")
+        db.add(facility)
+        await db.flush()
+
+        rooms = [
+            StudyRoom(
+                facility_id=facility.facility_id,
+                room_name=f"ex-{run_id}-{i}",
+                room_floor="1층",
+                room_capacity=4,
+                room_equipment="whiteboard",
+            )
+            for i in range(n_rooms)
+        ]
+        db.add_all(rooms)
+        await db.flush()
+
+        res = await db.execute(
+            insert(Student).returning(Student.student_id),
+            [
+                {
+                    "student_no": f"ex-{run_id}-{i}",
+                    "student_password": hashed,
+                    "student_name": f"ex{i}"[:10],
+                    "student_department": "explain",
+                    "student_phone": "010-0000-0000",
+                }
+                for i in range(n_students)
+            ],
+        )
+        student_ids = res.scalars().all()
+
+        # 같은 날/시각의 방들은 서로 다른 학생이 잡도록 (EXCLUDE 제약), 10건 중 1건은 취소
+        reservations = []
+        disables = []
+        for d in range(n_days):
+            day = today - timedelta(days=d)
+            for r, room in enumerate(rooms):
+                student_id = student_ids[(d * n_rooms + r) % n_students]
+                for h in OPEN_HOURS:
+                    start_at = datetime.combine(day, dtime(h))
+                    reservations.append(
+                        {
+                            "student_id": student_id,
+                            "room_id": room.room_id,
+                            "facility_id": facility.facility_id,
+                            "reservation_status": "취소" if (d + r + h) % 10 == 0 else "예약완료",
+                            "reservation_date": day,
+                            "reservation_start_date": start_at,
+                            "reservation_end_date": start_at + timedelta(hours=1),
+                            "reservation_count": 1,
+                        }
+                    )
+                disables.append(
+                    {
+                        "room_id": room.room_id,
+                        "facility_id": facility.facility_id,
+                        "reason": "explain",
+                        "disable_date": day,
+                        "disable_start_at": datetime.combine(day, dtime(21)),
+                        "disable_end_at": datetime.combine(day, dtime(23)),
+                    }
+                )
+
+        for start in range(0, len(reservations), BATCH):
+            await db.execute(insert(Reservation), reservations[start:start + BATCH])
+        for start in range(0, len(disables), BATCH):
+            await db.execute(insert(ReservationDisable), disables[start:start + BATCH])
+        await db.commit()
+
+    async with engine.connect() as conn:
+        await conn.execute(text("ANALYZE reservation"))
+        await conn.execute(text("ANALYZE reservation_disable"))
+        await conn.commit()
+
+    return {
+        "facility_id": facility.facility_id,
+        "room_id": rooms[0].room_id,
+        "student_id": student_ids[0],
+        "reservations": len(reservations),
+        "disables": len(disables),
+    }
+
+
+def index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= index_names(child)
+    return names
+
+
+async def explain_call(name: str, expected: set[str], call) -> dict:
+    """call(db) 가 실행한 SQL 을 같은 파라미터로 EXPLAIN 하고, 모든 문에서 쓰인 인덱스를 모은다."""
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    async with AsyncSessionLocal() as db:
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await call(db)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        used: set[str] = set()
+        conn = await db.connection()
+        for statement, parameters in captured:
+            res = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            raw = res.scalar_one()
+            plan = json.loads(raw) if isinstance(raw, str) else raw
+            used |= index_names(plan[0]["Plan"])
+        # create_if_admitted 처럼 쓰기가 있는 호출도 흔적을 남기지 않는다
+        await db.rollback()
+
+    return {
+        "query": name,
+        "statements": len(captured),
+        "expected": sorted(expected),
+        "used": sorted(used),
+        "ok": expected <= used,
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine.echo = False
+
+    run_id = uuid.uuid4().hex[:8]
+    async with lifespan(app):
+        seeded = await seed(run_id, args.rooms, args.days, args.students)
+        room_id = seeded["room_id"]
+        student_id = seeded["student_id"]
+        day = date.today()
+        start_at = datetime.combine(day, dtime(20))
+
+        cases = [
+            (
+                "find_booked_ranges_by_room_and_date",
+                {"ix_reservation_room_date_active"},
+                lambda db: reservation_repository.find_booked_ranges_by_room_and_date(db, room_id, day),
+            ),
+            (
+                "find_ranges_by_room_and_date",
+                {"ix_reservation_disable_room_date"},
+                lambda db: reservation_disable_repository.find_ranges_by_room_and_date(db, room_id, day),
+            ),
+            (
+                "find_page_by_student_id",
+                {"ix_reservation_student_list"},
+                lambda db: reservation_repository.find_page_by_student_id(
+                    db, student_id, "all", datetime.now(), None, 20, compact=True
+                ),
+            ),
+            (
+                "sum_count_by_student_and_date",
+                {"ix_reservation_student_list"},
+                lambda db: reservation_repository.sum_count_by_student_and_date(db, student_id, day),
+            ),
+            (
+                "create_if_admitted",
+                {"ix_reservation_student_list", "ix_reservation_disable_room_date"},
+                lambda db: reservation_repository.create_if_admitted(
+                    db,
+                    student_id=student_id,
+                    room_id=room_id,
+                    facility_id=seeded["facility_id"],
+                    reservation_date=day,
+                    start_dt=start_at,
+                    end_dt=start_at + timedelta(hours=1),
+                    reservation_count=1,
+                    use_tf=True,
+                ),
+            ),
+        ]
+        results = [await explain_call(name, expected, call) for name, expected, call in cases]
+
+    await engine.dispose()
+
+    return {
+        "run_id": run_id,
+        "seeded": seeded,
+        "results": results,
+        "ok": all(r["ok"] for r in results),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="예약 조회 인덱스 EXPLAIN 회귀 검사")
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--days", type=int, default=60, help="오늘부터 과거로 시딩할 날 수")
+    parser.add_argument("--students", type=int, default=200, help="--rooms 이상이어야 함")
+    parser.add_argument("--out", help="결과 JSON 파일 경로 (기본: stdout)")
+    args = parser.parse_args()
+    if args.students < args.rooms:
+        parser.error("--students must be >= --rooms")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text_out = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text_out)
+    else:
+        print(text_out)
+    if not report["ok"]:
+        raise SystemExit(1)
@@ -0,0 +1,474 @@
+# /scripts/loadtest.py
+"""
+부하 테스트 하네스.
+
+main.py 의 FastAPI app 을 프로세스 안에서(httpx ASGITransport) 띄우고 DATABASE_URL 의 Postgres 를 그대로 사용한다.
+시설/스터디룸/학생을 시딩하고 AuthService.create_access_token 으로 JWT 를 발급한 뒤
+시나리오별 처리량, p50/p95/p99 지연, 상태코드 분포, DB 쿼리 수를 JSON 으로 출력한다.
+
+시딩 데이터는 지우지 않으므로 전용(버려도 되는) DB 에서 실행한다.
+
+    python -m scripts.loadtest --students 200 --rooms 5 --requests 500 --concurrency 100 --out result.json
+    python -m scripts.loadtest --scenarios booking_rush,login_storm
+    python -m scripts.loadtest --scenarios login_isolation --requests 1000 --concurrency 200
+
+login_isolation 은 부하 없는 상태와 login_storm 진행 중에 room_listing 을 순차 호출해
+bcrypt 포화가 다른 API 지연에 번지는지 비교한다.
+
+login_storm 은 한 IP 에서 같은 학번들로 로그인하므로, 로그인 제한이 켜져 있으면 대부분 429 로 끝나
+bcrypt 가 아니라 제한기를 재게 된다. 그래서 기본은 --login-throttle off (LOGIN_THROTTLE_ENABLED=false 와 같음).
+제한기 자체를 재려면 --login-throttle on. 어느 쪽이든 429 건수는 결과의 "throttled" 로 따로 나온다.
+
+overlap_race 는 서로 다른 학생들이 같은 방/같은 시간을 동시에 예약한다.
+API 경로(프로세스 내 대기열 포함)와, 대기열 없이 세션마다 create_if_admitted 를 바로 부르는 경로
+(워커가 여러 개인 상황, EXCLUDE 제약만으로 막히는지) 를 각각 돌려 성공이 정확히 1건인지 확인한다.
+어느 쪽이든 1건이 아니면 결과의 "ok" 가 false 이고 종료 코드 1 로 끝난다.
+
+me_full / me_compact 는 같은 학생들의 /api/reservations/me 를 view=full / view=compact 로 조회한다.
+결과의 response_bytes_avg 로 응답 크기를, db_queries_per_request 로 쿼리 수를 비교한다.
+
+availability_hit / availability_miss 는 같은 (방, 날짜) 조합을 조회한다.
+hit 는 미리 한 번씩 불러 캐시를 채운 뒤 재고, miss 는 요청마다 그 키를 무효화해 DB 에서 다시 계산하게 한다.
+
+facility_overview 는 요청당 SQL 문 수가 QUERY_BUDGET(1) 을 넘으면 "ok": false (방 수에 비례해 쿼리가 늘면 실패).
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, time as dtime, timedelta
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from configs.db import AsyncSessionLocal, engine
+from main import app, lifespan
+from models.facility import Facility
+from models.student import Student
+from models.reservation import ROOM_OVERLAP_CONSTRAINT, STUDENT_OVERLAP_CONSTRAINT
+from models.study_room import StudyRoom
+from configs.config import settings
+from repositories.reservation_repository import reservation_repository
+from services.auth_service import auth_service
+from services.availability_service import availability_service, booking_window
+from services.login_throttle import login_throttle
+from services.password_hasher import password_hasher
+
+PASSWORD = "loadtest-password"
+SCENARIOS = (
+    "booking_rush",
+    "me_browsing",
+    "me_full",
+    "me_compact",
+    "room_listing",
+    "availability_hit",
+    "availability_miss",
+    "facility_overview",
+    "login_storm",
+    "login_isolation",
+    "overlap_race",
+)
+# 요청당 SQL 문 수 상한 (넘으면 결과 "ok": false)
+QUERY_BUDGET = {"facility_overview": 1}
+ISOLATION_PROBES = 50
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수를 센다."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    return {
+        "p50": round(percentile(latencies, 50) * 1000, 2),
+        "p95": round(percentile(latencies, 95) * 1000, 2),
+        "p99": round(percentile(latencies, 99) * 1000, 2),
+        "max": round(max(latencies, default=0) * 1000, 2),
+    }
+
+
+async def seed(run_id: str, n_students: int, n_rooms: int) -> dict:
+    hashed = auth_service.hash_password(PASSWORD)  # 전원 같은 비밀번호, 해시는 한 번만
+    async with AsyncSessionLocal() as db:
+        facility = Facility(
+            facility_name=f"loadtest-{run_id}",
+            facility_address="loadtest",
+            facility_desc="loadtest",
+        )
+        db.add(facility)
+        await db.flush()
+
+        rooms = [
+            StudyRoom(
+                facility_id=facility.facility_id,
+                room_name=f"lt-{run_id}-{i}",
+                room_floor=f"{i % 3 + 1}층",
+                room_capacity=4 + i % 4,
+                room_equipment="whiteboard",
+            )
+            for i in range(n_rooms)
+        ]
+        students = [
+            Student(
+                student_no=f"lt-{run_id}-{i}",
+                student_password=hashed,
+                student_name=f"lt{i}"[:10],
+                student_department="loadtest",
+                student_phone="010-0000-0000",
+            )
+            for i in range(n_students)
+        ]
+        db.add_all(rooms + students)
+        await db.commit()
+
+        return {
+            "facility_id": facility.facility_id,
+            "room_ids": [r.room_id for r in rooms],
+            "students": [(s.student_id, s.student_no) for s in students],
+        }
+
+
+async def run_scenario(name: str, counter: QueryCounter, make_request, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+    response_bytes: list[int] = []
+
+    async def one(i: int):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                resp = await make_request(i)
+                statuses[str(resp.status_code)] += 1
+                response_bytes.append(len(resp.content))
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+    queries = counter.count - queries_before
+
+    return {
+        "scenario": name,
+        "requests": total,
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "latency_ms": latency_summary(latencies),
+        "status": dict(statuses),
+        # 로그인 제한/과부하 거절 (성공/실패 지연과 섞이지 않게 따로)
+        "throttled": statuses.get("429", 0),
+        "db_queries": queries,
+        "db_queries_per_request": round(queries / total, 2) if total else None,
+        # 응답 본문 크기 (compact/full 비교용)
+        "response_bytes_avg": round(sum(response_bytes) / len(response_bytes), 1) if response_bytes else None,
+        "response_bytes_total": sum(response_bytes),
+    }
+
+
+async def run_isolation(counter: QueryCounter, scenarios: dict, total: int, concurrency: int) -> dict:
+    """login_storm 이 bcrypt executor 를 포화시키는 동안 room_listing 지연이 기준치와 비슷하게 유지되는지"""
+
+    async def probe() -> list[float]:
+        latencies = []
+        for i in range(ISOLATION_PROBES):
+            started = time.perf_counter()
+            await scenarios["room_listing"](i)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    baseline = await probe()
+    storm = asyncio.create_task(run_scenario("login_storm", counter, scenarios["login_storm"], total, concurrency))
+    await asyncio.sleep(0.1)  # 로그인 요청이 먼저 쌓이도록
+    under_load = await probe()
+    logins = await storm
+
+    return {
+        "scenario": "login_isolation",
+        "probe_requests": ISOLATION_PROBES,
+        "baseline_probe_latency_ms": latency_summary(baseline),
+        "under_login_load_probe_latency_ms": latency_summary(under_load),
+        "login_storm": logins,
+        "password_hasher": password_hasher.snapshot(),
+        "login_throttle": login_throttle.snapshot(),
+    }
+
+
+async def run_overlap_race(client: httpx.AsyncClient, seeded: dict, tokens: dict[int, str], total: int, concurrency: int) -> dict:
+    """같은 방/시간을 여러 학생이 동시에 예약할 때 성공이 정확히 1건인지 (API 경로, DB 제약 단독)"""
+    students = seeded["students"][:total]
+    room_id = seeded["room_ids"][0]
+    facility_id = seeded["facility_id"]
+    # booking_rush(오늘 + 7일)와 겹치지 않는 날
+    race_date = date.today() + timedelta(days=6)
+    api_start = datetime.combine(race_date, dtime(9))
+    db_start = datetime.combine(race_date, dtime(11))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def api_one(student_id: int) -> str:
+        async with semaphore:
+            resp = await client.post(
+                "/api/reservations",
+                headers={"Authorization": f"Bearer {tokens[student_id]}"},
+                json={
+                    "facility_id": facility_id,
+                    "room_id": room_id,
+                    "reservation_date": race_date.isoformat(),
+                    "reservation_start_date": api_start.isoformat(),
+                    "reservation_end_date": (api_start + timedelta(hours=1)).isoformat(),
+                },
+            )
+            return str(resp.status_code)
+
+    async def db_one(student_id: int) -> str:
+        # 프로세스 내 대기열(slot_admission) 없이 세션마다 바로 INSERT
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                try:
+                    admission = await reservation_repository.create_if_admitted(
+                        db,
+                        student_id=student_id,
+                        room_id=room_id,
+                        facility_id=facility_id,
+                        reservation_date=race_date,
+                        start_dt=db_start,
+                        end_dt=db_start + timedelta(hours=1),
+                        reservation_count=1,
+                        use_tf=True,
+                    )
+                    if admission.reservation_id is None:
+                        return "rejected"
+                    await db.commit()
+                    return "created"
+                except IntegrityError as e:
+                    await db.rollback()
+                    if ROOM_OVERLAP_CONSTRAINT in str(e.orig):
+                        return ROOM_OVERLAP_CONSTRAINT
+                    if STUDENT_OVERLAP_CONSTRAINT in str(e.orig):
+                        return STUDENT_OVERLAP_CONSTRAINT
+                    return "integrity_error"
+
+    async def race(one) -> dict:
+        started = time.perf_counter()
+        outcomes = Counter(await asyncio.gather(*(one(sid) for sid, _ in students)))
+        elapsed = time.perf_counter() - started
+        return {
+            "elapsed_seconds": round(elapsed, 4),
+            "throughput_rps": round(len(students) / elapsed, 2) if elapsed else None,
+            "outcomes": dict(outcomes),
+        }
+
+    api = await race(api_one)
+    api["successes"] = sum(n for status, n in api["outcomes"].items() if status.startswith("2"))
+    db_only = await race(db_one)
+    db_only["successes"] = db_only["outcomes"].get("created", 0)
+
+    return {
+        "scenario": "overlap_race",
+        "contenders": len(students),
+        "concurrency": concurrency,
+        "api": api,
+        "db_constraint": db_only,
+        "ok": api["successes"] == 1 and db_only["successes"] == 1,
+    }
+
+
+def build_scenarios(client: httpx.AsyncClient, seeded: dict, tokens: dict[int, str]) -> dict:
+    students = seeded["students"]
+    room_ids = seeded["room_ids"]
+    # 예약 창이 새로 열리는 날(오늘 + 7일)에 몰리는 상황
+    rush_date = date.today() + timedelta(days=7)
+
+    def auth(student_id: int) -> dict:
+        return {"Authorization": f"Bearer {tokens[student_id]}"}
+
+    async def booking_rush(i: int):
+        student_id, _ = students[i % len(students)]
+        room_id = room_ids[i % len(room_ids)]
+        hour = 9 + (i // len(room_ids)) % 12
+        start_at = datetime.combine(rush_date, dtime(hour))
+        return await client.post(
+            "/api/reservations",
+            headers=auth(student_id),
+            json={
+                "facility_id": seeded["facility_id"],
+                "room_id": room_id,
+                "reservation_date": rush_date.isoformat(),
+                "reservation_start_date": start_at.isoformat(),
+                "reservation_end_date": (start_at + timedelta(hours=1)).isoformat(),
+            },
+        )
+
+    async def me_browsing(i: int):
+        student_id, _ = random.choice(students)
+        params = {"view": "compact"} if i % 2 else {}
+        return await client.get("/api/reservations/me", headers=auth(student_id), params=params)
+
+    # full/compact 비교는 같은 학생 순서로 (booking_rush 로 예약이 생긴 학생부터)
+    async def me_full(i: int):
+        student_id, _ = students[i % len(students)]
+        return await client.get("/api/reservations/me", headers=auth(student_id))
+
+    async def me_compact(i: int):
+        student_id, _ = students[i % len(students)]
+        return await client.get("/api/reservations/me", headers=auth(student_id), params={"view": "compact"})
+
+    async def room_listing(i: int):
+        return await client.get("/api/study-rooms", params={"facilityId": seeded["facility_id"]})
+
+    # 가용 시간 캐시 키: 시딩한 방 x 예약 가능 날짜 (hit 는 미리 채우고, miss 는 매번 비운다)
+    first_day, last_day = booking_window()
+    availability_keys = [
+        (room_id, first_day + timedelta(days=d))
+        for d in range((last_day - first_day).days + 1)
+        for room_id in room_ids
+    ]
+
+    async def get_availability(room_id: int, day: date):
+        return await client.get(f"/api/study-rooms/{room_id}/availability", params={"date": day.isoformat()})
+
+    async def availability_hit(i: int):
+        return await get_availability(*availability_keys[i % len(availability_keys)])
+
+    async def availability_miss(i: int):
+        room_id, day = availability_keys[i % len(availability_keys)]
+        availability_service.invalidate(room_id, day)
+        return await get_availability(room_id, day)
+
+    async def warm_availability():
+        for key in availability_keys:
+            await get_availability(*key)
+
+    async def facility_overview(i: int):
+        return await client.get(f"/api/facilities/{seeded['facility_id']}/overview")
+
+    async def login_storm(i: int):
+        _, student_no = students[i % len(students)]
+        # 10건 중 1건은 틀린 비밀번호
+        password = PASSWORD if i % 10 else "wrong-password"
+        return await client.post("/auth/login", json={"student_no": student_no, "student_password": password})
+
+    return {
+        "booking_rush": booking_rush,
+        "me_browsing": me_browsing,
+        "me_full": me_full,
+        "me_compact": me_compact,
+        "room_listing": room_listing,
+        "availability_hit": availability_hit,
+        "availability_miss": availability_miss,
+        "warm_availability": warm_availability,
+        "facility_overview": facility_overview,
+        "login_storm": login_storm,
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    # SQL 로그가 지연 측정을 왜곡하지 않도록 끈다.
+    engine.echo = False
+    settings.LOGIN_THROTTLE_ENABLED = args.login_throttle == "on"
+
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    run_id = uuid.uuid4().hex[:8]
+    async with lifespan(app):
+        seeded = await seed(run_id, args.students, args.rooms)
+        tokens = {sid: auth_service.create_access_token(sid) for sid, _ in seeded["students"]}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            scenarios = build_scenarios(client, seeded, tokens)
+            results = []
+            for name in args.scenarios:
+                if name == "login_isolation":
+                    results.append(await run_isolation(counter, scenarios, args.requests, args.concurrency))
+                    continue
+                if name == "availability_hit":
+                    await scenarios["warm_availability"]()
+                if name == "overlap_race":
+                    results.append(await run_overlap_race(client, seeded, tokens, args.requests, args.concurrency))
+                    continue
+                result = await run_scenario(name, counter, scenarios[name], args.requests, args.concurrency)
+                if name == "login_storm":
+                    result["login_throttle"] = login_throttle.snapshot()
+                if name in QUERY_BUDGET:
+                    result["db_query_budget"] = QUERY_BUDGET[name]
+                    result["ok"] = result["db_queries"] <= QUERY_BUDGET[name] * args.requests
+                results.append(result)
+
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    await engine.dispose()
+
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "students": args.students,
+            "rooms": args.rooms,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "login_throttle": args.login_throttle,
+        },
+        "results": results,
+        "ok": all(r.get("ok", True) for r in results),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="스터디룸 예약 API 부하 테스트")
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument(
+        "--scenarios",
+        type=lambda v: [x.strip() for x in v.split(",") if x.strip()],
+        default=list(SCENARIOS),
+        help=f"쉼표 구분 ({', '.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--login-throttle",
+        choices=["off", "on"],
+        default="off",
+        help="로그인 제한 (off: bcrypt 부하 측정, on: 제한기 동작 측정)",
+    )
+    parser.add_argument("--out", help="결과 JSON 파일 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    unknown = [s for s in args.scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if not report["ok"]:
+        raise SystemExit(1)
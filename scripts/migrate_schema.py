@@ -0,0 +1,189 @@
+# /scripts/migrate_schema.py
+"""
+기존 DB 스키마를 모델에 맞춘다. 여러 번 실행해도 된다.
+
+create_all 은 없는 테이블만 만들기 때문에, 이미 운영 중인 DB 에는 나중에 추가된 제약이 없다.
+앱은 시작할 때 configs.schema.REQUIRED_CONSTRAINTS 가 모두 있는지 확인하고, 없으면 뜨지 않는다.
+
+1) 필요한 확장(btree_gist, pg_trgm) 과 새 테이블 생성
+2) 예약완료 상태에서 시간이 겹치는 예약(같은 방 또는 같은 학생)을 reservation_id 가 작은 것만 남기고 '취소' 처리
+3) 같은 (room_id, student_id) 리뷰는 review_id 가 가장 작은 것(앱이 ON CONFLICT DO NOTHING 으로 남기는 쪽)만 남기고 삭제,
+   방별 평점 집계(study_room_rating) 재계산
+4) 없는 제약(EXCLUDE, UNIQUE) 추가
+5) 모델에 선언된 인덱스 중 없는 것 생성, 더 이상 쓰지 않는 인덱스 삭제
+
+전부 한 트랜잭션이다. --dry-run 이면 끝까지 실행해 결과를 보고한 뒤 롤백한다.
+변경 내역(취소한 예약 ID 등)은 JSON 으로 출력하므로 보관해 둘 것.
+
+    python -m scripts.migrate_schema --dry-run
+    python -m scripts.migrate_schema
+"""
+import argparse
+import asyncio
+import json
+from datetime import date
+
+from sqlalchemy import and_, delete, inspect, or_, select, text, update
+from sqlalchemy.orm import aliased
+from sqlalchemy.schema import AddConstraint
+
+import models  # noqa: F401  (모든 테이블을 metadata 에 등록)
+from configs.db import AsyncSessionLocal, Base, engine
+from configs.schema import REQUIRED_CONSTRAINTS, find_missing_constraints, verify_schema
+from models.reservation import Reservation
+from models.review import Review
+from repositories.study_room_rating_repository import study_room_rating_repository
+
+EXTENSIONS = ("btree_gist", "pg_trgm")
+# 모델에서 빠진 인덱스 (ix_reservation_student_date_active: ix_reservation_student_list 와 EXCLUDE gist 가 대신함)
+DROPPED_INDEXES = ("ix_reservation_student_date_active",)
+
+
+def overlaps(a_start, a_end, b_start, b_end) -> bool:
+    return a_start < b_end and a_end > b_start
+
+
+async def cancel_overlapping_reservations(conn) -> list[int]:
+    """
+    예약완료끼리 겹치는 예약 중 먼저 만들어진(reservation_id 가 작은) 것을 남기고 나머지를 취소한다.
+    겹침에 걸린 행만 id 순으로 보며 이미 남긴 행과 겹치는지 확인한다 (겹침이 없는 행은 영향이 없다).
+    """
+    other = aliased(Reservation)
+    active = Reservation.reservation_status == "예약완료"
+    stmt = (
+        select(
+            Reservation.reservation_id,
+            Reservation.room_id,
+            Reservation.student_id,
+            Reservation.reservation_start_date,
+            Reservation.reservation_end_date,
+        )
+        .where(active)
+        .where(
+            select(other.reservation_id)
+            .where(other.reservation_status == "예약완료")
+            .where(other.reservation_id != Reservation.reservation_id)
+            .where(or_(other.room_id == Reservation.room_id, other.student_id == Reservation.student_id))
+            .where(
+                and_(
+                    other.reservation_start_date < Reservation.reservation_end_date,
+                    other.reservation_end_date > Reservation.reservation_start_date,
+                )
+            )
+            .exists()
+        )
+        .order_by(Reservation.reservation_id)
+    )
+    rows = (await conn.execute(stmt)).all()
+
+    kept_by_room: dict[int, list] = {}
+    kept_by_student: dict[int, list] = {}
+    cancelled: list[int] = []
+    for row in rows:
+        ranges = kept_by_room.get(row.room_id, []) + kept_by_student.get(row.student_id, [])
+        if any(overlaps(row.reservation_start_date, row.reservation_end_date, s, e) for s, e in ranges):
+            cancelled.append(row.reservation_id)
+            continue
+        span = (row.reservation_start_date, row.reservation_end_date)
+        kept_by_room.setdefault(row.room_id, []).append(span)
+        kept_by_student.setdefault(row.student_id, []).append(span)
+
+    if cancelled:
+        await conn.execute(
+            update(Reservation)
+            .where(Reservation.reservation_id.in_(cancelled))
+            .values(reservation_status="취소", cancel_date=date.today())
+        )
+    return cancelled
+
+
+async def delete_duplicate_reviews(conn) -> list[int]:
+    """(room_id, student_id) 마다 review_id 가 가장 작은 리뷰만 남긴다."""
+    older = aliased(Review)
+    res = await conn.execute(
+        delete(Review)
+        .where(
+            select(older.review_id)
+            .where(older.room_id == Review.room_id)
+            .where(older.student_id == Review.student_id)
+            .where(older.review_id < Review.review_id)
+            .exists()
+        )
+        .returning(Review.review_id)
+    )
+    return sorted(res.scalars().all())
+
+
+def create_missing_indexes(sync_conn) -> list[str]:
+    inspector = inspect(sync_conn)
+    created = []
+    for table in Base.metadata.sorted_tables:
+        existing = {i["name"] for i in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            if index.name not in existing:
+                index.create(sync_conn)
+                created.append(index.name)
+    return created
+
+
+async def add_missing_constraints(conn) -> list[str]:
+    missing = set(await find_missing_constraints(conn))
+    added = []
+    for table_name, name in REQUIRED_CONSTRAINTS:
+        if f"{table_name}.{name}" not in missing:
+            continue
+        table = Base.metadata.tables[table_name]
+        constraint = next(c for c in table.constraints if c.name == name)
+        await conn.execute(AddConstraint(constraint))
+        added.append(f"{table_name}.{name}")
+    return added
+
+
+async def main(args: argparse.Namespace) -> dict:
+    engine.echo = False
+
+    async with AsyncSessionLocal() as db:
+        conn = await db.connection()
+        for ext in EXTENSIONS:
+            await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {ext}"))
+        await conn.run_sync(Base.metadata.create_all)
+
+        missing_before = await find_missing_constraints(conn)
+        report = {"dry_run": args.dry_run, "missing_before": missing_before}
+
+        # 제약을 걸기 전에 위반 행부터 정리 (제약이 이미 있는 테이블은 위반 행도 있을 수 없다)
+        missing_tables = {name.split(".")[0] for name in missing_before}
+        report["cancelled_overlapping_reservations"] = (
+            await cancel_overlapping_reservations(conn) if "reservation" in missing_tables else []
+        )
+        duplicate_reviews = await delete_duplicate_reviews(conn) if "review" in missing_tables else []
+        report["deleted_duplicate_reviews"] = duplicate_reviews
+        if duplicate_reviews:
+            report["recomputed_room_ratings"] = await study_room_rating_repository.recompute(db)
+        report["added_constraints"] = await add_missing_constraints(conn)
+
+        for name in DROPPED_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        report["dropped_indexes"] = list(DROPPED_INDEXES)
+        report["created_indexes"] = await conn.run_sync(create_missing_indexes)
+        await verify_schema(conn)
+
+        if args.dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+
+    await engine.dispose()
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="기존 DB 스키마를 모델에 맞춤 (제약 추가, 위반 행 정리)")
+    parser.add_argument("--dry-run", action="store_true", help="실행 후 롤백하고 결과만 보고")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
@@ -0,0 +1,56 @@
+# /scripts/provision_students.py
+"""
+학기 학생 명단 일괄 등록 CLI.
+
+POST /api/admin/students/provision 과 같은 StudentProvisioningService 로 명단 파일을 스트리밍해
+DATABASE_URL 의 Postgres 에 넣고, created/skipped/failed 건수와 실패 행을 JSON 으로 출력한다.
+컬럼은 StudentCreate 와 같다 (student_no, student_password, student_name, student_department, student_phone).
+
+    python -m scripts.provision_students students.csv
+    python -m scripts.provision_students students.ndjson --batch-size 2000
+"""
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from configs.config import settings
+from configs.db import AsyncSessionLocal, engine
+from scripts.bulk_import import read_chunks
+from services.student_provisioning_service import student_provisioning_service
+
+
+async def main(args: argparse.Namespace) -> dict:
+    # SQL 로그가 처리량을 떨어뜨리지 않도록 끈다.
+    engine.echo = False
+
+    try:
+        async with AsyncSessionLocal() as db:
+            report = await student_provisioning_service.provision_stream(
+                db,
+                read_chunks(args.path),
+                fmt=args.format,
+                batch_size=args.batch_size,
+            )
+    finally:
+        student_provisioning_service.shutdown()
+        await engine.dispose()
+    return report.model_dump()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="학기 학생 명단 일괄 등록")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="기본: 확장자로 판단")
+    parser.add_argument("--batch-size", type=int, default=settings.BULK_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.format is None:
+        args.format = "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
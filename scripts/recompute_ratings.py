@@ -0,0 +1,30 @@
+# /scripts/recompute_ratings.py
+"""
+스터디룸 리뷰 집계(study_room_rating)를 review 테이블 기준으로 다시 계산한다.
+증분 갱신이 어긋났을 때(수동 데이터 수정, 장애 등) 복구용.
+
+    python -m scripts.recompute_ratings            # 전체 방
+    python -m scripts.recompute_ratings --room-id 3
+"""
+import argparse
+import asyncio
+
+from configs.db import AsyncSessionLocal, engine
+from repositories.study_room_rating_repository import study_room_rating_repository
+
+
+async def main(room_id: int | None) -> int:
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            count = await study_room_rating_repository.recompute(db, room_id)
+    await engine.dispose()
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스터디룸 리뷰 집계 재계산")
+    parser.add_argument("--room-id", type=int, default=None, help="특정 방만 재계산")
+    args = parser.parse_args()
+
+    count = asyncio.run(main(args.room_id))
+    print(f"recomputed {count} room(s)")
@@ -3,86 +3,147 @@ from datetime import datetime, timedelta, timezone
 
 import bcrypt
 import jwt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession # AsyncSession으로 변경
 from fastapi import HTTPException, status
 from dotenv import load_dotenv
 
 from repositories.student_repository import student_repository
+from services.password_hasher import password_hasher
+from services.principal_cache import Principal, principal_cache
+from services.token_cache import verified_token_cache
+from services.login_throttle import login_throttle
+from configs.config import settings
 from models.student import Student
 from schemas.student import StudentCreate, StudentLogin
 
 load_dotenv()
+# 무상태 모드에서 Principal 을 만들 때 필요한 토큰 클레임 -> Principal 필드
+PROFILE_CLAIMS = {"no": "student_no", "name": "student_name", "dept": "student_department"}
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "30"))
 
 class AuthService:
+    # 동기 버전은 스크립트(시딩 등)용, API 요청 경로에서는 password_hasher 를 await 한다.
     def hash_password(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
 
     def verify_password(self, student_password: str, hashed: str) -> bool:
         return bcrypt.checkpw(student_password.encode("utf-8"), hashed.encode("utf-8"))
 
     # async 추가
     async def signup(self, db: AsyncSession, data: StudentCreate):
-        async with db.begin(): # async with로 변경
-            # 1. 학번 중복 검사 (await 추가)
+        # 1. 학번 중복 검사 (짧은 트랜잭션, 해시 전에 끝내 커넥션을 풀에 돌려준다)
+        async with db.begin():
             existing_student = await student_repository.find_by_student_no(db, data.student_no)
-            if existing_student:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="이미 등록된 학번입니다.",
-                )
-
-            # 2. 비밀번호 해싱
-            hashed_password = self.hash_password(data.student_password)
-
-            # 3. 사용자 저장
-            new_student = Student(
-                student_no=data.student_no,
-                student_password=hashed_password,
-                student_name=data.student_name,
-                student_department=data.student_department,
-                student_phone=data.student_phone
+        if existing_student:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 등록된 학번입니다.",
+            )
+
+        # 2. 비밀번호 해싱 (executor 에서, 트랜잭션/커넥션을 잡지 않은 채로)
+        hashed_password = await password_hasher.hash(data.student_password)
+
+        # 3. 사용자 저장 (두 번째 짧은 트랜잭션)
+        #    해시하는 사이 같은 학번이 먼저 가입했으면 student_no UNIQUE 위반으로 409
+        new_student = Student(
+            student_no=data.student_no,
+            student_password=hashed_password,
+            student_name=data.student_name,
+            student_department=data.student_department,
+            student_phone=data.student_phone
+        )
+        try:
+            async with db.begin():
+                await student_repository.save(db, new_student) # await 추가
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 등록된 학번입니다.",
             )
-            await student_repository.save(db, new_student) # await 추가
 
         # db.refresh는 필요 시 비동기로 호출 (보통 save 내부에 flush가 있으면 생략 가능)
         return new_student
-    
+
     # async 추가
-    async def login(self, db: AsyncSession, data: StudentLogin) -> str:
+    async def login(self, db: AsyncSession, data: StudentLogin, client_ip: str | None = None) -> str:
+        # 0. 학번/IP 별 시도 제한 + 연속 실패 백오프 (막히면 429)
+        throttle_keys = login_throttle.keys(data.student_no, client_ip)
+        login_throttle.check(throttle_keys)
+
         # 1. 학번으로 사용자 조회 (await 추가)
         student = await student_repository.find_by_student_no(db, data.student_no)
         if not student:
+            login_throttle.record_failure(throttle_keys)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="학번 또는 비밀번호가 올바르지 않습니다.",
             )
 
-        # 2. 비밀번호 검증
-        if not self.verify_password(data.student_password, student.student_password):
+        # 2. 비밀번호 검증 (executor 에서, 이벤트 루프를 막지 않음 / 동시 bcrypt 상한 초과 시 429)
+        #    저장된 해시 cost 가 BCRYPT_ROUNDS 와 다르면 같은 구간 안에서 새 cost 로 다시 해시한다
+        #    (일괄 초기화 없이 cost 변경, rehash 도 동시 bcrypt 상한에 포함)
+        new_hash = None
+        with login_throttle.verification():
+            verified = await password_hasher.verify(data.student_password, student.student_password)
+            if verified:
+                new_hash = await password_hasher.rehash_if_needed(data.student_password, student.student_password)
+        if not verified:
+            login_throttle.record_failure(throttle_keys)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="학번 또는 비밀번호가 올바르지 않습니다.",
             )
+        login_throttle.record_success(throttle_keys)
+
+        # 2-1. 새 cost 해시 저장
+        if new_hash is not None:
+            student.student_password = new_hash
+            await db.commit()
 
         # 3. JWT 토큰 생성
-        access_token = self.create_access_token(student.student_id)
+        access_token = self.create_access_token(student.student_id, student)
         return access_token
 
-    def create_access_token(self, student_id: int) -> str:
+    def create_access_token(self, student_id: int, student: Student | None = None) -> str:
         expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRE_MINUTES)
         payload = {
             "sub": str(student_id),
             "exp": expire,
         }
+        if student is not None and settings.AUTH_STATELESS:
+            # 무상태 모드에서만 프로필 클레임을 넣는다 (기본 모드 토큰에는 개인정보를 싣지 않음, 연락처는 항상 제외)
+            payload.update({claim: getattr(student, field) for claim, field in PROFILE_CLAIMS.items()})
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
+    def decode_token(self, token: str) -> dict:
+        # 검증된 클레임 캐시 (exp 까지 유효), 미스일 때만 서명 검증
+        claims = verified_token_cache.get(token)
+        if claims is None:
+            claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            verified_token_cache.put(token, claims)
+        return claims
+
+    async def get_student(self, db: AsyncSession, student_id: int) -> Student:
+        student = await student_repository.find_by_id(db, student_id)
+        if not student:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="학생을 찾을 수 없습니다.",
+            )
+        return student
+
     # async 추가
-    async def get_current_user(self, db: AsyncSession, token: str) -> Student:
+    async def get_current_user(self, db: AsyncSession, token: str) -> Principal:
+        # 캐시 적중이면 JWT 디코드와 DB 조회(커넥션 획득) 모두 생략
+        cached = principal_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = self.decode_token(token)
             student_id_str = payload.get("sub")
             if student_id_str is None:
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰입니다.")
@@ -93,14 +154,16 @@ class AuthService:
                 detail="토큰이 만료되었거나 유효하지 않습니다.",
             )
 
-        # await 추가
-        student = await student_repository.find_by_id(db, student_id)
-        if not student:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="학생을 찾을 수 없습니다.",
+        if settings.AUTH_STATELESS and all(claim in payload for claim in PROFILE_CLAIMS):
+            # 무상태 모드: 필요한 정보를 토큰 클레임에서 바로
+            principal = Principal(
+                student_id=student_id,
+                **{field: payload[claim] for claim, field in PROFILE_CLAIMS.items()},
             )
+        else:
+            principal = Principal.from_student(await self.get_student(db, student_id))
 
-        return student
+        principal_cache.put(token, principal, payload.get("exp"))
+        return principal
 
 auth_service = AuthService()
@@ -0,0 +1,212 @@
+# /services/availability_service.py
+import hashlib
+import time as clock
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.config import settings
+from repositories.reservation_repository import reservation_repository
+from repositories.reservation_disable_repository import reservation_disable_repository
+from repositories.study_room_repository import study_room_repository
+from repositories.facility_repository import facility_repository
+from schemas.facility import FacilityAvailabilityResponse, FacilityAvailabilityRoom
+from schemas.study_room import StudyRoomAvailabilityResponse, StudyRoomAvailabilitySlot
+
+HOURS_PER_DAY = 24
+FULL_DAY_MASK = (1 << HOURS_PER_DAY) - 1
+# 예약 가능 기간: 오늘 ~ 오늘+7일 (조회/캐시도 이 범위만)
+BOOKING_WINDOW_DAYS = 7
+
+
+def booking_window(today: date | None = None) -> tuple[date, date]:
+    today = today or date.today()
+    return today, today + timedelta(days=BOOKING_WINDOW_DAYS)
+
+
+def check_in_window(target_date: date) -> None:
+    first, last = booking_window()
+    if target_date < first or target_date > last:
+        raise HTTPException(status_code=400, detail="조회는 오늘부터 최대 7일 이내 날짜만 가능합니다.")
+
+
+def hours_mask(day: date, start_at: datetime, end_at: datetime) -> int:
+    """[start_at, end_at) 구간이 걸치는 시간대를 24비트 마스크로 변환 (bit i = i시~i+1시)"""
+    day_start = datetime.combine(day, time.min)
+    start_at = max(start_at, day_start)
+    end_at = min(end_at, day_start + timedelta(days=1))
+    if end_at <= start_at:
+        return 0
+
+    first = int((start_at - day_start).total_seconds()) // 3600
+    last = -(-int((end_at - day_start).total_seconds()) // 3600)  # 올림
+    return ((1 << last) - 1) ^ ((1 << first) - 1)
+
+
+class AvailabilityService:
+    """
+    (room_id, date) 단위로 예약/차단 시간을 비트맵으로 보관한다.
+    예약 생성/취소 시 해당 비트만 갱신하고, TTL이 지나면 DB에서 다시 만든다.
+    날짜는 예약 가능 기간 안만 받고, 두 캐시 모두 max_entries 를 넘으면 오래 안 쓴 항목부터 버린다.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # (room_id, date) -> (reserved_mask, blocked_mask, loaded_at)
+        self._masks: OrderedDict[tuple[int, date], tuple[int, int, float]] = OrderedDict()
+        # (facility_id, from_date, days) -> (grid, etag, room_ids, loaded_at)
+        self._grids: OrderedDict[
+            tuple[int, date, int], tuple[FacilityAvailabilityResponse, str, frozenset[int], float]
+        ] = OrderedDict()
+
+    async def get_masks(self, db: AsyncSession, room_id: int, target_date: date) -> tuple[int, int]:
+        key = (room_id, target_date)
+        cached = self._masks.get(key)
+        if cached and clock.monotonic() - cached[2] < self.ttl_seconds:
+            self._masks.move_to_end(key)
+            return cached[0], cached[1]
+
+        reserved = 0
+        for start_at, end_at in await reservation_repository.find_booked_ranges_by_room_and_date(db, room_id, target_date):
+            reserved |= hours_mask(target_date, start_at, end_at)
+
+        blocked = 0
+        for start_at, end_at in await reservation_disable_repository.find_ranges_by_room_and_date(db, room_id, target_date):
+            blocked |= hours_mask(target_date, start_at, end_at)
+
+        self._masks[key] = (reserved, blocked, clock.monotonic())
+        self._masks.move_to_end(key)
+        self._prune()
+        return reserved, blocked
+
+    async def availability(self, db: AsyncSession, room_id: int, target_date: date) -> StudyRoomAvailabilityResponse:
+        check_in_window(target_date)
+        # 캐시 적중 여부와 관계없이 방 존재 확인 (PK 조회)
+        if not await study_room_repository.find_by_id(db, room_id):
+            raise ValueError(f"StudyRoom not found. id={room_id}")
+
+        reserved, blocked = await self.get_masks(db, room_id, target_date)
+        available = FULL_DAY_MASK & ~(reserved | blocked)
+
+        day_start = datetime.combine(target_date, time.min)
+        slots = []
+        for hour in range(HOURS_PER_DAY):
+            bit = 1 << hour
+            if blocked & bit:
+                slot_status = "blocked"
+            elif reserved & bit:
+                slot_status = "reserved"
+            else:
+                slot_status = "available"
+            slots.append(
+                StudyRoomAvailabilitySlot(
+                    hour=hour,
+                    start_at=day_start + timedelta(hours=hour),
+                    end_at=day_start + timedelta(hours=hour + 1),
+                    status=slot_status,
+                )
+            )
+
+        return StudyRoomAvailabilityResponse(
+            room_id=room_id,
+            date=target_date,
+            reserved_mask=reserved,
+            blocked_mask=blocked,
+            available_mask=available,
+            slots=slots,
+        )
+
+    async def facility_grid(
+        self,
+        db: AsyncSession,
+        facility_id: int,
+        from_date: date,
+        days: int,
+    ) -> tuple[FacilityAvailabilityResponse, str]:
+        """
+        시설 전체 방 x 날짜 비트맵과 ETag. 캐시가 살아 있으면 DB를 타지 않는다.
+        from_date 는 예약 가능 기간 안이어야 하고, 기간을 넘는 날짜는 잘라낸다.
+        """
+        check_in_window(from_date)
+        days = min(days, (booking_window()[1] - from_date).days + 1)
+
+        key = (facility_id, from_date, days)
+        cached = self._grids.get(key)
+        if cached and clock.monotonic() - cached[3] < self.ttl_seconds:
+            self._grids.move_to_end(key)
+            return cached[0], cached[1]
+
+        dates = [from_date + timedelta(days=i) for i in range(days)]
+        rows = await reservation_repository.find_facility_masks(db, facility_id, dates[0], dates[-1])
+        if not rows and not await facility_repository.find_by_id(db, facility_id):
+            raise ValueError(f"Facility not found. id={facility_id}")
+
+        day_index = {d: i for i, d in enumerate(dates)}
+        rooms: dict[int, FacilityAvailabilityRoom] = {}
+        for row in rows:
+            room = rooms.get(row.room_id)
+            if room is None:
+                room = FacilityAvailabilityRoom(
+                    room_id=row.room_id,
+                    room_name=row.room_name,
+                    available_masks=[FULL_DAY_MASK] * days,
+                    blocked_masks=[0] * days,
+                )
+                rooms[row.room_id] = room
+            if row.day is None:
+                continue
+            i = day_index[row.day]
+            room.blocked_masks[i] = row.blocked_mask
+            room.available_masks[i] = FULL_DAY_MASK & ~(row.reserved_mask | row.blocked_mask)
+
+        grid = FacilityAvailabilityResponse(facility_id=facility_id, dates=dates, rooms=list(rooms.values()))
+        etag = '"' + hashlib.sha1(grid.model_dump_json().encode("utf-8")).hexdigest() + '"'
+
+        self._grids[key] = (grid, etag, frozenset(rooms), clock.monotonic())
+        self._grids.move_to_end(key)
+        self._prune()
+        return grid, etag
+
+    def mark_reserved(self, room_id: int, target_date: date, start_at: datetime, end_at: datetime) -> None:
+        # 캐시에 없는 (room, date)는 다음 조회 때 DB에서 만들어지므로 건드리지 않는다.
+        self._drop_grids(room_id)
+        key = (room_id, target_date)
+        cached = self._masks.get(key)
+        if cached:
+            self._masks[key] = (cached[0] | hours_mask(target_date, start_at, end_at), cached[1], cached[2])
+
+    def release(self, room_id: int, target_date: date, start_at: datetime, end_at: datetime) -> None:
+        # 같은 방의 예약은 서로 겹치지 않으므로 해당 비트를 그대로 지워도 된다.
+        self._drop_grids(room_id)
+        key = (room_id, target_date)
+        cached = self._masks.get(key)
+        if cached:
+            self._masks[key] = (cached[0] & ~hours_mask(target_date, start_at, end_at), cached[1], cached[2])
+
+    def invalidate(self, room_id: int, target_date: date) -> None:
+        self._masks.pop((room_id, target_date), None)
+        self._drop_grids(room_id)
+
+    def _drop_grids(self, room_id: int) -> None:
+        for key in [k for k, v in self._grids.items() if room_id in v[2]]:
+            del self._grids[key]
+
+    def _prune(self) -> None:
+        # 지난 날짜는 더 이상 조회/예약 대상이 아니므로 정리하고, 상한을 넘으면 LRU 순으로 버린다
+        today = date.today()
+        for key in [k for k in self._masks if k[1] < today]:
+            del self._masks[key]
+        for key in [k for k in self._grids if k[1] < today]:
+            del self._grids[key]
+        while len(self._masks) > self.max_entries:
+            self._masks.popitem(last=False)
+        while len(self._grids) > self.max_entries:
+            self._grids.popitem(last=False)
+
+
+availability_service = AvailabilityService(
+    settings.AVAILABILITY_CACHE_TTL_SECONDS, settings.AVAILABILITY_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,237 @@
+# /services/bulk_import_service.py
+import codecs
+import csv
+import json
+import time
+from collections import deque
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.facility_repository import facility_repository
+from repositories.study_room_repository import study_room_repository
+from schemas.bulk_import import BulkImportError, BulkImportResponse
+from schemas.facility import FacilityCreate
+from schemas.study_room import StudyRoomCreate
+
+# entity -> (행 검증 스키마, INSERT 할 repository)
+# 학생은 이미 있는 학번 건너뛰기/bcrypt 프로세스 풀이 필요하므로 StudentProvisioningService 로만 등록한다
+IMPORT_TARGETS = {
+    "facility": (FacilityCreate, facility_repository),
+    "study_room": (StudyRoomCreate, study_room_repository),
+}
+MAX_REPORTED_ERRORS = 1000
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """바이트 청크 스트림을 줄 단위 문자열로 (UTF-8, BOM 허용)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    async for chunk in chunks:
+        buf += decoder.decode(chunk)
+        *lines, buf = buf.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf.rstrip("\r")
+
+
+class _LineFeed:
+    """csv.reader 입력용. 앞에서 채워 준 줄만 내준다."""
+
+    def __init__(self):
+        self.lines: deque[str] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _ends_in_quotes(line: str, in_quotes: bool) -> bool:
+    """
+    csv 기본 dialect 와 같은 규칙으로 이 줄이 따옴표 필드 안에서 끝나는지 본다.
+    따옴표는 필드 첫 글자일 때만 열리고, 따옴표 필드 안의 "" 는 이스케이프다.
+    필드 중간의 따옴표(27" 모니터)는 그냥 글자다.
+    """
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if in_quotes:
+            if c == '"':
+                if line[i + 1:i + 2] == '"':
+                    i += 2
+                    continue
+                in_quotes = False
+        elif c == ",":
+            field_start = True
+            i += 1
+            continue
+        elif c == '"' and field_start:
+            in_quotes = True
+        field_start = False
+        i += 1
+    return in_quotes
+
+
+async def iter_records(lines: AsyncIterator[str], fmt: str) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """
+    (줄 번호, 레코드, 파싱 오류) 를 차례로 내보낸다.
+    csv 는 첫 줄을 헤더(컬럼명)로 쓰고, 빈 줄은 건너뛴다.
+    따옴표 안의 줄바꿈은 같은 레코드로 읽으며, 줄 번호는 레코드가 시작한 줄이다.
+    """
+    header = None
+    line_no = 0
+
+    # csv: 하나의 reader 에 레코드가 끝난(따옴표 필드가 닫힌) 줄까지만 넘긴다.
+    # 레코드 중간에 입력이 비면 reader 가 필드를 잘라 버리기 때문.
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    line_nos: deque[int] = deque()  # feed 에 넣은 줄의 실제 줄 번호
+    open_quotes = False
+
+    async for line in lines:
+        line_no += 1
+
+        if fmt == "ndjson":
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, None, f"JSON 파싱 실패: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "JSON 객체가 아닙니다."
+                continue
+            yield line_no, record, None
+            continue
+
+        if not open_quotes and not line.strip():
+            continue
+        feed.lines.append(line + "\n")
+        line_nos.append(line_no)
+        open_quotes = _ends_in_quotes(line, open_quotes)
+        if open_quotes:
+            continue
+
+        while feed.lines:
+            consumed = reader.line_num
+            values = next(reader)
+            start = line_nos[0]
+            for _ in range(reader.line_num - consumed):
+                line_nos.popleft()
+
+            if header is None:
+                header = [h.strip() for h in values]
+                continue
+            if len(values) != len(header):
+                yield start, None, f"컬럼 수가 헤더와 다릅니다. ({len(values)} != {len(header)})"
+                continue
+            yield start, dict(zip(header, values)), None
+
+    if feed.lines:
+        yield line_nos[0], None, "따옴표가 닫히지 않은 채 파일이 끝났습니다."
+
+
+def validation_message(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+
+
+class BulkImportService:
+    """
+    CSV/NDJSON 스트림을 행 단위로 검증해 batch_size 건씩 다건 INSERT 하고 배치마다 커밋한다.
+    배치 INSERT 가 실패하면 그 배치만 행 단위로 다시 넣어 실패 행을 골라내고, 나머지는 계속 진행한다.
+    """
+
+    async def _insert_batch(
+        self,
+        db: AsyncSession,
+        entity: str,
+        batch: list[tuple[int, dict]],
+        errors: list[BulkImportError],
+    ) -> int:
+        repository = IMPORT_TARGETS[entity][1]
+        rows = [row for _, row in batch]
+
+        inserted = 0
+        try:
+            async with db.begin_nested():
+                await repository.insert_many(db, rows)
+            inserted = len(rows)
+        except DBAPIError:
+            for (line, _), row in zip(batch, rows):
+                try:
+                    async with db.begin_nested():
+                        await repository.insert_many(db, [row])
+                    inserted += 1
+                except DBAPIError as e:
+                    self._add_error(errors, line, str(e.orig))
+
+        await db.commit()
+        return inserted
+
+    def _add_error(self, errors: list[BulkImportError], line: int, message: str) -> None:
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(BulkImportError(line=line, error=message))
+
+    async def import_stream(
+        self,
+        db: AsyncSession,
+        entity: str,
+        chunks: AsyncIterator[bytes],
+        fmt: str = "csv",
+        batch_size: int = 1000,
+    ) -> BulkImportResponse:
+        schema = IMPORT_TARGETS[entity][0]
+        started = time.perf_counter()
+
+        total = inserted = failed = 0
+        errors: list[BulkImportError] = []
+        batch: list[tuple[int, dict]] = []
+
+        async for line, record, parse_error in iter_records(iter_lines(chunks), fmt):
+            total += 1
+            if parse_error:
+                failed += 1
+                self._add_error(errors, line, parse_error)
+                continue
+            try:
+                row = schema.model_validate(record).model_dump()
+            except ValidationError as e:
+                failed += 1
+                self._add_error(errors, line, validation_message(e))
+                continue
+
+            batch.append((line, row))
+            if len(batch) >= batch_size:
+                n = await self._insert_batch(db, entity, batch, errors)
+                inserted += n
+                failed += len(batch) - n
+                batch = []
+
+        if batch:
+            n = await self._insert_batch(db, entity, batch, errors)
+            inserted += n
+            failed += len(batch) - n
+
+        elapsed = time.perf_counter() - started
+        return BulkImportResponse(
+            entity=entity,
+            total=total,
+            inserted=inserted,
+            failed=failed,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(total / elapsed, 1) if elapsed else 0.0,
+            errors=errors,
+        )
+
+
+bulk_import_service = BulkImportService()
@@ -1,17 +1,25 @@
 # /services/facility_service.py
+from datetime import date
+
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload
 
+from http_cache import make_etag
 from models.facility import Facility
+from repositories.facility_repository import facility_repository
 from schemas.facility import (
     FacilityCreate,
     FacilityCreateResponse,
     FacilityDetailResponse,
     FacilityListResponse,
     FacilityListItemResponse,
+    FacilityOverviewResponse,
+    FacilityOverviewRoom,
 )
 
+HOURS_PER_DAY = 24
+
 class FacilityService:
     async def create(self,db: AsyncSession, req: FacilityCreate) -> FacilityCreateResponse:
         e = Facility(
@@ -28,10 +36,11 @@ class FacilityService:
         return FacilityCreateResponse(facility_id=e.facility_id)
 
     async def detail(self, db: AsyncSession, facility_id: int) -> FacilityDetailResponse:
+        # 상세 응답에는 방 정보가 없으므로 study_room_items 기본 selectin 로딩을 끈다 (방 정보는 overview)
         stmt = (
             select(Facility)
             .where(Facility.facility_id == facility_id)
-            .options(selectinload(Facility.study_room))
+            .options(lazyload(Facility.study_room_items))
         )
         res = await db.execute(stmt)
         e = res.scalar_one_or_none()
@@ -40,6 +49,57 @@ class FacilityService:
 
         return FacilityDetailResponse.model_validate(e)
 
+    async def overview(self, db: AsyncSession, facility_id: int, target_date: date) -> FacilityOverviewResponse:
+        rows = await facility_repository.find_overview(db, facility_id, target_date)
+        if not rows:
+            raise ValueError(f"Facility not found. id={facility_id}")
+
+        rooms = []
+        for r in rows:
+            if r.room_id is None:  # 방이 없는 시설
+                continue
+            review_count = r.review_count or 0
+            booked_hours = float(r.booked_hours or 0)
+            rooms.append(
+                FacilityOverviewRoom(
+                    room_id=r.room_id,
+                    room_name=r.room_name,
+                    room_floor=r.room_floor,
+                    room_image=r.room_image,
+                    room_capacity=r.room_capacity,
+                    room_equipment=r.room_equipment,
+                    use_tf=r.use_tf,
+                    average_rating=round(r.rating_sum / review_count, 1) if review_count else 0.0,
+                    review_count=review_count,
+                    rating_histogram=[r.star_1 or 0, r.star_2 or 0, r.star_3 or 0, r.star_4 or 0, r.star_5 or 0],
+                    booked_hours=round(booked_hours, 2),
+                    booked_ratio=round(booked_hours / HOURS_PER_DAY, 4),
+                )
+            )
+
+        head = rows[0]
+        return FacilityOverviewResponse(
+            facility_id=head.facility_id,
+            facility_name=head.facility_name,
+            facility_address=head.facility_address,
+            facility_desc=head.facility_desc,
+            use_tf=head.facility_use_tf,
+            date=target_date,
+            rooms=rooms,
+        )
+
+    async def list_validator(self, db: AsyncSession):
+        """목록 ETag/Last-Modified 계산용 (건수 + max(up_date) 한 줄 조회)"""
+        count, up_date = await facility_repository.find_list_version(db)
+        return make_etag("facilities", count, up_date), up_date
+
+    async def detail_validator(self, db: AsyncSession, facility_id: int):
+        """상세 ETag/Last-Modified 계산용, 시설이 없으면 None"""
+        up_date = await facility_repository.find_up_date(db, facility_id)
+        if up_date is None:
+            return None
+        return make_etag("facility", facility_id, up_date), up_date
+
     async def list(self, db: AsyncSession) -> FacilityListResponse:
         # 목록
         stmt = select(Facility).order_by(Facility.facility_id.desc())
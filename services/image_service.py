@@ -0,0 +1,203 @@
+# /services/image_service.py
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile
+
+from configs.config import settings
+
+logger = logging.getLogger(__name__)
+
+ORIGINAL = "original"
+# 썸네일 이름 -> 긴 변 최대 px
+THUMBNAIL_SIZES = {"sm": 160, "md": 480, "lg": 1024}
+THUMBNAIL_EXT = "webp"
+MEDIA_URL_PREFIX = "/media/rooms"
+MEDIA_TYPES = {"jpg": "image/jpeg", "png": "image/png", "webp": "image/webp"}
+
+# 저장 파일명: 내용 sha256 앞 32자 + 확장자 (내용이 같으면 이름도 같으므로 영구 캐시 가능)
+IMAGE_NAME_RE = re.compile(r"^([0-9a-f]{32})\.(jpg|png|webp)$")
+CHUNK_SIZE = 1 << 16
+
+
+def sniff_ext(head: bytes) -> str | None:
+    """파일 앞부분 매직 바이트로 형식 판별 (업로드 Content-Type 은 믿지 않는다)"""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def make_thumbnails(src: str, root: str, digest: str) -> list[str]:
+    """
+    프로세스 풀에서 실행. 원본에서 사이즈별 webp 썸네일을 만들고 만든 사이즈 목록을 돌려준다.
+    이미 있는 사이즈는 건너뛰고, 임시 파일에 쓴 뒤 rename 해서 반쯤 쓴 파일이 서빙되지 않게 한다.
+    """
+    from PIL import Image, ImageOps  # 워커 프로세스에서만 필요
+
+    made = []
+    with Image.open(src) as opened:
+        image = ImageOps.exif_transpose(opened)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or "A" in image.getbands() else "RGB")
+
+        for variant, size in THUMBNAIL_SIZES.items():
+            dst = Path(root) / variant / f"{digest}.{THUMBNAIL_EXT}"
+            if dst.exists():
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+
+            thumb = image.copy()
+            thumb.thumbnail((size, size))
+            tmp = dst.with_name(f".{uuid.uuid4().hex}.tmp")
+            thumb.save(tmp, "WEBP", quality=80)
+            os.replace(tmp, dst)
+            made.append(variant)
+    return made
+
+
+class ImageService:
+    """
+    스터디룸 이미지 저장/썸네일/서빙.
+    원본은 IMAGE_DIR/original/{해시}.{확장자}, 썸네일은 IMAGE_DIR/{사이즈}/{해시}.webp 에 둔다.
+    썸네일은 업로드 후 큐에 넣고 백그라운드 워커가 프로세스 풀에서 만든다.
+    """
+
+    def __init__(self, root: str, workers: int):
+        self.root = Path(root)
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._queue: asyncio.Queue[str] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        for d in (ORIGINAL, "tmp", *THUMBNAIL_SIZES):
+            (self.root / d).mkdir(parents=True, exist_ok=True)
+
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        # 재시작 전에 업로드됐지만 썸네일이 덜 만들어진 원본을 다시 큐에
+        for path in (self.root / ORIGINAL).iterdir():
+            m = IMAGE_NAME_RE.match(path.name)
+            if m and not all(self._thumbnail_path(v, m.group(1)).exists() for v in THUMBNAIL_SIZES):
+                self._queue.put_nowait(path.name)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._queue = None
+
+    def enqueue(self, name: str) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait(name)
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            name = await self._queue.get()
+            try:
+                digest = IMAGE_NAME_RE.match(name).group(1)
+                await loop.run_in_executor(
+                    self._pool, make_thumbnails, str(self.root / ORIGINAL / name), str(self.root), digest
+                )
+            except Exception:
+                logger.exception("Thumbnail generation failed for %s", name)
+            finally:
+                self._queue.task_done()
+
+    def _thumbnail_path(self, variant: str, digest: str) -> Path:
+        return self.root / variant / f"{digest}.{THUMBNAIL_EXT}"
+
+    async def save_original(self, upload: UploadFile) -> str:
+        """
+        업로드를 해시하면서 임시 파일에 쓰고 해시 이름으로 옮긴다. 저장된 파일명을 돌려준다.
+        파일 열기/쓰기/이동은 기본 executor(스레드)에서 해 이벤트 루프를 막지 않는다.
+        """
+        loop = asyncio.get_running_loop()
+        tmp = self.root / "tmp" / uuid.uuid4().hex
+        digest = hashlib.sha256()
+        size = 0
+        head = b""
+        try:
+            f = await loop.run_in_executor(None, tmp.open, "wb")
+            try:
+                while chunk := await upload.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.IMAGE_MAX_BYTES:
+                        raise HTTPException(status_code=413, detail="이미지 파일이 너무 큽니다.")
+                    if len(head) < 16:
+                        head += chunk[: 16 - len(head)]
+                    digest.update(chunk)
+                    await loop.run_in_executor(None, f.write, chunk)
+            finally:
+                await loop.run_in_executor(None, f.close)
+
+            ext = sniff_ext(head)
+            if ext is None:
+                raise HTTPException(status_code=415, detail="지원하지 않는 이미지 형식입니다. (jpg, png, webp)")
+
+            name = f"{digest.hexdigest()[:32]}.{ext}"
+            # 같은 내용이면 같은 파일을 덮어쓸 뿐
+            await loop.run_in_executor(None, os.replace, tmp, self.root / ORIGINAL / name)
+        finally:
+            await loop.run_in_executor(None, functools.partial(tmp.unlink, missing_ok=True))
+
+        self.enqueue(name)
+        return name
+
+    def urls(self, name: str | None) -> dict[str, str]:
+        """room_image(저장 파일명) -> {"original": url, "sm": url, ...}, 해시 이름이 아니면 빈 dict"""
+        m = IMAGE_NAME_RE.match(name or "")
+        if not m:
+            return {}
+        urls = {ORIGINAL: f"{MEDIA_URL_PREFIX}/{ORIGINAL}/{name}"}
+        urls.update({v: f"{MEDIA_URL_PREFIX}/{v}/{m.group(1)}.{THUMBNAIL_EXT}" for v in THUMBNAIL_SIZES})
+        return urls
+
+    def thumbnail_urls(self, name: str | None) -> dict[str, str]:
+        return {k: v for k, v in self.urls(name).items() if k != ORIGINAL}
+
+    def resolve(self, variant: str, filename: str) -> tuple[Path, str, bool]:
+        """
+        서빙할 (파일 경로, media type, 영구 캐시 가능 여부).
+        썸네일이 아직 만들어지지 않았으면 원본을 대신 주되 영구 캐시는 하지 않는다.
+        """
+        m = IMAGE_NAME_RE.match(filename)
+        if m is None or (variant != ORIGINAL and variant not in THUMBNAIL_SIZES):
+            raise ValueError(f"Image not found. {variant}/{filename}")
+        digest, ext = m.groups()
+
+        if variant == ORIGINAL:
+            path = self.root / ORIGINAL / filename
+            if path.is_file():
+                return path, MEDIA_TYPES[ext], True
+        elif ext == THUMBNAIL_EXT:
+            path = self._thumbnail_path(variant, digest)
+            if path.is_file():
+                return path, MEDIA_TYPES[ext], True
+            for original_ext in MEDIA_TYPES:
+                path = self.root / ORIGINAL / f"{digest}.{original_ext}"
+                if path.is_file():
+                    return path, MEDIA_TYPES[original_ext], False
+
+        raise ValueError(f"Image not found. {variant}/{filename}")
+
+
+image_service = ImageService(settings.IMAGE_DIR, settings.IMAGE_WORKERS)
@@ -0,0 +1,151 @@
+# /services/login_throttle.py
+import math
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from fastapi import HTTPException, status
+
+from configs.config import settings
+from services.password_hasher import password_hasher
+
+TOO_MANY_ATTEMPTS = "로그인 시도가 너무 많습니다. 잠시 후 다시 시도하세요."
+SERVER_BUSY = "로그인 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요."
+
+
+class _KeyState:
+    __slots__ = ("tokens", "updated", "failures", "blocked_until")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.failures = 0
+        self.blocked_until = 0.0
+
+
+class LoginThrottle:
+    """
+    /auth/login 보호.
+    - 학번별/IP별 토큰 버킷: 시도마다 토큰 1개, 분당 refill 만큼 다시 찬다.
+    - 학번별 지수 백오프: 연속 실패가 LOGIN_BACKOFF_AFTER 회를 넘으면 base * 2^n 초 (최대 max) 동안 거절.
+    - bcrypt 동시 실행 상한 (검증 + cost 변경 rehash): 넘치면 기다리지 않고 429 로 바로 돌려보낸다.
+    bcrypt 전에 거절한 시도 수로 아낀 CPU 시간을 추정한다.
+    LOGIN_THROTTLE_ENABLED=false 면 모두 통과시킨다.
+    """
+
+    def __init__(self):
+        # (kind, value) -> 상태, 오래 안 쓴 키부터 정리
+        self._states: OrderedDict[tuple[str, str], _KeyState] = OrderedDict()
+        self._verifying = 0
+
+        self.allowed = 0
+        self.rate_limited = 0
+        self.backoff_rejected = 0
+        self.shed = 0
+
+    def _limits(self, kind: str) -> tuple[float, float]:
+        # (버킷 크기, 초당 refill)
+        if kind == "ip":
+            return settings.LOGIN_IP_BURST, settings.LOGIN_IP_REFILL_PER_MINUTE / 60
+        return settings.LOGIN_BURST, settings.LOGIN_REFILL_PER_MINUTE / 60
+
+    def _state(self, key: tuple[str, str], now: float) -> _KeyState:
+        state = self._states.get(key)
+        capacity, rate = self._limits(key[0])
+        if state is None:
+            state = _KeyState(capacity, now)
+            self._states[key] = state
+            while len(self._states) > settings.LOGIN_THROTTLE_MAX_KEYS:
+                self._states.popitem(last=False)
+        else:
+            state.tokens = min(capacity, state.tokens + (now - state.updated) * rate)
+            state.updated = now
+            self._states.move_to_end(key)
+        return state
+
+    def keys(self, student_no: str, client_ip: str | None) -> list[tuple[str, str]]:
+        keys = [("student_no", student_no)]
+        if client_ip:
+            keys.append(("ip", client_ip))
+        return keys
+
+    def check(self, keys: list[tuple[str, str]]) -> None:
+        """시도 1회를 기록하고, 막혀 있으면 429 (Retry-After) 를 던진다."""
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+        now = time.monotonic()
+        states = [(key, self._state(key, now)) for key in keys]
+
+        for _, state in states:
+            if state.blocked_until > now:
+                self.backoff_rejected += 1
+                self._reject(state.blocked_until - now)
+
+        for key, state in states:
+            if state.tokens < 1:
+                self.rate_limited += 1
+                _, rate = self._limits(key[0])
+                self._reject((1 - state.tokens) / rate)
+
+        for _, state in states:
+            state.tokens -= 1
+        self.allowed += 1
+
+    def record_failure(self, keys: list[tuple[str, str]]) -> None:
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+        now = time.monotonic()
+        for key in keys:
+            if key[0] != "student_no":
+                continue
+            state = self._state(key, now)
+            state.failures += 1
+            over = state.failures - settings.LOGIN_BACKOFF_AFTER
+            if over >= 0:
+                delay = min(settings.LOGIN_BACKOFF_BASE_SECONDS * (2 ** over), settings.LOGIN_BACKOFF_MAX_SECONDS)
+                state.blocked_until = now + delay
+
+    def record_success(self, keys: list[tuple[str, str]]) -> None:
+        for key in keys:
+            state = self._states.get(key)
+            if state is not None:
+                state.failures = 0
+                state.blocked_until = 0.0
+
+    @contextmanager
+    def verification(self):
+        """bcrypt 구간 (검증, 필요하면 rehash 까지). 동시 실행이 상한이면 대기하지 않고 429."""
+        if settings.LOGIN_THROTTLE_ENABLED and self._verifying >= settings.LOGIN_MAX_CONCURRENT_VERIFY:
+            self.shed += 1
+            self._reject(1, SERVER_BUSY)
+        self._verifying += 1
+        try:
+            yield
+        finally:
+            self._verifying -= 1
+
+    def _reject(self, retry_after: float, detail: str = TOO_MANY_ATTEMPTS) -> None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def snapshot(self) -> dict:
+        rejected = self.rate_limited + self.backoff_rejected + self.shed
+        bcrypt_p50_ms = password_hasher.snapshot()["run_ms"]["p50"]
+        return {
+            "enabled": settings.LOGIN_THROTTLE_ENABLED,
+            "tracked_keys": len(self._states),
+            "verifying": self._verifying,
+            "max_concurrent_verify": settings.LOGIN_MAX_CONCURRENT_VERIFY,
+            "allowed": self.allowed,
+            "rate_limited": self.rate_limited,
+            "backoff_rejected": self.backoff_rejected,
+            "shed": self.shed,
+            # bcrypt 전에 거절한 시도 x bcrypt 검증 1회 중앙값
+            "estimated_cpu_ms_saved": round(rejected * bcrypt_p50_ms, 1),
+        }
+
+
+login_throttle = LoginThrottle()
@@ -0,0 +1,157 @@
+# /services/password_hasher.py
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+from configs.config import settings
+
+# 지연 통계에 쓰는 최근 표본 수
+SAMPLE_SIZE = 1024
+# bcrypt 가 허용하는 cost 범위
+MIN_ROUNDS, MAX_ROUNDS = 4, 31
+
+
+def _timed(fn, *args):
+    # executor 안에서 실행, 실제 연산 시간을 같이 돌려준다 (프로세스 풀에서도 pickle 가능한 최상위 함수)
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def _summary_ms(samples) -> dict:
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    pick = lambda pct: ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+    return {
+        "p50": round(pick(50) * 1000, 2),
+        "p95": round(pick(95) * 1000, 2),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+def hash_rounds(hashed: str) -> int | None:
+    """저장된 bcrypt 해시의 cost ("$2b$12$..." -> 12), 형식이 다르면 None"""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def measure_rounds(rounds: int, samples: int = 3) -> float:
+    """이 호스트에서 cost=rounds 해시 1회 시간 중앙값 (초)"""
+    times = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        times.append(time.perf_counter() - started)
+    return sorted(times)[len(times) // 2]
+
+
+def calibrate(target_ms: float, samples: int = 3, min_rounds: int = MIN_ROUNDS, max_rounds: int = 16) -> dict:
+    """
+    cost 를 min_rounds 부터 올려 가며 해시 시간을 재고, 목표 지연 이하인 가장 큰 cost 를 고른다.
+    cost 가 1 오를 때마다 시간이 두 배이므로 목표를 넘는 순간 멈춘다.
+    """
+    measured: dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        ms = measure_rounds(rounds, samples) * 1000
+        measured[rounds] = round(ms, 2)
+        if ms > target_ms:
+            break
+        chosen = rounds
+    return {"target_ms": target_ms, "rounds": chosen, "measured_ms": measured}
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 크기가 정해진 executor 에서 실행해 이벤트 루프를 막지 않는다.
+    bcrypt 는 GIL 을 놓으므로 기본은 스레드 풀, PASSWORD_HASH_EXECUTOR=process 면 프로세스 풀.
+    동시 실행은 PASSWORD_HASH_CONCURRENCY 개로 제한되고 나머지는 executor 큐에서 기다린다.
+    """
+
+    def __init__(self, concurrency: int, executor_kind: str = "thread", rounds: int = 12):
+        self.concurrency = concurrency
+        self.executor_kind = executor_kind
+        self.rounds = rounds
+        self._executor: Executor | None = None
+
+        self._pending = 0  # 제출했지만 끝나지 않은 작업 (실행 중 + 대기)
+        self._completed = 0
+        self._failed = 0
+        self._rehashed = 0
+        self._wait_samples: deque[float] = deque(maxlen=SAMPLE_SIZE)
+        self._run_samples: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.concurrency)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _submit(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        self._pending += 1
+        try:
+            result, run_seconds = await loop.run_in_executor(self._get_executor(), _timed, fn, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        self._completed += 1
+        self._run_samples.append(run_seconds)
+        self._wait_samples.append(max(0.0, time.perf_counter() - submitted - run_seconds))
+        return result
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds))
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(bcrypt.checkpw, password.encode("utf-8"), hashed.encode("utf-8"))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return hash_rounds(hashed) != self.rounds
+
+    async def rehash_if_needed(self, password: str, hashed: str) -> str | None:
+        """검증이 끝난 평문으로, 저장된 해시 cost 가 설정과 다르면 새 해시를 돌려준다 (같으면 None)"""
+        if not self.needs_rehash(hashed):
+            return None
+        new_hash = await self.hash(password)
+        self._rehashed += 1
+        return new_hash
+
+    def snapshot(self) -> dict:
+        """큐 길이/처리 건수/대기·실행 지연 (최근 SAMPLE_SIZE 건 기준)"""
+        return {
+            "executor": self.executor_kind,
+            "concurrency": self.concurrency,
+            "rounds": self.rounds,
+            "in_flight": min(self._pending, self.concurrency),
+            "queue_depth": max(0, self._pending - self.concurrency),
+            "completed": self._completed,
+            "failed": self._failed,
+            "rehashed": self._rehashed,
+            "wait_ms": _summary_ms(self._wait_samples),
+            "run_ms": _summary_ms(self._run_samples),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_CONCURRENCY, settings.PASSWORD_HASH_EXECUTOR, settings.BCRYPT_ROUNDS
+)
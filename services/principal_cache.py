@@ -0,0 +1,139 @@
+# /services/principal_cache.py
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import event
+
+from configs.config import settings
+from models.student import Student
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    인증된 학생 스냅샷. 세션에 묶인 ORM 인스턴스가 아니므로 요청 간 공유해도 안전하다.
+    무상태 모드에서 토큰 클레임으로 만든 경우 student_phone 은 None.
+    """
+    student_id: int
+    student_no: str
+    student_name: str
+    student_department: str
+    student_phone: str | None = None
+
+    @classmethod
+    def from_student(cls, student: Student) -> "Principal":
+        return cls(
+            student_id=student.student_id,
+            student_no=student.student_no,
+            student_name=student.student_name,
+            student_department=student.student_department,
+            student_phone=student.student_phone,
+        )
+
+
+def token_key(token: str) -> bytes:
+    # 원문 토큰 대신 digest 를 키로 보관
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class PrincipalCache:
+    """
+    토큰 -> Principal LRU 캐시. 항목은 TTL 과 토큰 exp 중 빠른 시각에 만료된다.
+    학생 정보가 바뀌면 invalidate_student 로 그 학생의 모든 토큰 항목을 지운다.
+    (프로세스 로컬 캐시이므로 다른 워커에는 TTL 이 지나야 반영된다.)
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (principal, 만료 시각 monotonic)
+        self._entries: OrderedDict[bytes, tuple[Principal, float]] = OrderedDict()
+        # student_id -> 그 학생 토큰 key 들
+        self._by_student: dict[int, set[bytes]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Principal | None:
+        key = token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        principal, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return principal
+
+    def put(self, token: str, principal: Principal, exp: float | None) -> None:
+        """exp: 토큰 만료 시각 (unix time)"""
+        ttl = self.ttl_seconds
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        key = token_key(token)
+        self._remove(key)
+        self._entries[key] = (principal, time.monotonic() + ttl)
+        self._by_student.setdefault(principal.student_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_student(self, student_id: int) -> None:
+        keys = self._by_student.pop(student_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_student.clear()
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        student_id = entry[0].student_id
+        keys = self._by_student.get(student_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_student[student_id]
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "stateless": settings.AUTH_STATELESS,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_MAX_ENTRIES, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+# ORM 으로 학생이 수정/삭제되면 자동으로 무효화
+@event.listens_for(Student, "after_update")
+@event.listens_for(Student, "after_delete")
+def _invalidate_on_student_change(mapper, connection, target: Student) -> None:
+    principal_cache.invalidate_student(target.student_id)
@@ -1,17 +1,25 @@
+import base64
 from datetime import date, datetime, timedelta
+from typing import AsyncIterator
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
-from models.facility import Facility
-from models.study_room import StudyRoom
-from models.reservation import Reservation
+from configs.db import AsyncSessionLocal
+
+from models.reservation import ROOM_OVERLAP_CONSTRAINT, STUDENT_OVERLAP_CONSTRAINT
 
 from repositories.reservation_repository import reservation_repository
-from repositories.reservation_disable_repository import reservation_disable_repository
+from services.availability_service import availability_service, booking_window
+from services.slot_admission import slot_admission
 
 from schemas.reservation import (
+    ReservationBatchCreate,
+    ReservationBatchItemResult,
+    ReservationBatchResponse,
+    ReservationCompactItem,
+    ReservationCompactListResponse,
     ReservationCreate,
     ReservationCreateResponse,
     ReservationDetail,
@@ -22,111 +30,266 @@ from schemas.reservation import (
 logger = logging.getLogger(__name__)
 
 class ReservationService:
+    def _validate_slot(self, payload: ReservationCreate) -> int:
+        """DB 없이 판단 가능한 요청 값 검증. 통과하면 reservation_count(1 또는 2)를 돌려준다."""
+        # 1) 예약 가능 날짜(오늘~7일)
+        today, last_allowed = booking_window()
+        if payload.reservation_date < today or payload.reservation_date > last_allowed:
+            raise HTTPException(status_code=400, detail="예약은 오늘부터 최대 7일 이내 날짜만 가능합니다.")
+
+        # 2) 시간 유효성
+        start_at = payload.reservation_start_date
+        end_at = payload.reservation_end_date
+
+        if start_at.date() != payload.reservation_date or end_at.date() != payload.reservation_date:
+            raise HTTPException(status_code=400, detail="예약일(reservation_date)과 시작/종료 시간이 동일한 날짜여야 합니다.")
+        if end_at <= start_at:
+            raise HTTPException(status_code=400, detail="종료 시간은 시작 시간 이후로 설정해 주세요.")
+
+        # 3) 1시간/2시간 단위만 허용
+        duration_minutes = int((end_at - start_at).total_seconds() // 60)
+        if duration_minutes not in (60, 120):
+            raise HTTPException(status_code=400, detail="예약 시간은 1시간 또는 2시간 단위로만 선택할 수 있습니다.")
+
+        return 1 if duration_minutes == 60 else 2
+
+    def _raise_if_rejected(
+        self,
+        admission,
+        payload: ReservationCreate,
+        request_count: int,
+        used_count: int,
+        user_overlap: bool = False,
+        room_overlap: bool = False,
+    ) -> None:
+        """
+        예약 가능 여부 조회 결과(admission row)를 기존 400/404/409 메시지로 변환한다.
+        단건 예약은 시간 중복을 EXCLUDE 제약(IntegrityError)으로 판정하므로 중복 플래그를 넘기지 않고,
+        일괄 예약만 조회 결과의 user_overlap / room_overlap 을 넘긴다.
+        """
+        if admission.room_facility_id is None:
+            raise HTTPException(status_code=404, detail="선택한 스터디룸을 찾을 수 없습니다. 다시 선택해 주세요.")
+        if not admission.facility_exists:
+            raise HTTPException(status_code=404, detail="선택한 시설 정보를 확인할 수 없습니다. 다시 시도해 주세요.")
+        if admission.room_facility_id != payload.facility_id:
+            raise HTTPException(status_code=400, detail="선택한 방이 해당 시설에 속하지 않습니다. 방/시설을 다시 확인해 주세요.")
+        if used_count + request_count > 2:
+            raise HTTPException(status_code=400, detail="하루 최대 이용 가능 시간(2시간)을 초과했습니다.")
+        if user_overlap:
+            raise HTTPException(status_code=409, detail="선택한 시간에 이미 예약이 존재합니다. 다른 시간을 선택해 주세요.")
+        if room_overlap:
+            raise HTTPException(status_code=409, detail="해당 시간은 이미 예약이 완료되었습니다. 다른 시간을 선택해 주세요.")
+        if admission.blocked:
+            raise HTTPException(status_code=409, detail="해당 시간은 예약이 제한되어 있습니다. 다른 시간을 선택해 주세요.")
+
     async def create(self, db: AsyncSession, payload: ReservationCreate, student_id: int) -> ReservationCreateResponse:
         try:
-            # 0) 기본 참조 데이터 확인
-            target_room = await db.get(StudyRoom, payload.room_id)
-            if not target_room:
-                raise HTTPException(status_code=404, detail="선택한 스터디룸을 찾을 수 없습니다. 다시 선택해 주세요.")
-
-            target_facility = await db.get(Facility, payload.facility_id)
-            if not target_facility:
-                raise HTTPException(status_code=404, detail="선택한 시설 정보를 확인할 수 없습니다. 다시 시도해 주세요.")
-
-            # 1) 방-시설 매칭 검증
-            if target_room.facility_id != payload.facility_id:
-                raise HTTPException(status_code=400, detail="선택한 방이 해당 시설에 속하지 않습니다. 방/시설을 다시 확인해 주세요.")
-
-            # 2) 예약 가능 날짜(오늘~7일)
-            today = date.today()
-            last_allowed = today + timedelta(days=7)
-            if payload.reservation_date < today or payload.reservation_date > last_allowed:
-                raise HTTPException(status_code=400, detail="예약은 오늘부터 최대 7일 이내 날짜만 가능합니다.")
-
-            # 3) 시간 유효성
+            # 1) 요청 값 검증 (예약 가능 날짜, 시간 유효성, 1시간/2시간 단위)
+            request_count = self._validate_slot(payload)
             start_at = payload.reservation_start_date
             end_at = payload.reservation_end_date
 
-            if start_at.date() != payload.reservation_date or end_at.date() != payload.reservation_date:
-                raise HTTPException(status_code=400, detail="예약일(reservation_date)과 시작/종료 시간이 동일한 날짜여야 합니다.")
-            if end_at <= start_at:
-                raise HTTPException(status_code=400, detail="종료 시간은 시작 시간 이후로 설정해 주세요.")
-
-            # 4) 1시간/2시간 단위만 허용
-            duration_minutes = int((end_at - start_at).total_seconds() // 60)
-            if duration_minutes not in (60, 120):
-                raise HTTPException(status_code=400, detail="예약 시간은 1시간 또는 2시간 단위로만 선택할 수 있습니다.")
-
-            # 5) 운영시간 검증 (필드가 존재할 때만)
-            if hasattr(target_room, "open_time") and hasattr(target_room, "close_time"):
-                start_time = start_at.time()
-                end_time = end_at.time()
-                if start_time < target_room.open_time or end_time > target_room.close_time:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=(
-                            f"해당 스터디룸은 {target_room.open_time.strftime('%H:%M')} ~ "
-                            f"{target_room.close_time.strftime('%H:%M')} 사이에만 예약할 수 있습니다."
-                        ),
-                    )
-
-            # 6) 하루 최대 2시간 제한(합산)
-            request_count = 1 if duration_minutes == 60 else 2
-            already_used = await reservation_repository.sum_count_by_student_and_date(db, student_id, payload.reservation_date)
-            already_used = int(already_used or 0)
-            if already_used + request_count > 2:
-                raise HTTPException(status_code=400, detail="하루 최대 이용 가능 시간(2시간)을 초과했습니다.")
-
-            # 7) 사용자 예약 시간 중복 체크(다른 방 포함)
-            user_overlap = await reservation_repository.find_user_disable(db, student_id, payload.reservation_date, start_at, end_at)
-            if user_overlap:
-                raise HTTPException(status_code=409, detail="선택한 시간에 이미 예약이 존재합니다. 다른 시간을 선택해 주세요.")
+            # 2) 같은 방/날짜 요청은 프로세스 내 대기열에서 하나씩 처리
+            #    (이미 잡힌 시간대, 대기열 초과는 DB 접근 없이 바로 실패)
+            async with slot_admission.admit(payload.room_id, payload.reservation_date, start_at, end_at):
+                # 3) DB 검증 + 저장을 한 번의 왕복으로 처리
+                #    (방/시설 확인, 방-시설 매칭, 하루 최대 2시간, 관리자 차단)
+                #    사용자/방 시간 중복은 EXCLUDE 제약 위반(IntegrityError)으로 판정
+                admission = await reservation_repository.create_if_admitted(
+                    db,
+                    student_id=student_id,
+                    room_id=payload.room_id,
+                    facility_id=payload.facility_id,
+                    reservation_date=payload.reservation_date,
+                    start_dt=start_at,
+                    end_dt=end_at,
+                    reservation_count=request_count,
+                    use_tf=payload.use_tf,
+                )
+
+                # 4) 저장되지 않았다면 기존과 같은 순서로 실패 사유 판정
+                if admission.reservation_id is None:
+                    self._raise_if_rejected(admission, payload, request_count, int(admission.used_count or 0))
+                    raise HTTPException(status_code=500, detail="예약 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
+
+                await db.commit()     # 실제 반영
+                slot_admission.claim(payload.room_id, payload.reservation_date, start_at, end_at)
+            availability_service.mark_reserved(payload.room_id, payload.reservation_date, start_at, end_at)
+
+            return ReservationCreateResponse(reservation_id=admission.reservation_id)
 
-            # 8) 동일 방 예약 시간 중복 체크
-            room_overlap = await reservation_repository.find_room_disable(db, payload.room_id, payload.reservation_date, start_at, end_at)
-            if room_overlap:
+        except HTTPException:
+            raise
+
+        except IntegrityError as e:
+            await db.rollback()
+            # 동시 요청이 같은 시간대를 선점한 경우도 여기서 409로 정리된다.
+            if STUDENT_OVERLAP_CONSTRAINT in str(e.orig):
+                raise HTTPException(status_code=409, detail="선택한 시간에 이미 예약이 존재합니다. 다른 시간을 선택해 주세요.")
+            if ROOM_OVERLAP_CONSTRAINT in str(e.orig):
                 raise HTTPException(status_code=409, detail="해당 시간은 이미 예약이 완료되었습니다. 다른 시간을 선택해 주세요.")
+            logger.exception("Integrity error on POST /reservations")
+            raise HTTPException(status_code=500, detail="예약 처리 중 DB 오류가 발생했습니다.")
 
-            # 9) 관리자 차단 시간 중복 체크
-            blocked_overlap = await reservation_disable_repository.find_disable(db, payload.room_id, payload.reservation_date, start_at, end_at)
-            if blocked_overlap:
-                raise HTTPException(status_code=409, detail="해당 시간은 예약이 제한되어 있습니다. 다른 시간을 선택해 주세요.")
-
-            # 10) 저장
-            entity = Reservation(
-                student_id=student_id,
-                room_id=payload.room_id,
-                facility_id=payload.facility_id,
-                reservation_status="예약완료",
-                reservation_date=payload.reservation_date,
-                reservation_start_date=start_at,
-                reservation_end_date=end_at,
-                reservation_count=request_count,
-                use_tf=payload.use_tf,
-            )
-
-            await reservation_repository.save(db, entity)  # db.add
-            await db.flush()      # PK 생성
-            await db.commit()     # 실제 반영
-            await db.refresh(entity)
-
-            return ReservationCreateResponse(reservation_id=entity.reservation_id)
+        except SQLAlchemyError:
+            await db.rollback()
+            logger.exception("DB error on POST /reservations")
+            raise HTTPException(status_code=500, detail="예약 처리 중 DB 오류가 발생했습니다.")
+
+        except Exception:
+            await db.rollback()
+            logger.exception("Unexpected error on POST /reservations")
+            raise HTTPException(status_code=500, detail="예약 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
+
+    def _batch_failed(self, items: list, failed: dict[int, HTTPException]) -> ReservationBatchResponse:
+        # 실패 항목은 사유를, 나머지는 424 (다른 항목 때문에 저장 안 됨) 로
+        return ReservationBatchResponse(
+            ok=False,
+            items=[
+                ReservationBatchItemResult(index=idx, status_code=failed[idx].status_code, detail=failed[idx].detail)
+                if idx in failed
+                else ReservationBatchItemResult(index=idx, status_code=424, detail="다른 항목이 실패하여 예약되지 않았습니다.")
+                for idx in range(len(items))
+            ],
+        )
+
+    async def create_batch(self, db: AsyncSession, payload: ReservationBatchCreate, student_id: int) -> ReservationBatchResponse:
+        items = payload.items
+        failed: dict[int, HTTPException] = {}
+        counts: dict[int, int] = {}
+
+        # 1) 항목별 요청 값 검증
+        for idx, item in enumerate(items):
+            try:
+                counts[idx] = self._validate_slot(item)
+            except HTTPException as e:
+                failed[idx] = e
+
+        # 2) 배치 내부 중복 검증 (모두 본인 예약이므로 방이 달라도 시간이 겹치면 안 됨)
+        valid = list(counts)
+        for pos, idx in enumerate(valid):
+            for prev in valid[:pos]:
+                if prev in failed:
+                    continue
+                a, b = items[prev], items[idx]
+                if a.reservation_start_date < b.reservation_end_date and a.reservation_end_date > b.reservation_start_date:
+                    if a.room_id == b.room_id:
+                        failed[idx] = HTTPException(status_code=409, detail="해당 시간은 이미 예약이 완료되었습니다. 다른 시간을 선택해 주세요.")
+                    else:
+                        failed[idx] = HTTPException(status_code=409, detail="선택한 시간에 이미 예약이 존재합니다. 다른 시간을 선택해 주세요.")
+                    break
+
+        candidates = [idx for idx in valid if idx not in failed]
+        if not candidates:
+            return self._batch_failed(items, failed)
+
+        try:
+            # 3) 단건 예약과 같은 (room_id, date) 대기열을 후보 전체에 대해 통과한 뒤 DB 로 보낸다
+            #    (이미 잡힌 시간대, 대기열 초과는 DB 접근 없이 배치 전체 409/503)
+            async with slot_admission.admit_many(
+                [
+                    (items[idx].room_id, items[idx].reservation_date, items[idx].reservation_start_date, items[idx].reservation_end_date)
+                    for idx in candidates
+                ]
+            ):
+                # 4) 기존 예약/차단과의 충돌을 후보 전체에 대해 한 번에 조회
+                rows = await reservation_repository.find_batch_admission(
+                    db,
+                    student_id,
+                    [
+                        (
+                            idx,
+                            items[idx].room_id,
+                            items[idx].facility_id,
+                            items[idx].reservation_date,
+                            items[idx].reservation_start_date,
+                            items[idx].reservation_end_date,
+                        )
+                        for idx in candidates
+                    ],
+                )
+                batch_used: dict[date, int] = {}
+                for row in rows:
+                    item = items[row.idx]
+                    already = int(row.used_count or 0) + batch_used.get(item.reservation_date, 0)
+                    try:
+                        self._raise_if_rejected(
+                            row, item, counts[row.idx], already,
+                            user_overlap=row.user_overlap,
+                            room_overlap=row.room_overlap,
+                        )
+                    except HTTPException as e:
+                        failed[row.idx] = e
+                        continue
+                    batch_used[item.reservation_date] = batch_used.get(item.reservation_date, 0) + counts[row.idx]
+
+                # 5) 하나라도 실패하면 아무것도 저장하지 않음
+                if failed:
+                    return self._batch_failed(items, failed)
+
+                # 6) 다건 INSERT 한 번 + 커밋 한 번
+                reservation_ids = await reservation_repository.insert_many(
+                    db,
+                    [
+                        {
+                            "student_id": student_id,
+                            "room_id": item.room_id,
+                            "facility_id": item.facility_id,
+                            "reservation_status": "예약완료",
+                            "reservation_date": item.reservation_date,
+                            "reservation_start_date": item.reservation_start_date,
+                            "reservation_end_date": item.reservation_end_date,
+                            "reservation_count": counts[idx],
+                            "use_tf": item.use_tf,
+                        }
+                        for idx, item in enumerate(items)
+                    ],
+                )
+                await db.commit()
+                for item in items:
+                    slot_admission.claim(item.room_id, item.reservation_date, item.reservation_start_date, item.reservation_end_date)
 
         except HTTPException:
             raise
 
+        except IntegrityError as e:
+            await db.rollback()
+            # 검증과 저장 사이에 다른 워커의 요청이 시간대를 선점한 경우
+            if STUDENT_OVERLAP_CONSTRAINT in str(e.orig):
+                raise HTTPException(status_code=409, detail="선택한 시간에 이미 예약이 존재합니다. 다른 시간을 선택해 주세요.")
+            if ROOM_OVERLAP_CONSTRAINT in str(e.orig):
+                raise HTTPException(status_code=409, detail="해당 시간은 이미 예약이 완료되었습니다. 다른 시간을 선택해 주세요.")
+            logger.exception("Integrity error on POST /reservations/batch")
+            raise HTTPException(status_code=500, detail="예약 처리 중 DB 오류가 발생했습니다.")
+
         except SQLAlchemyError:
             await db.rollback()
-            logger.exception("DB error on POST /reservations")
+            logger.exception("DB error on POST /reservations/batch")
             raise HTTPException(status_code=500, detail="예약 처리 중 DB 오류가 발생했습니다.")
 
         except Exception:
             await db.rollback()
-            logger.exception("Unexpected error on POST /reservations")
+            logger.exception("Unexpected error on POST /reservations/batch")
             raise HTTPException(status_code=500, detail="예약 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.")
 
+        for item in items:
+            availability_service.mark_reserved(item.room_id, item.reservation_date, item.reservation_start_date, item.reservation_end_date)
+
+        return ReservationBatchResponse(
+            ok=True,
+            items=[
+                ReservationBatchItemResult(index=idx, status_code=201, reservation_id=reservation_id)
+                for idx, reservation_id in enumerate(reservation_ids)
+            ],
+        )
+
+    async def detail(self, db: AsyncSession, reservation_id: int, view: str = "full") -> ReservationDetail | ReservationCompactItem:
+        if view == "compact":
+            row = await reservation_repository.find_compact_by_id(db, reservation_id)
+            if not row:
+                raise HTTPException(status_code=404, detail="요청하신 예약 정보를 찾을 수 없습니다.")
+            return ReservationCompactItem.model_validate(row)
 
-    async def detail(self, db: AsyncSession, reservation_id: int) -> ReservationDetail:
         entity = await reservation_repository.find_by_id_with_items(db, reservation_id)
         if not entity:
             raise HTTPException(status_code=404, detail="요청하신 예약 정보를 찾을 수 없습니다.")
@@ -137,18 +300,67 @@ class ReservationService:
         result.facility_item = getattr(entity, "facility", None)
         return result
 
-    async def list_by_student(self, db: AsyncSession, student_id: int) -> ReservationListResponse:
-        rows = await reservation_repository.find_all_by_student_id_with_items(db, student_id)
-
-        items: list[ReservationListItemResponse] = []
-        for row in rows:
-            dto = ReservationListItemResponse.model_validate(row)
-            dto.student_item = getattr(row, "student", None)
-            dto.room_item = getattr(row, "room", None)
-            dto.facility_item = getattr(row, "facility", None)
-            items.append(dto)
+    def _encode_cursor(self, row) -> str:
+        raw = f"{row.reservation_date.isoformat()}|{row.reservation_start_date.isoformat()}|{row.reservation_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
-        return ReservationListResponse(items=items, total_count=len(items))
+    def _decode_cursor(self, cursor: str) -> tuple[date, datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            d, start, rid = raw.split("|")
+            return date.fromisoformat(d), datetime.fromisoformat(start), int(rid)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+    def _to_list_item(self, row, view: str = "full") -> ReservationListItemResponse | ReservationCompactItem:
+        if view == "compact":
+            return ReservationCompactItem.model_validate(row)
+
+        dto = ReservationListItemResponse.model_validate(row)
+        dto.student_item = getattr(row, "student", None)
+        dto.room_item = getattr(row, "room", None)
+        dto.facility_item = getattr(row, "facility", None)
+        return dto
+
+    async def list_by_student(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        status_filter: str = "all",
+        cursor: str | None = None,
+        limit: int = 20,
+        with_total: bool = False,
+        view: str = "full",
+    ) -> ReservationListResponse | ReservationCompactListResponse:
+        now = datetime.now()
+        rows = await reservation_repository.find_page_by_student_id(
+            db,
+            student_id,
+            status_filter,
+            now,
+            self._decode_cursor(cursor) if cursor else None,
+            limit,
+            compact=view == "compact",
+        )
+
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        items = [self._to_list_item(row, view) for row in rows]
+
+        total = await reservation_repository.count_by_student_id(db, student_id, status_filter, now) if with_total else None
+        response_class = ReservationCompactListResponse if view == "compact" else ReservationListResponse
+        return response_class(
+            items=items,
+            total_count=total,
+            next_cursor=self._encode_cursor(rows[-1]) if has_next else None,
+        )
+
+    async def stream_by_student(self, student_id: int, status_filter: str = "all", view: str = "full") -> AsyncIterator[bytes]:
+        """NDJSON 내보내기. 응답이 끝날 때까지 쓰는 세션이라 요청 스코프 세션과 분리한다."""
+        now = datetime.now()
+        async with AsyncSessionLocal() as db:
+            async for row in reservation_repository.stream_by_student_id(db, student_id, status_filter, now, compact=view == "compact"):
+                yield self._to_list_item(row, view).model_dump_json().encode("utf-8") + b"\n"
 
     async def cancel(self, db: AsyncSession, reservation_id: int, student_id: int):
         entity = await reservation_repository.find_by_id(db, reservation_id)
@@ -168,6 +380,19 @@ class ReservationService:
             entity.reservation_status = "취소"
             entity.cancel_date = date.today()
 
+        slot_admission.release(
+            entity.room_id,
+            entity.reservation_date,
+            entity.reservation_start_date,
+            entity.reservation_end_date,
+        )
+        availability_service.release(
+            entity.room_id,
+            entity.reservation_date,
+            entity.reservation_start_date,
+            entity.reservation_end_date,
+        )
+
         return {"ok": True, "message": "예약이 정상적으로 취소되었습니다."}
 
 
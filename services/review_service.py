@@ -1,11 +1,11 @@
+import base64
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import select
 
-from models.review import Review
-from models.study_room import StudyRoom
 from repositories.review_repository import review_repository
+from repositories.study_room_rating_repository import study_room_rating_repository
 
 from schemas.review import (
     ReviewCreate,
@@ -28,37 +28,27 @@ class ReviewService:
         if payload.rating < 1 or payload.rating > 5:
             raise HTTPException(status_code=400, detail="별점은 1~5 사이여야 합니다.")
 
-        # 스터디룸 존재 여부 확인
-        room = await db.get(StudyRoom, payload.room_id)
-        if not room:
-            raise HTTPException(status_code=404, detail="존재하지 않는 스터디룸입니다.")
-
-        # 동일 학생이 같은 방에 이미 리뷰 작성했는지 확인
-        stmt = select(Review).where(
-            Review.room_id == payload.room_id,
-            Review.student_id == student_id,
-        )
-    
-        res = await db.execute(stmt)
-        exists = res.scalar_one_or_none()
-
-        if exists:
-            raise HTTPException(status_code=400, detail="이미 해당 스터디룸에 리뷰를 작성했습니다.")
-
-        entity = Review(
-            room_id=payload.room_id,
-            student_id=student_id,
-            rating=payload.rating,
-            comment=payload.comment,
-        )
-
         try:
-            await review_repository.save(db, entity)
-            await db.flush()
+            # 방 존재 확인 + 중복 확인 + INSERT 를 한 문장으로 (중복은 unique 제약이 판정)
+            row = await review_repository.create_if_absent(
+                db,
+                room_id=payload.room_id,
+                student_id=student_id,
+                rating=payload.rating,
+                comment=payload.comment,
+            )
+            if not row.room_exists:
+                await db.rollback()
+                raise HTTPException(status_code=404, detail="존재하지 않는 스터디룸입니다.")
+            if row.review_id is None:
+                await db.rollback()
+                raise HTTPException(status_code=400, detail="이미 해당 스터디룸에 리뷰를 작성했습니다.")
+
+            # 같은 트랜잭션에서 집계 반영
+            await study_room_rating_repository.apply(db, payload.room_id, added=payload.rating)
             await db.commit()
-            await db.refresh(entity)
 
-            return ReviewCreateResponse(review_id=entity.review_id)
+            return ReviewCreateResponse(review_id=row.review_id)
 
         except SQLAlchemyError:
             await db.rollback()
@@ -79,24 +69,47 @@ class ReviewService:
         result.student_item = entity.student
         return result
 
-    # 특정 방 리뷰 목록
+    def _encode_cursor(self, row, sort: str) -> str:
+        raw = f"{row.rating if sort == 'rating' else row.review_id}|{row.review_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self, cursor: str) -> tuple[int, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            first, review_id = raw.split("|")
+            return int(first), int(review_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+    # 특정 방 리뷰 목록 (최신순/별점순 keyset 페이지)
     async def list_by_room(
         self,
         db: AsyncSession,
         room_id: int,
+        sort: str = "newest",
+        cursor: str | None = None,
+        limit: int = 20,
     ) -> ReviewListResponse:
 
-        rows = await review_repository.find_all_by_room_id(db, room_id)
+        rows = await review_repository.find_page_by_room_id(
+            db,
+            room_id,
+            sort,
+            self._decode_cursor(cursor) if cursor else None,
+            limit,
+        )
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        items = [ReviewListItemResponse.model_validate(row) for row in rows]
 
-        items: list[ReviewListItemResponse] = []
-        for row in rows:
-            dto = ReviewListItemResponse.model_validate(row)
-            dto.student_item = row.student
-            items.append(dto)
+        # 전체 건수는 행을 세지 않고 집계 테이블에서 읽음
+        rating = await study_room_rating_repository.find_by_room_id(db, room_id)
 
         return ReviewListResponse(
             items=items,
-            total_count=len(items),
+            total_count=rating.review_count if rating else 0,
+            next_cursor=self._encode_cursor(rows[-1], sort) if has_next else None,
         )
 
     # 리뷰 수정 (본인만)
@@ -116,6 +129,7 @@ class ReviewService:
         if entity.student_id != student_id:
             raise HTTPException(status_code=403, detail="본인의 리뷰만 수정할 수 있습니다.")
 
+        previous_rating = entity.rating
         if rating is not None:
             if rating < 1 or rating > 5:
                 raise HTTPException(status_code=400, detail="별점은 1~5 사이여야 합니다.")
@@ -125,6 +139,8 @@ class ReviewService:
             entity.comment = comment
 
         try:
+            if entity.rating != previous_rating:
+                await study_room_rating_repository.apply(db, entity.room_id, added=entity.rating, removed=previous_rating)
             await db.commit()
             return {"ok": True, "message": "리뷰가 수정되었습니다."}
         except SQLAlchemyError:
@@ -148,6 +164,7 @@ class ReviewService:
 
         try:
             await db.delete(entity)
+            await study_room_rating_repository.apply(db, entity.room_id, removed=entity.rating)
             await db.commit()
             return {"ok": True, "message": "리뷰가 삭제되었습니다."}
         except SQLAlchemyError:
@@ -0,0 +1,58 @@
+# /services/search_service.py
+import base64
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.search_repository import search_repository
+from schemas.search import SearchHit, SearchResponse
+
+SEARCH_KINDS = ("facility", "room", "review")
+
+
+class SearchService:
+
+    def _encode_cursor(self, row) -> str:
+        raw = f"{row.score!r}|{row.kind}|{row.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def _decode_cursor(self, cursor: str) -> tuple[float, str, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            score, kind, id_ = raw.split("|")
+            if kind not in SEARCH_KINDS:
+                raise ValueError(kind)
+            return float(score), kind, int(id_)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+    # 시설/스터디룸/리뷰 통합 검색 (점수순 keyset 페이지)
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        kind: str = "all",
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> SearchResponse:
+        q = q.strip()
+        if not q:
+            raise HTTPException(status_code=400, detail="검색어를 입력하세요.")
+
+        rows = await search_repository.search(
+            db,
+            q,
+            list(SEARCH_KINDS) if kind == "all" else [kind],
+            self._decode_cursor(cursor) if cursor else None,
+            limit,
+        )
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        return SearchResponse(
+            items=[SearchHit.model_validate(row) for row in rows],
+            next_cursor=self._encode_cursor(rows[-1]) if has_next else None,
+        )
+
+
+search_service = SearchService()
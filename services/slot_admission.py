@@ -0,0 +1,126 @@
+# /services/slot_admission.py
+import asyncio
+import time as clock
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import date, datetime
+
+from fastapi import HTTPException
+
+from configs.config import settings
+from services.availability_service import hours_mask
+
+
+class _SlotState:
+    __slots__ = ("lock", "waiting", "claimed", "claimed_at")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.waiting = 0
+        # 이 프로세스에서 예약에 성공한 시간대 (bit i = i시~i+1시)
+        self.claimed = 0
+        self.claimed_at = 0.0
+
+
+class SlotAdmission:
+    """
+    (room_id, date) 단위 예약 대기열.
+    같은 방/날짜 요청은 한 번에 하나씩 DB로 보내고, 이미 이 프로세스에서 잡힌 시간대이거나
+    대기열이 가득 찬 요청은 DB 커넥션을 쓰기 전에 바로 실패시킨다.
+    잡힌 시간대 정보는 다른 워커의 취소를 알 수 없으므로 claim_ttl_seconds 동안만 믿는다.
+    """
+
+    def __init__(self, queue_depth: int, timeout_seconds: float, claim_ttl_seconds: float):
+        self.queue_depth = queue_depth
+        self.timeout_seconds = timeout_seconds
+        self.claim_ttl_seconds = claim_ttl_seconds
+        self._slots: dict[tuple[int, date], _SlotState] = {}
+
+    def _expire_claim(self, state: _SlotState) -> None:
+        if state.claimed and clock.monotonic() - state.claimed_at >= self.claim_ttl_seconds:
+            state.claimed = 0
+
+    def _reject_if_claimed(self, state: _SlotState, mask: int) -> None:
+        self._expire_claim(state)
+        if state.claimed & mask:
+            raise HTTPException(status_code=409, detail="해당 시간은 이미 예약이 완료되었습니다. 다른 시간을 선택해 주세요.")
+
+    @asynccontextmanager
+    async def admit(self, room_id: int, target_date: date, start_at: datetime, end_at: datetime):
+        async with self._admit((room_id, target_date), hours_mask(target_date, start_at, end_at)):
+            yield
+
+    @asynccontextmanager
+    async def admit_many(self, slots: list[tuple[int, date, datetime, datetime]]):
+        """
+        일괄 예약용: 여러 (room_id, date) 대기열을 모두 통과한 뒤 진입한다.
+        같은 키는 시간대 마스크를 합쳐 한 번만 잡고, 키 정렬 순서로 잡아 요청 간 교착을 피한다.
+        """
+        masks: dict[tuple[int, date], int] = {}
+        for room_id, target_date, start_at, end_at in slots:
+            key = (room_id, target_date)
+            masks[key] = masks.get(key, 0) | hours_mask(target_date, start_at, end_at)
+
+        async with AsyncExitStack() as stack:
+            for key in sorted(masks):
+                await stack.enter_async_context(self._admit(key, masks[key]))
+            yield
+
+    @asynccontextmanager
+    async def _admit(self, key: tuple[int, date], mask: int):
+        state = self._slots.get(key)
+        if state is None:
+            self._prune()
+            state = self._slots[key] = _SlotState()
+
+        self._reject_if_claimed(state, mask)
+        if state.waiting >= self.queue_depth:
+            raise HTTPException(status_code=503, detail="예약 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+
+        state.waiting += 1
+        try:
+            try:
+                await asyncio.wait_for(state.lock.acquire(), timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                raise HTTPException(status_code=503, detail="예약 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+        finally:
+            state.waiting -= 1
+
+        try:
+            # 앞 요청이 같은 시간대를 잡았을 수 있으므로 락을 얻은 뒤 한 번 더 확인
+            self._reject_if_claimed(state, mask)
+            yield
+        finally:
+            state.lock.release()
+            self._cleanup(key, state)
+
+    def claim(self, room_id: int, target_date: date, start_at: datetime, end_at: datetime) -> None:
+        state = self._slots.get((room_id, target_date))
+        if state is not None:
+            state.claimed |= hours_mask(target_date, start_at, end_at)
+            state.claimed_at = clock.monotonic()
+
+    def release(self, room_id: int, target_date: date, start_at: datetime, end_at: datetime) -> None:
+        key = (room_id, target_date)
+        state = self._slots.get(key)
+        if state is not None:
+            state.claimed &= ~hours_mask(target_date, start_at, end_at)
+            self._cleanup(key, state)
+
+    def _cleanup(self, key: tuple[int, date], state: _SlotState) -> None:
+        # 대기자가 없고 잡힌 시간도 없거나 지난 날짜면 상태를 버린다.
+        if state.waiting or state.lock.locked():
+            return
+        self._expire_claim(state)
+        if not state.claimed or key[1] < date.today():
+            self._slots.pop(key, None)
+
+    def _prune(self) -> None:
+        for key, state in list(self._slots.items()):
+            self._cleanup(key, state)
+
+
+slot_admission = SlotAdmission(
+    settings.ADMISSION_QUEUE_DEPTH,
+    settings.ADMISSION_TIMEOUT_SECONDS,
+    settings.SLOT_ADMISSION_CLAIM_TTL_SECONDS,
+)
@@ -0,0 +1,159 @@
+# /services/student_provisioning_service.py
+import asyncio
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator
+
+import bcrypt
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.config import settings
+from repositories.student_repository import student_repository
+from schemas.bulk_import import BulkImportError, StudentProvisionResponse
+from schemas.student import StudentCreate
+from services.bulk_import_service import MAX_REPORTED_ERRORS, iter_lines, iter_records, validation_message
+
+
+def _hash_chunk(passwords: list[str], rounds: int) -> list[str]:
+    # 프로세스 풀에서 실행 (pickle 가능한 최상위 함수), 청크 단위로 보내 IPC 횟수를 줄인다
+    return [bcrypt.hashpw(p.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode("utf-8") for p in passwords]
+
+
+class StudentProvisioningService:
+    """
+    학기 초 학생 명단(CSV/NDJSON) 일괄 등록.
+    - 배치마다 이미 있는 학번을 먼저 조회해 건너뛴다 (bcrypt 비용을 쓰지 않음). 조회는 짧은 트랜잭션으로 끝내고 해시한다.
+    - 남은 비밀번호는 PROVISION_HASH_WORKERS 개 프로세스에 나눠 해시한다 (로그인용 password_hasher 와 별도 풀).
+    - INSERT ... ON CONFLICT (student_no) DO NOTHING 으로 넣고 배치마다 커밋한다. 동시에 가입한 학번도 skipped 로 센다.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def _hash_all(self, passwords: list[str]) -> list[str]:
+        if not passwords:
+            return []
+        loop = asyncio.get_running_loop()
+        # 워커당 여러 청크로 나눠 먼저 끝난 워커가 다음 청크를 가져가게 한다
+        size = max(1, math.ceil(len(passwords) / (self.workers * 4)))
+        chunks = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._get_executor(), _hash_chunk, chunk, settings.BCRYPT_ROUNDS) for chunk in chunks)
+        )
+        return [h for chunk in results for h in chunk]
+
+    async def _provision_batch(
+        self,
+        db: AsyncSession,
+        batch: list[tuple[int, dict]],
+        errors: list[BulkImportError],
+    ) -> tuple[int, int]:
+        """(created, skipped) 를 돌려준다. 나머지는 실패."""
+        existing = await student_repository.find_existing_student_nos(db, [row["student_no"] for _, row in batch])
+        # 조회 트랜잭션은 여기서 끝낸다 (해시하는 수 초 동안 커넥션을 idle in transaction 으로 잡지 않게)
+        await db.commit()
+
+        # DB 에 이미 있거나 배치 안에서 중복된 학번은 해시하지 않는다
+        seen: set[str] = set()
+        todo: list[tuple[int, dict]] = []
+        for line, row in batch:
+            if row["student_no"] in existing or row["student_no"] in seen:
+                continue
+            seen.add(row["student_no"])
+            todo.append((line, row))
+        skipped = len(batch) - len(todo)
+
+        hashes = await self._hash_all([row["student_password"] for _, row in todo])
+        rows = [{**row, "student_password": h} for (_, row), h in zip(todo, hashes)]
+
+        created = 0
+        try:
+            async with db.begin_nested():
+                created = await student_repository.insert_many_skip_existing(db, rows)
+            skipped += len(rows) - created
+        except DBAPIError:
+            # 배치 안의 실패 행 (길이 초과 등) 만 골라내고 나머지는 넣는다
+            for (line, _), row in zip(todo, rows):
+                try:
+                    async with db.begin_nested():
+                        n = await student_repository.insert_many_skip_existing(db, [row])
+                    created += n
+                    skipped += 1 - n
+                except DBAPIError as e:
+                    self._add_error(errors, line, str(e.orig))
+
+        await db.commit()
+        return created, skipped
+
+    def _add_error(self, errors: list[BulkImportError], line: int, message: str) -> None:
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(BulkImportError(line=line, error=message))
+
+    async def provision_stream(
+        self,
+        db: AsyncSession,
+        chunks: AsyncIterator[bytes],
+        fmt: str = "csv",
+        batch_size: int = 1000,
+    ) -> StudentProvisionResponse:
+        started = time.perf_counter()
+
+        total = created = skipped = failed = 0
+        errors: list[BulkImportError] = []
+        batch: list[tuple[int, dict]] = []
+
+        async def flush() -> None:
+            nonlocal created, skipped, failed
+            c, s = await self._provision_batch(db, batch, errors)
+            created += c
+            skipped += s
+            failed += len(batch) - c - s
+            batch.clear()
+
+        async for line, record, parse_error in iter_records(iter_lines(chunks), fmt):
+            total += 1
+            if parse_error:
+                failed += 1
+                self._add_error(errors, line, parse_error)
+                continue
+            try:
+                row = StudentCreate.model_validate(record).model_dump()
+            except ValidationError as e:
+                failed += 1
+                self._add_error(errors, line, validation_message(e))
+                continue
+
+            batch.append((line, row))
+            if len(batch) >= batch_size:
+                await flush()
+
+        if batch:
+            await flush()
+
+        elapsed = time.perf_counter() - started
+        return StudentProvisionResponse(
+            total=total,
+            created=created,
+            skipped=skipped,
+            failed=failed,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(total / elapsed, 1) if elapsed else 0.0,
+            errors=errors,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+student_provisioning_service = StudentProvisioningService(settings.PROVISION_HASH_WORKERS)
@@ -1,6 +1,8 @@
 # /services/study_room_service.py
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from http_cache import latest, make_etag
+from services.image_service import image_service
 from repositories.study_room_repository import study_room_repository
 
 from models.facility import Facility
@@ -9,6 +11,7 @@ from schemas.study_room import (
     StudyRoomCreate,
     StudyRoomCreateResponse,
     StudyRoomDetail,
+    StudyRoomImageResponse,
     StudyRoomListItemResponse,
     StudyRoomListResponse
 )
@@ -39,12 +42,56 @@ class StudyRoomServices:
         return StudyRoomCreateResponse(room_id=e.room_id)
     
     
+    async def detail_validator(self, db: AsyncSession, room_id: int):
+        """상세 ETag/Last-Modified 계산용 (방/시설/리뷰집계 수정 시각), 방이 없으면 None"""
+        v = await study_room_repository.find_version(db, room_id)
+        if v is None:
+            return None
+        return (
+            make_etag("study_room", room_id, v.room_up_date, v.facility_up_date, v.rating_up_date),
+            latest(v.room_up_date, v.facility_up_date, v.rating_up_date),
+        )
+
+    async def list_validator(self, db: AsyncSession, facility_id: int, room_floor: str, room_capacity: int):
+        """목록 ETag/Last-Modified 계산용 (같은 필터로 건수 + 각 max(up_date))"""
+        v = await study_room_repository.find_list_version(db, facility_id, room_floor, room_capacity)
+        return (
+            make_etag(
+                "study_rooms",
+                facility_id,
+                room_floor,
+                room_capacity,
+                v.room_count,
+                v.room_up_date,
+                v.facility_up_date,
+                v.rating_up_date,
+            ),
+            latest(v.room_up_date, v.facility_up_date, v.rating_up_date),
+        )
+
     async def detail(self, db: AsyncSession, room_id: int) -> StudyRoomDetail:
+        e = await study_room_repository.find_by_id_with_items(db, room_id)
+        if not e:
+            raise ValueError(f"StudyRoom not found. id={room_id}")
+
+        item = StudyRoomDetail.model_validate(e)
+        item.image_urls = image_service.urls(e.room_image)
+        return item
+
+    async def update_image(self, db: AsyncSession, room_id: int, upload) -> StudyRoomImageResponse:
         e = await study_room_repository.find_by_id(db, room_id)
         if not e:
             raise ValueError(f"StudyRoom not found. id={room_id}")
 
-        return StudyRoomDetail.model_validate(e)
+        # 원본 저장 + 썸네일 생성 예약, room_image 에는 해시 파일명을 기록
+        e.room_image = await image_service.save_original(upload)
+        await db.commit()
+
+        return StudyRoomImageResponse(
+            room_id=room_id,
+            room_image=e.room_image,
+            image_urls=image_service.urls(e.room_image),
+        )
 
     async def list_by_facility(
         self,
@@ -55,7 +102,11 @@ class StudyRoomServices:
         ) -> StudyRoomListResponse:
         rows = await study_room_repository.find_all_by_facility_id(db, facility_id, room_floor, room_capacity)
 
-        items = [StudyRoomListItemResponse.model_validate(x) for x in rows]
+        items = []
+        for x in rows:
+            item = StudyRoomListItemResponse.model_validate(x)
+            item.thumbnail_urls = image_service.thumbnail_urls(x.room_image)
+            items.append(item)
         return StudyRoomListResponse(items=items, total_count=len(items))
     
 study_room_service = StudyRoomServices()
\ No newline at end of file
@@ -0,0 +1,71 @@
+# /services/token_cache.py
+import time
+from collections import OrderedDict
+
+from configs.config import settings
+from services.principal_cache import token_key
+
+
+class VerifiedTokenCache:
+    """
+    서명/만료 검증을 통과한 JWT 의 클레임을 token digest 로 보관하는 LRU 캐시.
+    항목은 토큰 exp 까지만 유효하고, 읽을 때 만료됐으면 버린다. exp 없는 토큰은 넣지 않는다.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # key -> (claims, exp unix time)
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> dict | None:
+        key = token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        claims, exp = entry
+        if time.time() >= exp:
+            del self._entries[key]
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time() or self.max_entries <= 0:
+            return
+
+        key = token_key(token)
+        self._entries[key] = (claims, float(exp))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
+
+
+verified_token_cache = VerifiedTokenCache(settings.JWT_CACHE_MAX_ENTRIES)
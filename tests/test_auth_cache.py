@@ -0,0 +1,263 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from configs.config import settings
+from models.student import Student
+from services import auth_service as auth_service_module
+from services import principal_cache as principal_cache_module
+from services import token_cache as token_cache_module
+from services.auth_service import ALGORITHM, SECRET_KEY, auth_service
+from services.principal_cache import Principal, PrincipalCache, principal_cache
+from services.token_cache import VerifiedTokenCache, verified_token_cache
+
+
+class Clock:
+    """time.time / time.monotonic 대신 쓰는 수동 시계"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(principal_cache_module.time, "time", fake)
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", fake)
+    assert token_cache_module.time is principal_cache_module.time
+    return fake
+
+
+def principal(student_id: int) -> Principal:
+    return Principal(student_id=student_id, student_no=f"s{student_id}", student_name="이름", student_department="학과")
+
+
+def student() -> Student:
+    return Student(
+        student_id=7,
+        student_no="2024007",
+        student_password="hashed",
+        student_name="홍길동",
+        student_department="컴퓨터공학과",
+        student_phone="010-0000-0000",
+    )
+
+
+# --- PrincipalCache ---
+
+def test_principal_cache_hit_and_miss(clock):
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=clock.now + 600)
+
+    assert cache.get("t1") == principal(1)
+    assert cache.get("t2") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_principal_cache_expires_at_token_exp_before_ttl(clock):
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=clock.now + 5)
+
+    clock.now += 4.9
+    assert cache.get("t1") is not None
+    clock.now += 0.1
+    assert cache.get("t1") is None
+    assert cache.snapshot()["size"] == 0
+
+
+def test_principal_cache_expires_at_ttl(clock):
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=None)
+
+    clock.now += 59
+    assert cache.get("t1") is not None
+    clock.now += 1
+    assert cache.get("t1") is None
+
+
+def test_principal_cache_skips_expired_token(clock):
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=clock.now - 1)
+    assert cache.snapshot()["size"] == 0
+
+
+def test_principal_cache_evicts_least_recently_used(clock):
+    cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=None)
+    cache.put("t2", principal(2), exp=None)
+    cache.get("t1")
+    cache.put("t3", principal(3), exp=None)
+
+    assert cache.get("t2") is None
+    assert cache.get("t1") is not None
+    assert cache.get("t3") is not None
+    assert cache.evictions == 1
+    # 밀려난 항목은 학생별 색인에서도 빠진다
+    assert 2 not in cache._by_student
+
+
+def test_principal_cache_invalidate_student(clock):
+    cache = PrincipalCache(max_entries=10, ttl_seconds=60)
+    cache.put("t1", principal(1), exp=None)
+    cache.put("t1b", principal(1), exp=None)
+    cache.put("t2", principal(2), exp=None)
+
+    cache.invalidate_student(1)
+
+    assert cache.get("t1") is None
+    assert cache.get("t1b") is None
+    assert cache.get("t2") is not None
+    assert cache.invalidations == 1
+
+
+# --- VerifiedTokenCache ---
+
+def test_token_cache_hit_until_exp(clock):
+    cache = VerifiedTokenCache(max_entries=10)
+    claims = {"sub": "1", "exp": clock.now + 30}
+    cache.put("t1", claims)
+
+    assert cache.get("t1") is claims
+    clock.now += 30
+    assert cache.get("t1") is None
+    assert (cache.hits, cache.misses, cache.expired) == (1, 1, 1)
+
+
+def test_token_cache_ignores_tokens_without_future_exp(clock):
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.put("no-exp", {"sub": "1"})
+    cache.put("past", {"sub": "1", "exp": clock.now - 1})
+    assert cache.snapshot()["size"] == 0
+
+
+def test_token_cache_evicts_least_recently_used(clock):
+    cache = VerifiedTokenCache(max_entries=2)
+    for token in ("t1", "t2"):
+        cache.put(token, {"sub": token, "exp": clock.now + 60})
+    cache.get("t1")
+    cache.put("t3", {"sub": "t3", "exp": clock.now + 60})
+
+    assert cache.get("t2") is None
+    assert cache.get("t1") is not None
+    assert cache.evictions == 1
+
+
+# --- 토큰 클레임 / get_current_user ---
+
+@pytest.fixture
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(principal_cache, "_entries", type(principal_cache._entries)())
+    monkeypatch.setattr(principal_cache, "_by_student", {})
+    monkeypatch.setattr(verified_token_cache, "_entries", type(verified_token_cache._entries)())
+
+
+def test_token_has_no_profile_claims_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS", False)
+    token = auth_service.create_access_token(7, student())
+
+    claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert set(claims) == {"sub", "exp"}
+
+
+def test_stateless_token_carries_profile_without_phone(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    token = auth_service.create_access_token(7, student())
+
+    claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert set(claims) == {"sub", "exp", "no", "name", "dept"}
+    assert claims["no"] == "2024007"
+
+
+def test_stateless_get_current_user_skips_db(monkeypatch, fresh_caches):
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    token = auth_service.create_access_token(7, student())
+
+    async def fail_get_student(db, student_id):
+        raise AssertionError("stateless mode must not load the student")
+
+    monkeypatch.setattr(auth_service, "get_student", fail_get_student)
+
+    first = asyncio.run(auth_service.get_current_user(None, token))
+    second = asyncio.run(auth_service.get_current_user(None, token))
+
+    assert first == Principal(7, "2024007", "홍길동", "컴퓨터공학과", None)
+    assert second is first
+
+
+def test_default_mode_loads_student_once_then_caches(monkeypatch, fresh_caches):
+    monkeypatch.setattr(settings, "AUTH_STATELESS", False)
+    token = auth_service.create_access_token(7, student())
+    loads = []
+
+    async def get_student(db, student_id):
+        loads.append(student_id)
+        return student()
+
+    monkeypatch.setattr(auth_service, "get_student", get_student)
+
+    first = asyncio.run(auth_service.get_current_user(None, token))
+    second = asyncio.run(auth_service.get_current_user(None, token))
+
+    assert loads == [7]
+    assert first.student_phone == "010-0000-0000"
+    assert second is first
+
+
+def test_stateless_falls_back_to_db_for_tokens_without_profile(monkeypatch, fresh_caches):
+    # 무상태 모드로 바꾸기 전에 발급된 토큰
+    monkeypatch.setattr(settings, "AUTH_STATELESS", False)
+    token = auth_service.create_access_token(7, student())
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    loads = []
+
+    async def get_student(db, student_id):
+        loads.append(student_id)
+        return student()
+
+    monkeypatch.setattr(auth_service, "get_student", get_student)
+
+    asyncio.run(auth_service.get_current_user(None, token))
+    assert loads == [7]
+
+
+def test_expired_token_is_rejected(fresh_caches):
+    token = jwt.encode({"sub": "7", "exp": int(time.time()) - 10}, SECRET_KEY, algorithm=ALGORITHM)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.get_current_user(None, token))
+    assert exc.value.status_code == 401
+
+
+def test_decode_token_verifies_signature_once_per_token(monkeypatch, fresh_caches):
+    decodes = []
+    real_decode = auth_service_module.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        decodes.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth_service_module.jwt, "decode", counting_decode)
+    token = auth_service.create_access_token(7)
+
+    first = auth_service.decode_token(token)
+    second = auth_service.decode_token(token)
+
+    assert first["sub"] == "7"
+    assert second is first
+    assert decodes == [token]
+
+
+def test_decode_token_does_not_cache_invalid_tokens(fresh_caches):
+    token = auth_service.create_access_token(7)
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidTokenError):
+            auth_service.decode_token(tampered)
+    assert verified_token_cache.get(tampered) is None
+    assert verified_token_cache.snapshot()["size"] == 0
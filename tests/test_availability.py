@@ -0,0 +1,105 @@
+import asyncio
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from repositories.reservation_disable_repository import reservation_disable_repository
+from repositories.reservation_repository import reservation_repository
+from services.availability_service import FULL_DAY_MASK, AvailabilityService, hours_mask
+
+DAY = date.today() + timedelta(days=1)
+
+
+def at(hour: int, minute: int = 0, day: date = DAY) -> datetime:
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour, minutes=minute)
+
+
+def bits(*hours: int) -> int:
+    return sum(1 << h for h in hours)
+
+
+def test_hours_mask_whole_hours():
+    assert hours_mask(DAY, at(9), at(11)) == bits(9, 10)
+
+
+def test_hours_mask_partial_hours_cover_touched_slots():
+    assert hours_mask(DAY, at(9, 30), at(10, 15)) == bits(9, 10)
+
+
+def test_hours_mask_last_slot_of_day():
+    assert hours_mask(DAY, at(23), at(0, day=DAY + timedelta(days=1))) == bits(23)
+
+
+def test_hours_mask_clips_to_the_day():
+    assert hours_mask(DAY, at(22, day=DAY - timedelta(days=1)), at(2)) == bits(0, 1)
+    assert hours_mask(DAY, at(23), at(3, day=DAY + timedelta(days=1))) == bits(23)
+    assert hours_mask(DAY, at(0), at(0, day=DAY + timedelta(days=1))) == FULL_DAY_MASK
+
+
+def test_hours_mask_empty_range():
+    assert hours_mask(DAY, at(10), at(10)) == 0
+    assert hours_mask(DAY, at(1, day=DAY - timedelta(days=1)), at(5, day=DAY - timedelta(days=1))) == 0
+
+
+@pytest.fixture
+def ranges(monkeypatch):
+    """room_id -> (예약 구간, 차단 구간). 조회 횟수를 loads 에 기록"""
+    data: dict[int, tuple[list, list]] = {}
+    loads: list[int] = []
+
+    async def booked(db, room_id, target_date):
+        loads.append(room_id)
+        return data.get(room_id, ([], []))[0]
+
+    async def blocked(db, room_id, target_date):
+        return data.get(room_id, ([], []))[1]
+
+    monkeypatch.setattr(reservation_repository, "find_booked_ranges_by_room_and_date", booked)
+    monkeypatch.setattr(reservation_disable_repository, "find_ranges_by_room_and_date", blocked)
+    return data, loads
+
+
+def test_masks_combine_reservations_and_blackout(ranges):
+    data, _ = ranges
+    data[1] = (
+        [(at(9), at(10)), (at(13, 30), at(15)), (at(23), at(0, day=DAY + timedelta(days=1)))],
+        [(at(18), at(20))],
+    )
+    service = AvailabilityService(ttl_seconds=60, max_entries=10)
+
+    reserved, blocked = asyncio.run(service.get_masks(None, 1, DAY))
+
+    assert reserved == bits(9, 13, 14, 23)
+    assert blocked == bits(18, 19)
+    assert FULL_DAY_MASK & ~(reserved | blocked) == FULL_DAY_MASK & ~bits(9, 13, 14, 18, 19, 23)
+
+
+def test_mark_reserved_and_release_update_cached_bits(ranges):
+    data, loads = ranges
+    data[1] = ([(at(9), at(10))], [])
+    service = AvailabilityService(ttl_seconds=60, max_entries=10)
+    asyncio.run(service.get_masks(None, 1, DAY))
+
+    service.mark_reserved(1, DAY, at(23), at(0, day=DAY + timedelta(days=1)))
+    assert asyncio.run(service.get_masks(None, 1, DAY)) == (bits(9, 23), 0)
+
+    service.release(1, DAY, at(9), at(10))
+    assert asyncio.run(service.get_masks(None, 1, DAY)) == (bits(23), 0)
+    assert loads == [1]
+
+
+def test_lru_eviction_at_max_entries(ranges):
+    _, loads = ranges
+    service = AvailabilityService(ttl_seconds=60, max_entries=2)
+
+    asyncio.run(service.get_masks(None, 1, DAY))
+    asyncio.run(service.get_masks(None, 2, DAY))
+    asyncio.run(service.get_masks(None, 1, DAY))  # 1 을 최근 사용으로
+    asyncio.run(service.get_masks(None, 3, DAY))  # 2 가 밀려남
+
+    assert list(service._masks) == [(1, DAY), (3, DAY)]
+    assert loads == [1, 2, 3]
+
+    asyncio.run(service.get_masks(None, 2, DAY))
+    assert loads == [1, 2, 3, 2]
+    assert len(service._masks) == 2
@@ -0,0 +1,96 @@
+import asyncio
+
+from services.bulk_import_service import iter_lines, iter_records
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def parse(data: bytes, fmt: str = "csv", size: int = 7) -> list:
+    async def collect():
+        return [r async for r in iter_records(iter_lines(chunked(data, size)), fmt)]
+
+    return asyncio.run(collect())
+
+
+def test_quoted_newlines_stay_in_one_record():
+    data = (
+        "room_name,room_equipment\r\n"
+        '"A-101","화이트보드\r\n모니터"\r\n'
+        "\r\n"
+        '"B-202","말하길 ""조용함""\n\n창가"\n'
+        "C-303,없음\n"
+    ).encode("utf-8")
+
+    records = parse(data)
+
+    assert records == [
+        (2, {"room_name": "A-101", "room_equipment": "화이트보드\n모니터"}, None),
+        (5, {"room_name": "B-202", "room_equipment": '말하길 "조용함"\n\n창가'}, None),
+        (8, {"room_name": "C-303", "room_equipment": "없음"}, None),
+    ]
+
+
+def test_column_mismatch_reports_record_start_line():
+    data = 'a,b\n1,"x\ny",3\n4,5\n'.encode("utf-8")
+
+    records = parse(data)
+
+    assert records[0] == (2, None, "컬럼 수가 헤더와 다릅니다. (3 != 2)")
+    assert records[1] == (4, {"a": "4", "b": "5"}, None)
+
+
+def test_unterminated_quote_is_reported():
+    data = 'a,b\n1,2\n3,"never closed\n4,5\n'.encode("utf-8")
+
+    records = parse(data)
+
+    assert records[0] == (2, {"a": "1", "b": "2"}, None)
+    assert records[1] == (3, None, "따옴표가 닫히지 않은 채 파일이 끝났습니다.")
+
+
+def test_ndjson_lines_unchanged():
+    data = '{"a": 1}\n\nnot json\n[1]\n'.encode("utf-8")
+
+    records = parse(data, fmt="ndjson")
+
+    assert records[0] == (1, {"a": 1}, None)
+    assert records[1][0] == 3 and records[1][1] is None
+    assert records[2] == (4, None, "JSON 객체가 아닙니다.")
+
+
+def test_stray_quote_in_unquoted_field_is_literal():
+    data = 'room_name,room_equipment\nA,27" 모니터\nB,화이트보드\nC,빔\n'.encode("utf-8")
+
+    records = parse(data)
+
+    assert records == [
+        (2, {"room_name": "A", "room_equipment": '27" 모니터'}, None),
+        (3, {"room_name": "B", "room_equipment": "화이트보드"}, None),
+        (4, {"room_name": "C", "room_equipment": "빔"}, None),
+    ]
+
+
+def test_escaped_quotes_inside_quoted_field():
+    # "" 가 줄 끝에 와도 따옴표 필드는 닫히지 않는다
+    data = 'a,b\n1,"say ""hi"""\n2,"x ""\ny"\n'.encode("utf-8")
+
+    records = parse(data)
+
+    assert records == [
+        (2, {"a": "1", "b": 'say "hi"'}, None),
+        (3, {"a": "2", "b": 'x "\ny'}, None),
+    ]
+
+
+def test_quoted_field_spanning_several_lines():
+    data = 'a,b\n1,"first\nsecond, still\n\nthird"\n2,last\n'.encode("utf-8")
+
+    records = parse(data)
+
+    assert records == [
+        (2, {"a": "1", "b": "first\nsecond, still\n\nthird"}, None),
+        (6, {"a": "2", "b": "last"}, None),
+    ]
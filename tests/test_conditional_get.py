@@ -0,0 +1,120 @@
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from repositories.facility_repository import facility_repository
+from repositories.study_room_repository import study_room_repository
+from schemas.facility import FacilityAvailabilityResponse, FacilityListResponse
+from schemas.study_room import StudyRoomListResponse
+from services.availability_service import availability_service
+from services.facility_service import facility_service
+from services.study_room_service import study_room_service
+
+UPDATED = datetime(2026, 3, 1, 9, 30, 15, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def facility_table(monkeypatch):
+    """facility 목록 검증값 (건수, max(up_date)) 을 흉내 내는 가변 상태"""
+    state = SimpleNamespace(count=2, up_date=UPDATED)
+
+    async def find_list_version(db):
+        return state.count, state.up_date
+
+    async def list_facilities(db):
+        return FacilityListResponse(items=[], total_count=state.count)
+
+    monkeypatch.setattr(facility_repository, "find_list_version", find_list_version)
+    monkeypatch.setattr(facility_service, "list", list_facilities)
+    return state
+
+
+def test_facility_list_sends_validators(client, facility_table):
+    res = client.get("/api/facilities")
+    assert res.status_code == 200
+    assert res.headers["ETag"].startswith('"')
+    assert res.headers["Last-Modified"] == format_datetime(UPDATED, usegmt=True)
+
+
+def test_facility_list_304_on_if_none_match(client, facility_table):
+    etag = client.get("/api/facilities").headers["ETag"]
+    res = client.get("/api/facilities", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["ETag"] == etag
+
+
+def test_facility_list_304_on_if_modified_since(client, facility_table):
+    last_modified = client.get("/api/facilities").headers["Last-Modified"]
+    res = client.get("/api/facilities", headers={"If-Modified-Since": last_modified})
+    assert res.status_code == 304
+
+
+def test_facility_list_validator_changes_after_write(client, facility_table):
+    first = client.get("/api/facilities")
+    etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+
+    # 시설 추가: 건수와 max(up_date) 가 바뀐다
+    facility_table.count += 1
+    facility_table.up_date += timedelta(minutes=5)
+
+    res = client.get("/api/facilities", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    assert res.json()["total_count"] == 3
+
+    res = client.get("/api/facilities", headers={"If-Modified-Since": last_modified})
+    assert res.status_code == 200
+
+
+def test_facility_list_validator_changes_when_row_deleted(client, facility_table):
+    etag = client.get("/api/facilities").headers["ETag"]
+    # 삭제는 max(up_date) 를 바꾸지 않을 수 있지만 건수가 바뀐다
+    facility_table.count -= 1
+    res = client.get("/api/facilities", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+
+
+def test_study_room_list_conditional_get(client, monkeypatch):
+    state = SimpleNamespace(room_count=1, room_up_date=UPDATED, facility_up_date=UPDATED, rating_up_date=None)
+
+    async def find_list_version(db, facility_id, room_floor=None, room_capacity=None):
+        return state
+
+    async def list_by_facility(db, facility_id, room_floor, room_capacity):
+        return StudyRoomListResponse(items=[], total_count=state.room_count)
+
+    monkeypatch.setattr(study_room_repository, "find_list_version", find_list_version)
+    monkeypatch.setattr(study_room_service, "list_by_facility", list_by_facility)
+
+    etag = client.get("/api/study-rooms", params={"facilityId": 1}).headers["ETag"]
+    assert client.get("/api/study-rooms", params={"facilityId": 1}, headers={"If-None-Match": etag}).status_code == 304
+    # 필터가 다르면 다른 ETag
+    assert client.get("/api/study-rooms", params={"facilityId": 2}, headers={"If-None-Match": etag}).status_code == 200
+
+    # 리뷰가 달려 집계 시각이 생기면 ETag 가 바뀐다
+    state.rating_up_date = UPDATED + timedelta(minutes=1)
+    assert client.get("/api/study-rooms", params={"facilityId": 1}, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_facility_availability_uses_shared_conditional_get(client, monkeypatch):
+    grid = FacilityAvailabilityResponse(facility_id=1, dates=[date.today()], rooms=[])
+
+    async def facility_grid(db, facility_id, from_date, days):
+        return grid, '"grid-v1"'
+
+    monkeypatch.setattr(availability_service, "facility_grid", facility_grid)
+
+    res = client.get("/api/facilities/1/availability")
+    assert res.status_code == 200
+    assert res.headers["ETag"] == '"grid-v1"'
+    assert "max-age=0" in res.headers["Cache-Control"]
+
+    for if_none_match in ('"grid-v1"', 'W/"grid-v1"', '"old", "grid-v1"', "*"):
+        res = client.get("/api/facilities/1/availability", headers={"If-None-Match": if_none_match})
+        assert res.status_code == 304, if_none_match
+        assert res.headers["ETag"] == '"grid-v1"'
+
+    assert client.get("/api/facilities/1/availability", headers={"If-None-Match": '"old"'}).status_code == 200
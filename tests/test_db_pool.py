@@ -0,0 +1,104 @@
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from configs import db_pool
+from configs.config import settings
+from configs.db_pool import WAIT_BUCKETS_MS, InstrumentedQueuePool, PoolMetrics, instrument
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    fresh = PoolMetrics()
+    monkeypatch.setattr(db_pool, "pool_metrics", fresh)
+    return fresh
+
+
+@pytest.fixture
+def pool(metrics):
+    # Postgres 없이 같은 풀 클래스/이벤트를 확인하도록 sqlite 커넥션을 만드는 풀에 직접 건다
+    # (instrument 는 engine.sync_engine 에 이벤트를 걸고, 풀 이벤트는 풀 자체에도 걸 수 있다)
+    instrumented = InstrumentedQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.05)
+    instrument(SimpleNamespace(sync_engine=instrumented))
+    yield instrumented
+    instrumented.dispose()
+
+
+def run(fn):
+    # AsyncAdaptedQueuePool 은 greenlet 안에서 대기한다 (AsyncEngine 이 하는 것과 같이)
+    return asyncio.run(greenlet_spawn(fn))
+
+
+def test_counters_follow_checkout_checkin_and_timeout(pool, metrics):
+    def work():
+        conn = pool.connect()
+        conn.cursor().execute("select 1")
+        # 풀 크기 1, overflow 0 -> 두 번째 체크아웃은 timeout 뒤 실패
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+        conn.close()
+        pool.connect().close()
+
+    run(work)
+
+    assert metrics.connects == 1
+    assert metrics.checkouts == 2
+    assert metrics.checkins == 2
+    assert metrics.timeouts == 1
+
+    snapshot = metrics.snapshot(SimpleNamespace(sync_engine=SimpleNamespace(pool=pool)))
+    assert snapshot["checkout_timeouts"] == 1
+    assert snapshot["size"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["wait_ms"]["count"] == 3
+    # 타임아웃 한 번은 50ms 이상 기다렸다
+    assert snapshot["wait_ms"]["max"] >= 50
+    assert sum(snapshot["wait_ms"]["histogram"].values()) == 3
+
+
+def test_invalidated_connection_is_counted_and_replaced(pool, metrics):
+    def work():
+        conn = pool.connect()
+        conn.invalidate()
+        conn.close()
+        pool.connect().close()
+
+    run(work)
+
+    assert metrics.invalidations == 1
+    assert metrics.connects == 2
+
+
+def test_wait_histogram_buckets():
+    metrics = PoolMetrics()
+    metrics.observe_wait(0.0005)  # 0.5ms
+    metrics.observe_wait(0.001)  # 1ms 는 le_1ms
+    metrics.observe_wait(0.0011)
+    metrics.observe_wait(10)  # 10s
+
+    assert metrics.wait_buckets[0] == 2
+    assert metrics.wait_buckets[1] == 1
+    assert metrics.wait_buckets[len(WAIT_BUCKETS_MS)] == 1
+    assert metrics.wait_max_ms == 10_000
+
+
+def test_reset_clears_counters(metrics):
+    metrics.checkouts = 5
+    metrics.observe_wait(0.01)
+    metrics.reset()
+    assert metrics.checkouts == 0
+    assert sum(metrics.wait_buckets) == 0
+    assert metrics.wait_max_ms == 0.0
+
+
+def test_health_endpoint_reports_app_pool(client):
+    body = client.get("/health/db-pool").json()
+
+    assert body["pool"] == "InstrumentedQueuePool"
+    assert body["size"] == settings.DB_POOL_SIZE
+    assert body["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert set(body["wait_ms"]["histogram"]) == {f"le_{b}ms" for b in WAIT_BUCKETS_MS} | {f"gt_{WAIT_BUCKETS_MS[-1]}ms"}
@@ -0,0 +1,192 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from repositories.facility_repository import facility_repository
+from services.facility_service import facility_service
+
+
+class CountingSession:
+    """execute 호출 수를 세고 미리 준 행을 돌려준다. 그 밖의 DB 접근은 실패."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executes = 0
+
+    async def execute(self, stmt):
+        self.executes += 1
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def __getattr__(self, name):
+        raise AssertionError(f"unexpected DB access: {name}")
+
+
+def overview_row(room_id, **overrides):
+    row = dict(
+        facility_id=1,
+        facility_name="중앙도서관",
+        facility_address="서울",
+        facility_desc="열람실",
+        facility_use_tf=True,
+        room_id=room_id,
+        room_name=f"room-{room_id}",
+        room_floor="1층",
+        room_image=None,
+        room_capacity=4,
+        room_equipment=None,
+        use_tf=True,
+        rating_sum=9,
+        review_count=2,
+        star_1=0,
+        star_2=0,
+        star_3=0,
+        star_4=1,
+        star_5=1,
+        booked_hours=3,
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+@pytest.mark.parametrize("n_rooms", [1, 5, 50])
+def test_overview_is_one_query_regardless_of_room_count(n_rooms):
+    db = CountingSession([overview_row(i) for i in range(1, n_rooms + 1)])
+
+    result = asyncio.run(facility_service.overview(db, 1, date.today()))
+
+    assert db.executes == 1
+    assert [room.room_id for room in result.rooms] == list(range(1, n_rooms + 1))
+
+
+def test_overview_assembles_facility_and_room_aggregates():
+    day = date(2026, 3, 2)
+    rows = [
+        overview_row(1),
+        # 리뷰/예약 없는 방: 집계 컬럼이 NULL (LEFT JOIN)
+        overview_row(
+            2,
+            room_name="B-202",
+            room_floor="2층",
+            room_image="abc.png",
+            room_capacity=8,
+            room_equipment="모니터",
+            use_tf=False,
+            rating_sum=None,
+            review_count=None,
+            star_1=None,
+            star_2=None,
+            star_3=None,
+            star_4=None,
+            star_5=None,
+            booked_hours=None,
+        ),
+        # 평균은 소수 첫째 자리로, 부분 시간 예약은 시간 단위 소수로
+        overview_row(3, rating_sum=11, review_count=3, star_1=1, star_4=1, star_5=1, booked_hours=Decimal("1.5")),
+    ]
+
+    result = asyncio.run(facility_service.overview(CountingSession(rows), 1, day))
+
+    assert result.model_dump() == {
+        "facility_id": 1,
+        "facility_name": "중앙도서관",
+        "facility_address": "서울",
+        "facility_desc": "열람실",
+        "use_tf": True,
+        "date": day,
+        "rooms": [
+            {
+                "room_id": 1,
+                "room_name": "room-1",
+                "room_floor": "1층",
+                "room_image": None,
+                "room_capacity": 4,
+                "room_equipment": None,
+                "use_tf": True,
+                "average_rating": 4.5,
+                "review_count": 2,
+                "rating_histogram": [0, 0, 0, 1, 1],
+                "booked_hours": 3.0,
+                "booked_ratio": 0.125,
+            },
+            {
+                "room_id": 2,
+                "room_name": "B-202",
+                "room_floor": "2층",
+                "room_image": "abc.png",
+                "room_capacity": 8,
+                "room_equipment": "모니터",
+                "use_tf": False,
+                "average_rating": 0.0,
+                "review_count": 0,
+                "rating_histogram": [0, 0, 0, 0, 0],
+                "booked_hours": 0.0,
+                "booked_ratio": 0.0,
+            },
+            {
+                "room_id": 3,
+                "room_name": "room-3",
+                "room_floor": "1층",
+                "room_image": None,
+                "room_capacity": 4,
+                "room_equipment": None,
+                "use_tf": True,
+                "average_rating": 3.7,
+                "review_count": 3,
+                "rating_histogram": [1, 0, 0, 1, 1],
+                "booked_hours": 1.5,
+                "booked_ratio": 0.0625,
+            },
+        ],
+    }
+
+
+def test_overview_facility_without_rooms():
+    row = overview_row(
+        None,
+        facility_use_tf=False,
+        room_name=None,
+        room_floor=None,
+        room_capacity=None,
+        use_tf=None,
+        rating_sum=None,
+        review_count=None,
+        booked_hours=None,
+    )
+    db = CountingSession([row])
+
+    result = asyncio.run(facility_service.overview(db, 1, date.today()))
+
+    assert db.executes == 1
+    assert result.rooms == []
+    assert (result.facility_id, result.facility_name, result.use_tf) == (1, "중앙도서관", False)
+
+
+def test_overview_endpoint_serializes_rows(client, monkeypatch):
+    async def fake_find_overview(db, facility_id, target_date):
+        return [overview_row(7, facility_id=facility_id)]
+
+    monkeypatch.setattr(facility_repository, "find_overview", fake_find_overview)
+
+    resp = client.get("/api/facilities/5/overview")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["facility_id"] == 5
+    assert body["date"] == date.today().isoformat()
+    assert [(r["room_id"], r["average_rating"], r["rating_histogram"], r["booked_ratio"]) for r in body["rooms"]] == [
+        (7, 4.5, [0, 0, 0, 1, 1], 0.125)
+    ]
+
+
+def test_overview_missing_facility_is_404(client, monkeypatch):
+    async def fake_find_overview(db, facility_id, target_date):
+        return []
+
+    monkeypatch.setattr(facility_repository, "find_overview", fake_find_overview)
+
+    resp = client.get("/api/facilities/999/overview")
+
+    assert resp.status_code == 404
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from starlette.requests import Request
+
+from http_cache import cache_headers, is_not_modified, make_etag
+
+UPDATED = datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def make_request(**headers: str) -> Request:
+    raw = [(k.replace("_", "-").lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(value, usegmt=True)
+
+
+def test_make_etag_is_quoted_and_deterministic():
+    etag = make_etag("facilities", 3, UPDATED)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("facilities", 3, UPDATED)
+
+
+def test_make_etag_changes_with_any_part():
+    base = make_etag("facilities", 3, UPDATED)
+    assert make_etag("facilities", 4, UPDATED) != base
+    assert make_etag("facilities", 3, UPDATED + timedelta(seconds=1)) != base
+    assert make_etag("study_rooms", 3, UPDATED) != base
+
+
+def test_make_etag_distinguishes_none_from_missing_part():
+    assert make_etag("study_rooms", None, 1) != make_etag("study_rooms", 1)
+
+
+def test_cache_headers():
+    headers = cache_headers('"abc"', UPDATED)
+    assert headers["ETag"] == '"abc"'
+    assert headers["Last-Modified"] == "Sun, 01 Mar 2026 09:30:15 GMT"
+    assert "must-revalidate" in headers["Cache-Control"]
+
+    headers = cache_headers('"abc"', None, max_age=0)
+    assert "Last-Modified" not in headers
+    assert "max-age=0" in headers["Cache-Control"]
+
+
+def test_if_none_match_exact_list_weak_and_star():
+    etag = make_etag("x")
+    assert is_not_modified(make_request(if_none_match=etag), etag, None)
+    assert is_not_modified(make_request(if_none_match=f'"other", {etag}'), etag, None)
+    assert is_not_modified(make_request(if_none_match=f"W/{etag}"), etag, None)
+    assert is_not_modified(make_request(if_none_match="*"), etag, None)
+    assert not is_not_modified(make_request(if_none_match='"other"'), etag, None)
+    assert not is_not_modified(make_request(), etag, None)
+
+
+def test_if_modified_since():
+    etag = make_etag("x")
+    # HTTP 날짜는 초 단위라 마이크로초는 무시된다
+    assert is_not_modified(make_request(if_modified_since=http_date(UPDATED)), etag, UPDATED)
+    assert is_not_modified(make_request(if_modified_since=http_date(UPDATED + timedelta(hours=1))), etag, UPDATED)
+    assert not is_not_modified(make_request(if_modified_since=http_date(UPDATED - timedelta(seconds=1))), etag, UPDATED)
+    assert not is_not_modified(make_request(if_modified_since="not a date"), etag, UPDATED)
+    # Last-Modified 를 모르면 If-Modified-Since 로는 304 를 주지 않는다
+    assert not is_not_modified(make_request(if_modified_since=http_date(UPDATED)), etag, None)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    request = make_request(if_none_match='"stale"', if_modified_since=http_date(UPDATED))
+    assert not is_not_modified(request, make_etag("x"), UPDATED)
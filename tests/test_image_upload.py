@@ -0,0 +1,74 @@
+import asyncio
+import io
+import threading
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from configs.config import settings
+from services import image_service as image_service_module
+from services.image_service import ORIGINAL, ImageService
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = ImageService(str(tmp_path), workers=1)
+    for d in (ORIGINAL, "tmp"):
+        (tmp_path / d).mkdir()
+    return svc
+
+
+def upload(data: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename="room.png")
+
+
+def save(service: ImageService, data: bytes) -> str:
+    return asyncio.run(service.save_original(upload(data)))
+
+
+def test_same_content_saved_twice_is_one_file(service, tmp_path):
+    first = save(service, PNG)
+    second = save(service, PNG)
+
+    assert first == second
+    assert first.endswith(".png")
+    assert [p.name for p in (tmp_path / ORIGINAL).iterdir()] == [first]
+    assert (tmp_path / ORIGINAL / first).read_bytes() == PNG
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_too_large_is_413_and_leaves_no_temp_file(service, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_MAX_BYTES", 100)
+
+    with pytest.raises(HTTPException) as exc:
+        save(service, PNG)
+
+    assert exc.value.status_code == 413
+    assert list((tmp_path / "tmp").iterdir()) == []
+    assert list((tmp_path / ORIGINAL).iterdir()) == []
+
+
+def test_unknown_format_is_415(service, tmp_path):
+    with pytest.raises(HTTPException) as exc:
+        save(service, b"GIF89a" + b"\x00" * 50)
+
+    assert exc.value.status_code == 415
+    assert list((tmp_path / "tmp").iterdir()) == []
+    assert list((tmp_path / ORIGINAL).iterdir()) == []
+
+
+def test_file_io_runs_off_the_event_loop(service, monkeypatch):
+    loop_thread = threading.get_ident()
+    io_threads = []
+    real_replace = image_service_module.os.replace
+
+    def recording_replace(src, dst):
+        io_threads.append(threading.get_ident())
+        real_replace(src, dst)
+
+    monkeypatch.setattr(image_service_module.os, "replace", recording_replace)
+    save(service, PNG)
+
+    assert io_threads and loop_thread not in io_threads
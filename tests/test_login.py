@@ -0,0 +1,78 @@
+import asyncio
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+
+from models.student import Student
+from repositories.student_repository import student_repository
+from schemas.student import StudentLogin
+from services.auth_service import auth_service
+from services.login_throttle import login_throttle
+from services.password_hasher import hash_rounds, password_hasher
+
+PASSWORD = "pw-1234"
+
+
+class CommitSession:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def student(monkeypatch):
+    # 낮은 cost 로 저장된 해시, 설정 cost 는 그보다 하나 높게
+    entity = Student(
+        student_id=1,
+        student_no="login-test",
+        student_password=bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode(),
+        student_name="name",
+        student_department="dept",
+        student_phone="010",
+    )
+
+    async def find_by_student_no(db, student_no):
+        return entity if student_no == entity.student_no else None
+
+    monkeypatch.setattr(student_repository, "find_by_student_no", find_by_student_no)
+    monkeypatch.setattr(password_hasher, "rounds", 5)
+    monkeypatch.setattr(login_throttle, "_states", type(login_throttle._states)())
+    return entity
+
+
+def test_rehash_runs_inside_bcrypt_cap(student, monkeypatch):
+    verifying_during_hash = []
+    original_hash = password_hasher.hash
+
+    async def hash_and_record(password):
+        verifying_during_hash.append(login_throttle._verifying)
+        return await original_hash(password)
+
+    monkeypatch.setattr(password_hasher, "hash", hash_and_record)
+    db = CommitSession()
+
+    token = asyncio.run(auth_service.login(db, StudentLogin(student_no="login-test", student_password=PASSWORD)))
+
+    assert token
+    assert verifying_during_hash == [1]
+    assert hash_rounds(student.student_password) == 5
+    assert db.commits == 1
+    assert login_throttle._verifying == 0
+
+
+def test_no_rehash_when_cost_matches(student, monkeypatch):
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+    db = CommitSession()
+    asyncio.run(auth_service.login(db, StudentLogin(student_no="login-test", student_password=PASSWORD)))
+    assert db.commits == 0
+
+
+def test_wrong_password_does_not_rehash(student):
+    before = student.student_password
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.login(CommitSession(), StudentLogin(student_no="login-test", student_password="nope")))
+    assert exc.value.status_code == 401
+    assert student.student_password == before
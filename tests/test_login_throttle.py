@@ -0,0 +1,60 @@
+import pytest
+from fastapi import HTTPException
+
+from configs.config import settings
+from services.login_throttle import SERVER_BUSY, LoginThrottle
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_ENABLED", True)
+    monkeypatch.setattr(settings, "LOGIN_BURST", 3)
+    monkeypatch.setattr(settings, "LOGIN_IP_BURST", 100)
+    monkeypatch.setattr(settings, "LOGIN_BACKOFF_AFTER", 2)
+    monkeypatch.setattr(settings, "LOGIN_MAX_CONCURRENT_VERIFY", 1)
+    return LoginThrottle()
+
+
+def test_burst_then_429_with_retry_after(throttle):
+    keys = throttle.keys("s1", "10.0.0.1")
+    for _ in range(3):
+        throttle.check(keys)
+    with pytest.raises(HTTPException) as exc:
+        throttle.check(keys)
+    assert exc.value.status_code == 429
+    assert int(exc.value.headers["Retry-After"]) >= 1
+    assert throttle.rate_limited == 1
+
+
+def test_backoff_after_repeated_failures(throttle):
+    keys = throttle.keys("s2", None)
+    for _ in range(2):
+        throttle.check(keys)
+        throttle.record_failure(keys)
+    with pytest.raises(HTTPException):
+        throttle.check(keys)
+    assert throttle.backoff_rejected == 1
+
+    throttle.record_success(keys)
+    throttle.check(keys)
+
+
+def test_concurrent_verification_is_shed(throttle):
+    with throttle.verification():
+        with pytest.raises(HTTPException) as exc:
+            with throttle.verification():
+                pass
+    assert exc.value.detail == SERVER_BUSY
+    assert throttle._verifying == 0
+
+
+def test_disabled_lets_everything_through(throttle, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_THROTTLE_ENABLED", False)
+    keys = throttle.keys("s3", "10.0.0.1")
+    for _ in range(10):
+        throttle.check(keys)
+        throttle.record_failure(keys)
+    with throttle.verification():
+        with throttle.verification():
+            pass
+    assert throttle.snapshot()["enabled"] is False
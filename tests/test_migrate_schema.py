@@ -0,0 +1,55 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from configs.schema import REQUIRED_CONSTRAINTS
+from scripts.migrate_schema import cancel_overlapping_reservations
+
+
+class FakeConnection:
+    """첫 execute(겹침 후보 조회)에 rows 를 돌려주고, 이후 문장은 기록만 한다."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if len(self.statements) == 1:
+            return SimpleNamespace(all=lambda: self.rows)
+        return None
+
+
+def row(reservation_id, room_id, student_id, start_hour, end_hour):
+    return SimpleNamespace(
+        reservation_id=reservation_id,
+        room_id=room_id,
+        student_id=student_id,
+        reservation_start_date=datetime(2026, 3, 2, start_hour),
+        reservation_end_date=datetime(2026, 3, 2, end_hour),
+    )
+
+
+def test_keeps_earliest_and_only_cancels_what_still_overlaps():
+    # 1(9~11) 과 2(10~12) 는 겹침, 2 를 취소하면 3(11~13) 은 1 과 겹치지 않으므로 남는다
+    conn = FakeConnection([row(1, 1, 10, 9, 11), row(2, 1, 11, 10, 12), row(3, 1, 12, 11, 13)])
+
+    assert asyncio.run(cancel_overlapping_reservations(conn)) == [2]
+    assert len(conn.statements) == 2
+
+
+def test_same_student_in_other_room_is_cancelled():
+    conn = FakeConnection([row(1, 1, 10, 9, 10), row(2, 2, 10, 9, 10)])
+
+    assert asyncio.run(cancel_overlapping_reservations(conn)) == [2]
+
+
+def test_nothing_to_cancel_issues_no_update():
+    conn = FakeConnection([])
+
+    assert asyncio.run(cancel_overlapping_reservations(conn)) == []
+    assert len(conn.statements) == 1
+
+
+def test_review_unique_constraint_is_required_at_startup():
+    assert ("review", "uq_review_room_student") in REQUIRED_CONSTRAINTS
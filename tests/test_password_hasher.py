@@ -0,0 +1,73 @@
+import asyncio
+
+import bcrypt
+import pytest
+
+from services import password_hasher as password_hasher_module
+from services.password_hasher import MIN_ROUNDS, PasswordHasher, calibrate, hash_rounds
+
+
+@pytest.fixture
+def fake_timings(monkeypatch):
+    """cost r 해시 시간 = 2^(r-4) ms (cost 가 1 오르면 두 배). 잰 cost 를 기록한다."""
+    measured = []
+
+    def measure_rounds(rounds, samples=3):
+        measured.append(rounds)
+        return 2 ** (rounds - 4) / 1000
+
+    monkeypatch.setattr(password_hasher_module, "measure_rounds", measure_rounds)
+    return measured
+
+
+def test_calibrate_picks_largest_cost_within_target(fake_timings):
+    result = calibrate(target_ms=100)
+
+    # 2^6=64ms(cost 10) <= 100 < 2^7=128ms(cost 11)
+    assert result["rounds"] == 10
+    assert fake_timings == list(range(4, 12))  # 목표를 넘은 cost 11 에서 멈춤
+    assert result["measured_ms"][11] == 128.0
+
+
+def test_calibrate_exact_target_is_allowed(fake_timings):
+    assert calibrate(target_ms=64)["rounds"] == 10
+
+
+def test_calibrate_never_goes_below_min_rounds(fake_timings):
+    result = calibrate(target_ms=1, min_rounds=10)
+    assert result["rounds"] == 10
+    assert fake_timings == [10]
+
+
+def test_calibrate_stops_at_max_rounds(fake_timings):
+    result = calibrate(target_ms=10_000, min_rounds=MIN_ROUNDS, max_rounds=12)
+    assert result["rounds"] == 12
+    assert fake_timings[-1] == 12
+
+
+def test_hash_rounds_parses_cost():
+    assert hash_rounds(bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode()) == 5
+    assert hash_rounds("$2b$12$" + "x" * 53) == 12
+    assert hash_rounds("plain-text") is None
+    assert hash_rounds("$argon2id$v=19$m=65536") is None
+
+
+def test_rehash_only_when_cost_differs():
+    hasher = PasswordHasher(concurrency=1, rounds=5)
+    low = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=4)).decode()
+    same = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=5)).decode()
+    high = bcrypt.hashpw(b"pw", bcrypt.gensalt(rounds=6)).decode()
+
+    async def scenario():
+        return [await hasher.rehash_if_needed("pw", h) for h in (low, same, high)]
+
+    try:
+        upgraded, unchanged, downgraded = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert unchanged is None
+    for new_hash in (upgraded, downgraded):
+        assert hash_rounds(new_hash) == 5
+        assert bcrypt.checkpw(b"pw", new_hash.encode())
+    assert hasher.snapshot()["rehashed"] == 2
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from repositories.reservation_repository import reservation_repository
+from schemas.reservation import ReservationBatchCreate, ReservationCreate
+from services.reservation_service import reservation_service
+from services.slot_admission import SlotAdmission, slot_admission
+
+DAY = date.today() + timedelta(days=1)
+
+
+def item(room_id: int, hour: int) -> ReservationCreate:
+    start_at = datetime.combine(DAY, time(hour))
+    return ReservationCreate(
+        facility_id=1,
+        room_id=room_id,
+        reservation_date=DAY,
+        reservation_start_date=start_at,
+        reservation_end_date=start_at + timedelta(hours=1),
+    )
+
+
+def admission_row(idx: int, **overrides):
+    row = dict(idx=idx, room_facility_id=1, facility_exists=True, used_count=0, user_overlap=False, room_overlap=False, blocked=False)
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def fresh_slots(monkeypatch):
+    monkeypatch.setattr(slot_admission, "_slots", {})
+
+
+def test_batch_passes_overlap_flags_explicitly(monkeypatch):
+    async def find_batch_admission(db, student_id, items):
+        return [admission_row(0), admission_row(1, room_overlap=True)]
+
+    monkeypatch.setattr(reservation_repository, "find_batch_admission", find_batch_admission)
+    db = RecordingSession()
+    res = asyncio.run(reservation_service.create_batch(db, ReservationBatchCreate(items=[item(1, 9), item(2, 11)]), 7))
+
+    assert res.ok is False
+    assert [r.status_code for r in res.items] == [424, 409]
+    assert db.commits == 0
+
+
+def test_batch_unexpected_error_rolls_back_with_500(monkeypatch):
+    async def find_batch_admission(db, student_id, items):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(reservation_repository, "find_batch_admission", find_batch_admission)
+    db = RecordingSession()
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(reservation_service.create_batch(db, ReservationBatchCreate(items=[item(1, 9)]), 7))
+    assert exc.value.status_code == 500
+    assert db.rollbacks == 1
+
+
+def test_batch_goes_through_slot_admission(monkeypatch):
+    # 이 프로세스에서 이미 잡힌 시간대면 DB 조회 없이 409
+    async def find_batch_admission(db, student_id, items):
+        raise AssertionError("should not reach the DB")
+
+    monkeypatch.setattr(reservation_repository, "find_batch_admission", find_batch_admission)
+
+    async def run():
+        async with slot_admission.admit(1, DAY, *_hours(9)):
+            slot_admission.claim(1, DAY, *_hours(9))
+        return await reservation_service.create_batch(RecordingSession(), ReservationBatchCreate(items=[item(2, 13), item(1, 9)]), 7)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(run())
+    assert exc.value.status_code == 409
+
+
+def test_batch_success_claims_slots(monkeypatch):
+    async def find_batch_admission(db, student_id, items):
+        return [admission_row(i) for i, *_ in items]
+
+    async def insert_many(db, rows):
+        return list(range(100, 100 + len(rows)))
+
+    monkeypatch.setattr(reservation_repository, "find_batch_admission", find_batch_admission)
+    monkeypatch.setattr(reservation_repository, "insert_many", insert_many)
+    db = RecordingSession()
+    res = asyncio.run(reservation_service.create_batch(db, ReservationBatchCreate(items=[item(1, 9), item(1, 11)]), 7))
+
+    assert res.ok is True
+    assert [r.reservation_id for r in res.items] == [100, 101]
+    assert db.commits == 1
+    assert slot_admission._slots[(1, DAY)].claimed == (1 << 9) | (1 << 11)
+
+
+def test_admit_many_orders_keys_so_crossing_batches_do_not_deadlock():
+    admission = SlotAdmission(queue_depth=8, timeout_seconds=1.0, claim_ttl_seconds=30)
+    a = [(1, DAY, *_hours(9)), (2, DAY, *_hours(9))]
+    b = [(2, DAY, *_hours(10)), (1, DAY, *_hours(10))]
+
+    async def hold(slots):
+        async with admission.admit_many(slots):
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.wait_for(asyncio.gather(hold(a), hold(b)), timeout=2)
+
+    asyncio.run(run())
+
+
+def _hours(hour: int) -> tuple[datetime, datetime]:
+    start_at = datetime.combine(DAY, time(hour))
+    return start_at, start_at + timedelta(hours=1)
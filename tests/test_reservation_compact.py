@@ -0,0 +1,109 @@
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from dependencies import get_current_user
+from main import app
+from repositories.reservation_repository import reservation_repository
+from services.principal_cache import Principal
+
+DAY = date.today() + timedelta(days=1)
+COMPACT_FIELDS = {
+    "reservation_id",
+    "student_id",
+    "student_name",
+    "room_id",
+    "room_name",
+    "facility_id",
+    "facility_name",
+    "reservation_status",
+    "reservation_date",
+    "reservation_start_date",
+    "reservation_end_date",
+    "reservation_count",
+}
+
+
+def compact_row(reservation_id: int):
+    start_at = datetime.combine(DAY, time(9))
+    return SimpleNamespace(
+        reservation_id=reservation_id,
+        student_id=7,
+        student_name="홍길동",
+        room_id=3,
+        room_name="A-101",
+        facility_id=1,
+        facility_name="중앙도서관",
+        reservation_status="예약완료",
+        reservation_date=DAY,
+        reservation_start_date=start_at,
+        reservation_end_date=start_at + timedelta(hours=1),
+        reservation_count=1,
+    )
+
+
+@pytest.fixture
+def user_client(client):
+    async def current_user():
+        return Principal(student_id=7, student_no="2024007", student_name="홍길동", student_department="컴퓨터공학과")
+
+    app.dependency_overrides[get_current_user] = current_user
+    yield client
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_compact_list_returns_only_ids_and_names(user_client, monkeypatch):
+    compact_flags = []
+
+    async def find_page_by_student_id(db, student_id, status_filter, now, cursor, limit, compact=False):
+        compact_flags.append(compact)
+        return [compact_row(2), compact_row(1)]
+
+    monkeypatch.setattr(reservation_repository, "find_page_by_student_id", find_page_by_student_id)
+
+    resp = user_client.get("/api/reservations/me", params={"view": "compact"})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert compact_flags == [True]
+    assert [set(item) for item in body["items"]] == [COMPACT_FIELDS, COMPACT_FIELDS]
+    assert body["items"][0]["room_name"] == "A-101"
+    assert body["items"][0]["facility_name"] == "중앙도서관"
+    assert body["next_cursor"] is None
+
+
+def test_compact_detail_returns_only_ids_and_names(user_client, monkeypatch):
+    async def find_compact_by_id(db, reservation_id):
+        return compact_row(reservation_id)
+
+    async def find_by_id_with_items(db, reservation_id):
+        raise AssertionError("compact view must not load the full entity")
+
+    monkeypatch.setattr(reservation_repository, "find_compact_by_id", find_compact_by_id)
+    monkeypatch.setattr(reservation_repository, "find_by_id_with_items", find_by_id_with_items)
+
+    resp = user_client.get("/api/reservations/5", params={"view": "compact"})
+
+    assert resp.status_code == 200
+    assert set(resp.json()) == COMPACT_FIELDS
+    assert resp.json()["reservation_id"] == 5
+
+
+def test_compact_detail_missing_is_404(user_client, monkeypatch):
+    async def find_compact_by_id(db, reservation_id):
+        return None
+
+    monkeypatch.setattr(reservation_repository, "find_compact_by_id", find_compact_by_id)
+
+    assert user_client.get("/api/reservations/5", params={"view": "compact"}).status_code == 404
+
+
+def test_compact_query_selects_only_compact_columns():
+    stmt = reservation_repository._compact_select()
+
+    assert {c.name for c in stmt.selected_columns} == COMPACT_FIELDS
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    # 이름 컬럼은 join 으로 한 문장에서 (관계 로딩 없음)
+    assert sql.count("JOIN") == 3
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import uuid
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from repositories.reservation_repository import reservation_repository
+from schemas.reservation import ReservationCreate
+from services.reservation_service import reservation_service
+from services.slot_admission import slot_admission
+
+DAY = date.today() + timedelta(days=1)
+START = datetime.combine(DAY, time(9))
+
+
+def payload() -> ReservationCreate:
+    return ReservationCreate(
+        facility_id=1,
+        room_id=1,
+        reservation_date=DAY,
+        reservation_start_date=START,
+        reservation_end_date=START + timedelta(hours=1),
+    )
+
+
+class RecordingSession:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def fresh_slots(monkeypatch):
+    monkeypatch.setattr(slot_admission, "_slots", {})
+
+
+def test_concurrent_bookings_of_same_slot_insert_once(monkeypatch):
+    inserted = []
+
+    async def create_if_admitted(db, **kwargs):
+        await asyncio.sleep(0.01)  # 다른 요청이 끼어들 틈
+        inserted.append(kwargs["student_id"])
+        return SimpleNamespace(
+            reservation_id=len(inserted), room_facility_id=1, facility_exists=True, used_count=0, blocked=False
+        )
+
+    monkeypatch.setattr(reservation_repository, "create_if_admitted", create_if_admitted)
+
+    async def book(student_id: int):
+        try:
+            return await reservation_service.create(RecordingSession(), payload(), student_id)
+        except HTTPException as e:
+            return e.status_code
+
+    async def run():
+        return await asyncio.gather(book(1), book(2))
+
+    results = asyncio.run(run())
+
+    assert len(inserted) == 1
+    assert sorted(r if isinstance(r, int) else 201 for r in results) == [201, 409]
+
+
+# 실제 Postgres 의 EXCLUDE 제약 확인 (TEST_DATABASE_URL 이 가리키는 버려도 되는 DB 에서만)
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL 미설정")
+def test_exclude_constraint_keeps_one_row_under_concurrent_inserts():
+    from sqlalchemy import func, select, text
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    import models  # noqa: F401
+    from configs.db import Base
+    from configs.schema import verify_schema
+    from models.facility import Facility
+    from models.reservation import Reservation
+    from models.student import Student
+    from models.study_room import StudyRoom
+
+    run_id = uuid.uuid4().hex[:8]
+
+    async def run():
+        engine = create_async_engine(TEST_DATABASE_URL)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+            await conn.run_sync(Base.metadata.create_all)
+            await verify_schema(conn)
+
+        async with sessions() as db:
+            facility = Facility(facility_name="race", facility_address="race", facility_desc="race")
+            db.add(facility)
+            await db.flush()
+            room = StudyRoom(facility_id=facility.facility_id, room_name=f"race-{run_id}", room_floor="1층", room_capacity=4)
+            students = [
+                Student(
+                    student_no=f"race-{run_id}-{i}",
+                    student_password="x",
+                    student_name="race",
+                    student_department="race",
+                    student_phone="010",
+                )
+                for i in range(2)
+            ]
+            db.add_all([room, *students])
+            await db.commit()
+
+        async def insert(student_id: int) -> str:
+            async with sessions() as db:
+                try:
+                    await reservation_repository.create_if_admitted(
+                        db,
+                        student_id=student_id,
+                        room_id=room.room_id,
+                        facility_id=facility.facility_id,
+                        reservation_date=DAY,
+                        start_dt=START,
+                        end_dt=START + timedelta(hours=1),
+                        reservation_count=1,
+                        use_tf=True,
+                    )
+                    await db.commit()
+                    return "created"
+                except IntegrityError:
+                    await db.rollback()
+                    return "conflict"
+
+        outcomes = await asyncio.gather(*(insert(s.student_id) for s in students))
+        async with sessions() as db:
+            rows = await db.scalar(
+                select(func.count())
+                .select_from(Reservation)
+                .where(Reservation.room_id == room.room_id)
+                .where(Reservation.reservation_status == "예약완료")
+            )
+        await engine.dispose()
+        return sorted(outcomes), rows
+
+    outcomes, rows = asyncio.run(run())
+
+    assert outcomes == ["conflict", "created"]
+    assert rows == 1
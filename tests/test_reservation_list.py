@@ -0,0 +1,141 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from repositories.reservation_repository import reservation_repository
+from services.reservation_service import reservation_service
+
+DAY = date(2026, 3, 2)
+
+
+def reservation(reservation_id: int, day_offset: int, hour: int):
+    day = DAY + timedelta(days=day_offset)
+    start_at = datetime.combine(day, time(hour))
+    return SimpleNamespace(
+        reservation_id=reservation_id,
+        student_id=7,
+        room_id=1,
+        facility_id=1,
+        reservation_status="예약완료",
+        reservation_date=day,
+        reservation_start_date=start_at,
+        reservation_end_date=start_at + timedelta(hours=1),
+        reservation_count=1,
+        use_tf=True,
+    )
+
+
+def sort_key(row):
+    return row.reservation_date, row.reservation_start_date, row.reservation_id
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    """find_page_by_student_id 를 같은 keyset 규칙의 메모리 구현으로 바꾼다."""
+    data = [
+        reservation(1, 0, 9),
+        reservation(2, 0, 9),  # 같은 날/시각, id 로만 구분
+        reservation(3, 0, 13),
+        reservation(4, 1, 9),
+        reservation(5, 2, 10),
+        reservation(6, 2, 8),
+        reservation(7, 3, 9),
+    ]
+    calls = []
+
+    async def find_page_by_student_id(db, student_id, status_filter, now, cursor, limit, compact=False):
+        calls.append((cursor, limit))
+        ordered = sorted(data, key=sort_key, reverse=True)
+        if cursor is not None:
+            ordered = [r for r in ordered if sort_key(r) < cursor]
+        return ordered[: limit + 1]
+
+    monkeypatch.setattr(reservation_repository, "find_page_by_student_id", find_page_by_student_id)
+    return data, calls
+
+
+def list_page(cursor=None, limit=3):
+    return asyncio.run(reservation_service.list_by_student(None, 7, cursor=cursor, limit=limit))
+
+
+def test_cursor_walks_every_row_once_in_order(rows):
+    data, _ = rows
+    seen = []
+    cursor = None
+    while True:
+        page = list_page(cursor)
+        seen.extend(item.reservation_id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [r.reservation_id for r in sorted(data, key=sort_key, reverse=True)]
+    assert seen == [7, 5, 6, 4, 3, 2, 1]
+
+
+def test_cursor_round_trip_keeps_the_tie_breaker(rows):
+    _, calls = rows
+    first = list_page(limit=5)
+    assert [i.reservation_id for i in first.items] == [7, 5, 6, 4, 3]
+
+    list_page(first.next_cursor, limit=5)
+    last = reservation(3, 0, 13)
+    assert calls[-1] == ((last.reservation_date, last.reservation_start_date, 3), 5)
+    assert reservation_service._decode_cursor(first.next_cursor) == sort_key(last)
+
+
+def test_exact_page_has_no_next_cursor(rows):
+    page = list_page(limit=7)
+    assert len(page.items) == 7
+    assert page.next_cursor is None
+
+    page = list_page(limit=6)
+    assert len(page.items) == 6
+    assert page.next_cursor is not None
+
+
+def test_invalid_cursor_is_400(rows):
+    with pytest.raises(HTTPException) as exc:
+        list_page("not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+class CaptureSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: [], scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+def compiled(stmt) -> tuple[str, dict]:
+    c = stmt.compile(dialect=postgresql.dialect())
+    return str(c), c.params
+
+
+def test_repository_page_uses_row_value_comparison_and_limit_plus_one():
+    db = CaptureSession()
+    cursor = (DAY, datetime.combine(DAY, time(9)), 2)
+    asyncio.run(reservation_repository.find_page_by_student_id(db, 7, "all", datetime.now(), cursor, 20))
+
+    sql, params = compiled(db.statements[0])
+    assert (
+        "(reservation.reservation_date, reservation.reservation_start_date, reservation.reservation_id) < "
+        in sql
+    )
+    assert "ORDER BY reservation.reservation_date DESC, reservation.reservation_start_date DESC, reservation.reservation_id DESC" in sql
+    assert 21 in params.values()
+    assert DAY in params.values() and 2 in params.values()
+
+
+def test_repository_first_page_has_no_cursor_condition():
+    db = CaptureSession()
+    asyncio.run(reservation_repository.find_page_by_student_id(db, 7, "all", datetime.now(), None, 20))
+
+    sql, _ = compiled(db.statements[0])
+    assert ") < " not in sql
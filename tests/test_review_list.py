@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from repositories.review_repository import review_repository
+from repositories.study_room_rating_repository import study_room_rating_repository
+from services.review_service import review_service
+
+# (review_id, rating)
+REVIEWS = [(1, 5), (2, 3), (3, 5), (4, 4), (5, 3), (6, 5), (7, 1)]
+
+
+def review(review_id: int, rating: int):
+    return SimpleNamespace(review_id=review_id, room_id=1, student_id=review_id, rating=rating, comment=f"c{review_id}", reg_date=None)
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """find_page_by_room_id 를 같은 keyset 규칙의 메모리 구현으로 바꾼다."""
+    data = [review(*r) for r in REVIEWS]
+
+    async def find_page_by_room_id(db, room_id, sort, cursor, limit):
+        if sort == "rating":
+            ordered = sorted(data, key=lambda r: (r.rating, r.review_id), reverse=True)
+            if cursor is not None:
+                ordered = [r for r in ordered if (r.rating, r.review_id) < cursor]
+        else:
+            ordered = sorted(data, key=lambda r: r.review_id, reverse=True)
+            if cursor is not None:
+                ordered = [r for r in ordered if r.review_id < cursor[1]]
+        return ordered[: limit + 1]
+
+    async def find_by_room_id(db, room_id):
+        return SimpleNamespace(review_count=len(data))
+
+    monkeypatch.setattr(review_repository, "find_page_by_room_id", find_page_by_room_id)
+    monkeypatch.setattr(study_room_rating_repository, "find_by_room_id", find_by_room_id)
+
+
+def walk(sort: str, limit: int) -> list[list[int]]:
+    result = []
+    cursor = None
+    while True:
+        page = asyncio.run(review_service.list_by_room(None, 1, sort=sort, cursor=cursor, limit=limit))
+        assert page.total_count == len(REVIEWS)
+        result.append([item.review_id for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            return result
+
+
+def test_newest_pages_follow_review_id(pages):
+    assert walk("newest", 3) == [[7, 6, 5], [4, 3, 2], [1]]
+
+
+def test_rating_pages_break_ties_by_review_id(pages):
+    # 별점 5 가 페이지 경계에 걸쳐도 빠지거나 겹치지 않는다
+    assert walk("rating", 2) == [[6, 3], [1, 4], [5, 2], [7]]
+
+
+def test_rating_cursor_carries_rating_and_id(pages):
+    page = asyncio.run(review_service.list_by_room(None, 1, sort="rating", limit=2))
+    assert review_service._decode_cursor(page.next_cursor) == (5, 3)
+
+
+class CaptureSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+def compiled_sql(sort: str, cursor) -> tuple[str, dict]:
+    db = CaptureSession()
+    asyncio.run(review_repository.find_page_by_room_id(db, 1, sort, cursor, 10))
+    c = db.statements[0].compile(dialect=postgresql.dialect())
+    return str(c), c.params
+
+
+def test_rating_sql_uses_row_value_keyset():
+    sql, params = compiled_sql("rating", (4, 9))
+    assert "(review.rating, review.review_id) < " in sql
+    assert "ORDER BY review.rating DESC, review.review_id DESC" in sql
+    assert 11 in params.values()
+
+
+def test_newest_sql_uses_review_id_keyset():
+    sql, _ = compiled_sql("newest", (9, 9))
+    assert "review.review_id < " in sql
+    assert "ORDER BY review.review_id DESC" in sql
@@ -0,0 +1,41 @@
+import pytest
+
+from dependencies import get_current_user
+from main import app
+from services.principal_cache import Principal
+from services.review_service import review_service
+
+
+@pytest.fixture
+def updates(client, monkeypatch):
+    """review_service.update 에 넘어간 인자를 기록"""
+    calls = []
+
+    async def update(db, review_id, rating, comment, student_id):
+        calls.append({"rating": rating, "comment": comment})
+        return {"ok": True, "message": "리뷰가 수정되었습니다."}
+
+    monkeypatch.setattr(review_service, "update", update)
+    app.dependency_overrides[get_current_user] = lambda: Principal(1, "s1", "name", "dept")
+    yield calls
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.mark.parametrize("rating", [4.5, 0, 6, "abc"])
+def test_invalid_rating_is_422(client, updates, rating):
+    res = client.patch("/api/reviews/1", json={"rating": rating})
+    assert res.status_code == 422
+    assert updates == []
+
+
+def test_integral_float_rating_is_coerced_to_int(client, updates):
+    res = client.patch("/api/reviews/1", json={"rating": 3.0})
+    assert res.status_code == 200
+    assert updates == [{"rating": 3, "comment": None}]
+    assert type(updates[0]["rating"]) is int
+
+
+def test_comment_only_update(client, updates):
+    res = client.patch("/api/reviews/1", json={"comment": "좋아요"})
+    assert res.status_code == 200
+    assert updates == [{"rating": None, "comment": "좋아요"}]
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from configs.schema import REQUIRED_CONSTRAINTS, find_missing_constraints, verify_schema
+
+
+class FakeConnection:
+    """pg_constraint 조회 결과로 (테이블, 제약 이름) 목록을 돌려준다."""
+
+    def __init__(self, present):
+        self.present = present
+
+    async def execute(self, stmt, params):
+        present = [row for row in self.present if row[1] in params["names"]]
+        return type("Result", (), {"all": lambda _: present})()
+
+
+def test_all_constraints_present():
+    conn = FakeConnection(list(REQUIRED_CONSTRAINTS))
+
+    assert asyncio.run(find_missing_constraints(conn)) == []
+    asyncio.run(verify_schema(conn))
+
+
+def test_missing_constraint_refuses_to_start():
+    conn = FakeConnection(list(REQUIRED_CONSTRAINTS[1:]))
+    table, name = REQUIRED_CONSTRAINTS[0]
+
+    assert asyncio.run(find_missing_constraints(conn)) == [f"{table}.{name}"]
+    with pytest.raises(RuntimeError, match="scripts.migrate_schema"):
+        asyncio.run(verify_schema(conn))
+
+
+def test_constraint_on_other_table_does_not_count():
+    table, name = REQUIRED_CONSTRAINTS[0]
+    conn = FakeConnection([("some_other_table", name)] + list(REQUIRED_CONSTRAINTS[1:]))
+
+    assert asyncio.run(find_missing_constraints(conn)) == [f"{table}.{name}"]
@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from repositories.search_repository import search_repository
+from services.search_service import search_service
+
+# (kind, id, score) - 같은 점수가 종류/페이지 경계에 걸치도록
+HITS = [
+    ("room", 4, 0.9),
+    ("facility", 2, 0.7),
+    ("review", 11, 0.7),
+    ("room", 3, 0.7),
+    ("facility", 1, 0.7),
+    ("review", 10, 0.30000000000000004),
+    ("room", 5, 0.1),
+]
+
+
+def hit(kind: str, id_: int, score: float):
+    return SimpleNamespace(kind=kind, id=id_, facility_id=1, room_id=None if kind == "facility" else id_, title=f"{kind}-{id_}", snippet=None, score=score)
+
+
+def order_key(row):
+    # ORDER BY score DESC, kind, id
+    return -row.score, row.kind, row.id
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """search_repository.search 를 같은 keyset 규칙의 메모리 구현으로 바꾸고 호출 인자를 기록한다."""
+    data = [hit(*h) for h in HITS]
+    calls = []
+
+    async def search(db, q, kinds, cursor, limit):
+        calls.append({"kinds": kinds, "cursor": cursor, "limit": limit})
+        rows = sorted((r for r in data if r.kind in kinds), key=order_key)
+        if cursor is not None:
+            score, kind, id_ = cursor
+            rows = [r for r in rows if r.score < score or (r.score == score and (r.kind, r.id) > (kind, id_))]
+        return rows[: limit + 1]
+
+    monkeypatch.setattr(search_repository, "search", search)
+    return calls
+
+
+def walk(kind: str = "all", limit: int = 2) -> list[tuple[str, int]]:
+    seen = []
+    cursor = None
+    while True:
+        page = asyncio.run(search_service.search(None, "스터디", kind=kind, cursor=cursor, limit=limit))
+        seen.extend((item.kind, item.id) for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return seen
+
+
+def test_pages_follow_score_then_kind_then_id(searches):
+    assert walk(limit=2) == [
+        ("room", 4),
+        ("facility", 1),
+        ("facility", 2),
+        ("review", 11),
+        ("room", 3),
+        ("review", 10),
+        ("room", 5),
+    ]
+
+
+def test_cursor_keeps_the_exact_float_score(searches):
+    page = asyncio.run(search_service.search(None, "스터디", limit=5))
+
+    assert search_service._decode_cursor(page.next_cursor) == (0.7, "room", 3)
+    page = asyncio.run(search_service.search(None, "스터디", cursor=page.next_cursor, limit=1))
+    assert search_service._decode_cursor(page.next_cursor) == (0.30000000000000004, "review", 10)
+
+
+def test_kind_filter_limits_kinds(searches):
+    assert walk(kind="review") == [("review", 11), ("review", 10)]
+    assert searches[0]["kinds"] == ["review"]
+
+    searches.clear()
+    walk(kind="all", limit=50)
+    assert searches[0]["kinds"] == ["facility", "room", "review"]
+
+
+def test_blank_query_and_bad_cursor_are_400(searches):
+    for kwargs in ({"q": "   "}, {"q": "a", "cursor": "bad"}, {"q": "a", "cursor": search_service._encode_cursor(hit("student", 1, 1.0))}):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(search_service.search(None, **kwargs))
+        assert exc.value.status_code == 400
+    assert searches == []
+
+
+class CaptureSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: [])
+
+
+def compiled_sql(kinds: list[str], cursor=None) -> str:
+    db = CaptureSession()
+    asyncio.run(search_repository.search(db, "스터디", kinds, cursor, 20))
+    return str(db.statements[0].compile(dialect=postgresql.dialect()))
+
+
+def test_single_kind_sql_has_no_union():
+    sql = compiled_sql(["room"])
+    assert "UNION" not in sql
+    assert "study_room" in sql
+    assert "facility." not in sql and "review." not in sql
+
+
+def test_all_kinds_sql_unions_every_kind_and_orders_by_keyset():
+    sql = compiled_sql(["facility", "room", "review"], cursor=(0.5, "room", 3))
+    assert sql.count("UNION ALL") == 2
+    assert "hit.score < " in sql
+    assert "(hit.kind, hit.id) > " in sql
+    assert "ORDER BY hit.score DESC, hit.kind, hit.id" in sql
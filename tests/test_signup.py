@@ -0,0 +1,103 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from repositories.student_repository import student_repository
+from schemas.student import StudentCreate
+from services.auth_service import auth_service
+from services.password_hasher import password_hasher
+
+
+class TxSession:
+    """begin() 구간을 기록한다. fail_on_commit 이면 두 번째 트랜잭션 커밋에서 UNIQUE 위반을 낸다."""
+
+    def __init__(self, fail_on_commit: bool = False):
+        self.in_transaction = False
+        self.transactions = 0
+        self.fail_on_commit = fail_on_commit
+
+    @asynccontextmanager
+    async def begin(self):
+        self.in_transaction = True
+        self.transactions += 1
+        try:
+            yield
+            if self.fail_on_commit and self.transactions == 2:
+                raise IntegrityError("INSERT", {}, Exception("duplicate key value violates unique constraint"))
+        finally:
+            self.in_transaction = False
+
+
+def payload() -> StudentCreate:
+    return StudentCreate(
+        student_no="2026001",
+        student_password="pw-1234",
+        student_name="홍길동",
+        student_department="컴퓨터공학과",
+        student_phone="010-0000-0000",
+    )
+
+
+class Recorder:
+    def __init__(self):
+        self.db: TxSession | None = None
+        self.events: list[tuple[str, bool]] = []
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = Recorder()
+
+    async def find_by_student_no(db, student_no):
+        rec.events.append(("lookup", db.in_transaction))
+        return None
+
+    async def save(db, student):
+        rec.events.append(("save", db.in_transaction))
+        return student
+
+    async def hash_password(password):
+        rec.events.append(("hash", rec.db.in_transaction))
+        return "hashed-" + password
+
+    monkeypatch.setattr(student_repository, "find_by_student_no", find_by_student_no)
+    monkeypatch.setattr(student_repository, "save", save)
+    monkeypatch.setattr(password_hasher, "hash", hash_password)
+    return rec
+
+
+def test_signup_hashes_outside_any_transaction(recorder):
+    db = recorder.db = TxSession()
+
+    student = asyncio.run(auth_service.signup(db, payload()))
+
+    assert student.student_password == "hashed-pw-1234"
+    # 조회와 저장은 각각 짧은 트랜잭션, 해시는 그 사이 트랜잭션 밖에서
+    assert recorder.events == [("lookup", True), ("hash", False), ("save", True)]
+    assert db.transactions == 2
+
+
+def test_signup_duplicate_found_before_hashing(monkeypatch):
+    async def find_by_student_no(db, student_no):
+        return object()
+
+    async def hash_password(password):
+        raise AssertionError("should not hash a duplicate")
+
+    monkeypatch.setattr(student_repository, "find_by_student_no", find_by_student_no)
+    monkeypatch.setattr(password_hasher, "hash", hash_password)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.signup(TxSession(), payload()))
+    assert exc.value.status_code == 409
+
+
+def test_signup_race_on_student_no_is_409(recorder):
+    db = recorder.db = TxSession(fail_on_commit=True)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth_service.signup(db, payload()))
+    assert exc.value.status_code == 409
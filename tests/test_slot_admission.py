@@ -0,0 +1,149 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from services import slot_admission as slot_admission_module
+from services.slot_admission import SlotAdmission
+
+DAY = date.today() + timedelta(days=1)
+
+
+def at(hour: int) -> datetime:
+    return datetime.combine(DAY, datetime.min.time()) + timedelta(hours=hour)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    # asyncio 루프도 time.monotonic 을 쓰므로 모듈 속성만 바꾼다
+    monkeypatch.setattr(slot_admission_module, "clock", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def test_claim_ttl_has_its_own_setting():
+    from configs.config import settings
+    from services.slot_admission import slot_admission
+
+    assert slot_admission.claim_ttl_seconds == settings.SLOT_ADMISSION_CLAIM_TTL_SECONDS
+
+
+def test_claimed_slot_is_refused_then_released_after_ttl(clock):
+    admission = SlotAdmission(queue_depth=4, timeout_seconds=1, claim_ttl_seconds=30)
+
+    async def scenario():
+        async with admission.admit(1, DAY, at(9), at(10)):
+            admission.claim(1, DAY, at(9), at(10))
+
+        # 같은 시간대는 DB 전에 409, 다른 시간대는 통과
+        with pytest.raises(HTTPException) as exc:
+            async with admission.admit(1, DAY, at(9), at(11)):
+                pass
+        assert exc.value.status_code == 409
+        async with admission.admit(1, DAY, at(10), at(11)):
+            pass
+
+        clock.now += 29.9
+        with pytest.raises(HTTPException):
+            async with admission.admit(1, DAY, at(9), at(10)):
+                pass
+
+        clock.now += 0.1
+        async with admission.admit(1, DAY, at(9), at(10)):
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_release_clears_claim_immediately(clock):
+    admission = SlotAdmission(queue_depth=4, timeout_seconds=1, claim_ttl_seconds=30)
+
+    async def scenario():
+        async with admission.admit(1, DAY, at(9), at(10)):
+            admission.claim(1, DAY, at(9), at(10))
+        admission.release(1, DAY, at(9), at(10))
+        async with admission.admit(1, DAY, at(9), at(10)):
+            pass
+        assert admission._slots == {}
+
+    asyncio.run(scenario())
+
+
+def test_queue_too_deep_is_rejected():
+    admission = SlotAdmission(queue_depth=1, timeout_seconds=1, claim_ttl_seconds=30)
+    statuses = []
+
+    async def hold(entered: asyncio.Event, done: asyncio.Event):
+        async with admission.admit(1, DAY, at(9), at(10)):
+            entered.set()
+            await done.wait()
+
+    async def attempt():
+        try:
+            async with admission.admit(1, DAY, at(11), at(12)):
+                statuses.append(200)
+        except HTTPException as exc:
+            statuses.append(exc.status_code)
+
+    async def scenario():
+        entered, done = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(entered, done))
+        await entered.wait()
+        # 첫 대기자는 대기열에 들어가고, 두 번째는 대기열이 가득 차 바로 503
+        waiter = asyncio.create_task(attempt())
+        await asyncio.sleep(0)
+        await attempt()
+        done.set()
+        await asyncio.gather(holder, waiter)
+
+    asyncio.run(scenario())
+    assert statuses == [503, 200]
+
+
+def test_wait_timeout_is_rejected():
+    admission = SlotAdmission(queue_depth=4, timeout_seconds=0.01, claim_ttl_seconds=30)
+
+    async def scenario():
+        async with admission.admit(1, DAY, at(9), at(10)):
+            with pytest.raises(HTTPException) as exc:
+                async with admission.admit(1, DAY, at(11), at(12)):
+                    pass
+            assert exc.value.status_code == 503
+            assert admission._slots[(1, DAY)].waiting == 0
+
+    asyncio.run(scenario())
+
+
+def test_admit_many_merges_keys_and_checks_claims(clock):
+    admission = SlotAdmission(queue_depth=4, timeout_seconds=1, claim_ttl_seconds=30)
+
+    async def scenario():
+        slots = [(2, DAY, at(9), at(10)), (1, DAY, at(9), at(10)), (1, DAY, at(13), at(14))]
+        async with admission.admit_many(slots):
+            # 키마다 락 하나씩, 모두 잡은 상태
+            assert sorted(admission._slots) == [(1, DAY), (2, DAY)]
+            assert all(state.lock.locked() for state in admission._slots.values())
+            admission.claim(1, DAY, at(13), at(14))
+
+        # 잡힌 시간대가 하나라도 있으면 전체 409, 앞서 잡은 락은 풀린다
+        with pytest.raises(HTTPException) as exc:
+            async with admission.admit_many([(2, DAY, at(15), at(16)), (1, DAY, at(13), at(14))]):
+                pass
+        assert exc.value.status_code == 409
+        assert not any(state.lock.locked() for state in admission._slots.values())
+
+        clock.now += 30
+        async with admission.admit_many([(1, DAY, at(13), at(14))]):
+            pass
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from configs.config import settings
+from repositories.student_repository import student_repository
+from services.student_provisioning_service import StudentProvisioningService
+
+
+class RecordingSession:
+    """commit / begin_nested 순서를 기록한다."""
+
+    def __init__(self):
+        self.events: list[str] = []
+
+    async def commit(self):
+        self.events.append("commit")
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+def row(student_no: str) -> dict:
+    return {
+        "student_no": student_no,
+        "student_password": "pw-" + student_no,
+        "student_name": "홍길동",
+        "student_department": "컴퓨터공학과",
+        "student_phone": "010-0000-0000",
+    }
+
+
+def test_lookup_transaction_ends_before_hashing(monkeypatch):
+    db = RecordingSession()
+    service = StudentProvisioningService(workers=1)
+
+    async def fake_find_existing(session, student_nos):
+        db.events.append("lookup")
+        return {"2024001"}
+
+    async def fake_hash_all(passwords):
+        db.events.append("hash")
+        return ["hashed-" + p for p in passwords]
+
+    async def fake_insert(session, rows):
+        db.events.append("insert")
+        return len(rows)
+
+    monkeypatch.setattr(student_repository, "find_existing_student_nos", fake_find_existing)
+    monkeypatch.setattr(student_repository, "insert_many_skip_existing", fake_insert)
+    monkeypatch.setattr(service, "_hash_all", fake_hash_all)
+
+    batch = [(2, row("2024001")), (3, row("2024002")), (4, row("2024002"))]
+    created, skipped = asyncio.run(service._provision_batch(db, batch, []))
+
+    assert (created, skipped) == (1, 2)
+    # 조회 -> 커밋(트랜잭션 종료) -> 해시 -> INSERT -> 커밋
+    assert db.events == ["lookup", "commit", "hash", "insert", "commit"]
+
+
+def test_bulk_import_no_longer_accepts_students(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "test-admin-key")
+
+    resp = client.post(
+        "/api/admin/import/student",
+        headers={"X-Admin-Key": "test-admin-key"},
+        content=b"student_no,student_password\n2024001,pw\n",
+    )
+
+    assert resp.status_code == 422